@@ -10,11 +10,36 @@ Supports loading datasets from Hugging Face:
 - GSM8K
 """
 import os
+import hashlib
 import json
-from typing import Dict, Any, List, Optional
+import random
+from typing import Dict, Any, Iterable, List, Optional
 from datasets import load_dataset
 import re
 
+# On-disk cache for standardized, sampled problem lists. Warm launches skip
+# the Hugging Face load and per-item standardization entirely.
+SAMPLED_CACHE_DIR = "benchmark_evaluator/_sampled_problems_cache"
+
+
+def reservoir_sample(iterable: Iterable, k: int, seed: Optional[int] = None) -> List:
+    """
+    Sample k items uniformly from an iterable of unknown length (Algorithm R).
+
+    Holds at most k items at a time, so a streamed dataset can be sampled
+    without materializing it.
+    """
+    rng = random.Random(seed)
+    reservoir = []
+    for i, item in enumerate(iterable):
+        if i < k:
+            reservoir.append(item)
+        else:
+            j = rng.randint(0, i)
+            if j < k:
+                reservoir[j] = item
+    return reservoir
+
 
 class BenchmarkLoader:
     """Loader for benchmark datasets."""
@@ -88,8 +113,17 @@ class BenchmarkLoader:
         self.cache_dir = cache_dir or os.path.join(os.path.expanduser("~"), ".cache", "huggingface", "datasets")
         os.makedirs(self.cache_dir, exist_ok=True)
     
+    def _sampled_cache_path(self, benchmark_name: str, max_samples: Optional[int],
+                            random_sample: bool, sample_strategy: str) -> str:
+        """Cache file path for a (benchmark, sample size, sampling mode) tuple."""
+        key = hashlib.sha1(
+            f"{benchmark_name}-{max_samples}-{random_sample}-{sample_strategy}".encode("utf-8")
+        ).hexdigest()
+        return os.path.join(SAMPLED_CACHE_DIR, f"{key}.json")
+
     def load_benchmark(self, benchmark_name: str, max_samples: Optional[int] = None,
-                      random_sample: bool = True) -> List[Dict[str, Any]]:
+                      random_sample: bool = True, use_cache: bool = True,
+                      sample_strategy: str = "random") -> List[Dict[str, Any]]:
         """
         Load a benchmark dataset.
         
@@ -97,6 +131,12 @@ class BenchmarkLoader:
             benchmark_name: Name of benchmark (mmlu, arc_challenge, gpqa_diamond, bbh, math, gsm8k)
             max_samples: Maximum number of samples to load (None for all)
             random_sample: If True and max_samples is set, randomly sample problems instead of taking first N
+            use_cache: Reuse the standardized problem list cached by a
+                       previous launch with the same parameters
+            sample_strategy: "random" samples indices from the downloaded
+                             dataset; "reservoir" streams the split and
+                             reservoir-samples it without materializing the
+                             dataset locally
             
         Returns:
             List of problem dictionaries with standardized format
@@ -104,52 +144,93 @@ class BenchmarkLoader:
         if benchmark_name not in self.BENCHMARKS:
             raise ValueError(f"Unknown benchmark: {benchmark_name}. Available: {list(self.BENCHMARKS.keys())}")
         
+        if sample_strategy not in ("random", "reservoir"):
+            raise ValueError(f"Unknown sample strategy: {sample_strategy}")
+
         config = self.BENCHMARKS[benchmark_name]
+
+        cache_path = self._sampled_cache_path(benchmark_name, max_samples,
+                                              random_sample, sample_strategy)
+        if use_cache and os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    problems = json.load(f)
+                print(f"Loaded {len(problems)} cached problems for {benchmark_name} "
+                      f"from {cache_path}")
+                return problems
+            except (json.JSONDecodeError, OSError):
+                pass  # Corrupted cache entry - fall through to a fresh load
         
         try:
-            # Load dataset from Hugging Face
-            if config["subset"]:
-                dataset = load_dataset(
-                    config["hf_name"],
-                    config["subset"],
-                    split=config["split"],
-                    cache_dir=self.cache_dir
-                )
-            else:
-                dataset = load_dataset(
-                    config["hf_name"],
-                    split=config["split"],
-                    cache_dir=self.cache_dir
-                )
-            
-            # Convert to standardized format
-            problems = []
-            dataset_size = len(dataset)
-            
-            # Determine indices to use
-            if max_samples and max_samples < dataset_size:
-                if random_sample:
-                    # Randomly sample indices
-                    import random
-                    indices = random.sample(range(dataset_size), max_samples)
-                    indices.sort()  # Keep sorted for reproducibility
+            if sample_strategy == "reservoir" and max_samples and random_sample:
+                # Stream the split and reservoir-sample it: one item in
+                # memory at a time, no local dataset materialization.
+                stream_kwargs = {"split": config["split"], "streaming": True}
+                if config["subset"]:
+                    stream = load_dataset(config["hf_name"], config["subset"], **stream_kwargs)
                 else:
-                    # Take first N
-                    indices = list(range(max_samples))
+                    stream = load_dataset(config["hf_name"], **stream_kwargs)
+
+                sampled = reservoir_sample(enumerate(stream), max_samples)
+                sampled.sort(key=lambda pair: pair[0])  # Keep source order
+
+                problems = []
+                for idx, item in sampled:
+                    problem = self._standardize_problem(item, config, benchmark_name, idx)
+                    if problem:
+                        problems.append(problem)
+                print(f"Reservoir-sampled {len(problems)} problems from streamed split")
             else:
-                # Use all
-                indices = list(range(dataset_size))
-            
-            # Convert to standardized format
-            for idx in indices:
-                item = dataset[idx]
-                problem = self._standardize_problem(item, config, benchmark_name, idx)
-                if problem:
-                    problems.append(problem)
-            
-            if max_samples and random_sample:
-                print(f"Randomly sampled {len(problems)} problems from {dataset_size} total")
-            
+                # Load dataset from Hugging Face
+                if config["subset"]:
+                    dataset = load_dataset(
+                        config["hf_name"],
+                        config["subset"],
+                        split=config["split"],
+                        cache_dir=self.cache_dir
+                    )
+                else:
+                    dataset = load_dataset(
+                        config["hf_name"],
+                        split=config["split"],
+                        cache_dir=self.cache_dir
+                    )
+
+                # Convert to standardized format
+                problems = []
+                dataset_size = len(dataset)
+
+                # Determine indices to use
+                if max_samples and max_samples < dataset_size:
+                    if random_sample:
+                        # Randomly sample indices
+                        indices = random.sample(range(dataset_size), max_samples)
+                        indices.sort()  # Keep sorted for reproducibility
+                    else:
+                        # Take first N
+                        indices = list(range(max_samples))
+                else:
+                    # Use all
+                    indices = list(range(dataset_size))
+
+                # Convert to standardized format
+                for idx in indices:
+                    item = dataset[idx]
+                    problem = self._standardize_problem(item, config, benchmark_name, idx)
+                    if problem:
+                        problems.append(problem)
+
+                if max_samples and random_sample:
+                    print(f"Randomly sampled {len(problems)} problems from {dataset_size} total")
+
+            if use_cache:
+                try:
+                    os.makedirs(SAMPLED_CACHE_DIR, exist_ok=True)
+                    with open(cache_path, 'w', encoding='utf-8') as f:
+                        json.dump(problems, f, ensure_ascii=False, default=str)
+                except (TypeError, OSError) as e:
+                    print(f"Warning: could not cache sampled problems: {e}")
+
             return problems
             
         except Exception as e:
@@ -0,0 +1,12 @@
+"""
+Shared constants for the benchmark evaluation framework.
+
+Single source of truth for the benchmark names; the entry-point scripts and
+the aggregator previously each hard-coded their own copy of this list.
+"""
+
+# Canonical evaluation order (matches the paper's table layout)
+BENCHMARKS = ("mmlu", "arc_challenge", "gpqa_diamond", "bbh", "math", "gsm8k")
+
+# Fast membership checks (argparse choices, validation)
+BENCHMARK_SET = frozenset(BENCHMARKS)
@@ -7,9 +7,19 @@ Generates:
 """
 import os
 import json
+from pathlib import Path
 from typing import Dict, Any, List, Optional
 from collections import defaultdict
 
+from benchmark_evaluator.constants import BENCHMARKS
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 
 class ResultsAggregator:
     """Aggregates results across benchmarks and generates comparison tables."""
@@ -17,15 +27,31 @@ class ResultsAggregator:
     def __init__(self, results_dir: str = "benchmark_evaluator/results"):
         """Initialize results aggregator."""
         self.results_dir = results_dir
+        # Summaries parsed from disk and generated table text, memoized per
+        # instance: --generate-tables builds the performance table, the token
+        # table and the markdown report (which embeds both) from the same
+        # files, so each summary is parsed once and each table built once.
+        self._summary_cache = {}
+        self._table_cache = {}
     
     def load_benchmark_results(self, benchmark_name: str) -> Dict[str, Any]:
-        """Load results for a benchmark."""
+        """Load results for a benchmark (parsed once, then served from cache)."""
+        if benchmark_name in self._summary_cache:
+            return self._summary_cache[benchmark_name]
+
         filepath = os.path.join(self.results_dir, f"{benchmark_name}_summary.json")
         if not os.path.exists(filepath):
             return None
-        
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+
+        if ORJSON_AVAILABLE:
+            with open(filepath, 'rb') as f:
+                summary = orjson.loads(f.read())
+        else:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                summary = json.load(f)
+
+        self._summary_cache[benchmark_name] = summary
+        return summary
     
     def aggregate_all_benchmarks(self, benchmark_names: List[str]) -> Dict[str, Any]:
         """Aggregate results across all benchmarks."""
@@ -46,6 +72,13 @@ class ResultsAggregator:
         Format similar to paper Table 1:
         Method | MMLU | ARC-Challenge | GPQA-Diamond | BBH | MATH | GSM8K | Avg.
         """
+        cache_key = ('performance', tuple(sorted(benchmark_results)))
+        if cache_key in self._table_cache:
+            table_text = self._table_cache[cache_key]
+            if output_file:
+                self._write_table(table_text, output_file, "performance table")
+            return table_text
+
         # System order (as in paper)
         system_order = ['cot', 'static_mas', 'orig_bMAS', 'bMAS']
         system_display_names = {
@@ -56,7 +89,7 @@ class ResultsAggregator:
         }
         
         # Benchmark order
-        benchmark_order = ['mmlu', 'arc_challenge', 'gpqa_diamond', 'bbh', 'math', 'gsm8k']
+        benchmark_order = list(BENCHMARKS)
         benchmark_display_names = {
             'mmlu': 'MMLU',
             'arc_challenge': 'ARC-Challenge',
@@ -126,14 +159,17 @@ class ResultsAggregator:
         lines.append("="*100)
         
         table_text = "\n".join(lines)
-        
-        # Save to file
+        self._table_cache[cache_key] = table_text
+
         if output_file:
-            with open(output_file, 'w', encoding='utf-8', errors='replace') as f:
-                f.write(table_text)
-            print(f"Saved performance table to {output_file}")
+            self._write_table(table_text, output_file, "performance table")
         
         return table_text
+
+    def _write_table(self, table_text: str, output_file: str, label: str):
+        """Write generated table text to a file in one call."""
+        Path(output_file).write_text(table_text, encoding='utf-8', errors='replace')
+        print(f"Saved {label} to {output_file}")
     
     def generate_token_cost_table(self, benchmark_results: Dict[str, Dict[str, Any]],
                                   benchmark_name: str = "math",
@@ -146,7 +182,14 @@ class ResultsAggregator:
         """
         if benchmark_name not in benchmark_results:
             return f"No results found for benchmark: {benchmark_name}"
-        
+
+        cache_key = ('token_cost', benchmark_name, tuple(sorted(benchmark_results)))
+        if cache_key in self._table_cache:
+            table_text = self._table_cache[cache_key]
+            if output_file:
+                self._write_table(table_text, output_file, "token cost table")
+            return table_text
+
         summary = benchmark_results[benchmark_name]
         
         # System order
@@ -216,12 +259,10 @@ class ResultsAggregator:
         lines.append("="*100)
         
         table_text = "\n".join(lines)
-        
-        # Save to file
+        self._table_cache[cache_key] = table_text
+
         if output_file:
-            with open(output_file, 'w', encoding='utf-8', errors='replace') as f:
-                f.write(table_text)
-            print(f"Saved token cost table to {output_file}")
+            self._write_table(table_text, output_file, "token cost table")
         
         return table_text
     
@@ -257,16 +298,18 @@ class ResultsAggregator:
         lines.append("## Detailed Results by Benchmark")
         lines.append("")
         
+        # Bind append to a local for the per-system row loop
+        append = lines.append
         for benchmark_name, summary in benchmark_results.items():
-            lines.append(f"### {benchmark_name.upper()}")
-            lines.append("")
+            append(f"### {benchmark_name.upper()}")
+            append("")
             
             if 'systems' in summary:
-                lines.append("| System | Accuracy | Total Tokens | Avg Time | Avg Rounds |")
-                lines.append("|--------|----------|--------------|----------|------------|")
+                append("| System | Accuracy | Total Tokens | Avg Time | Avg Rounds |")
+                append("|--------|----------|--------------|----------|------------|")
                 
                 for system_name, metrics in summary['systems'].items():
-                    lines.append(
+                    append(
                         f"| {metrics['display_name']} | "
                         f"{metrics['accuracy']:.2f}% | "
                         f"{metrics['total_tokens']:,} | "
@@ -274,15 +317,13 @@ class ResultsAggregator:
                         f"{metrics['avg_rounds']:.2f} |"
                     )
             
-            lines.append("")
+            append("")
         
         report_text = "\n".join(lines)
         
         # Save to file
         if output_file:
-            with open(output_file, 'w', encoding='utf-8', errors='replace') as f:
-                f.write(report_text)
-            print(f"Saved markdown report to {output_file}")
+            self._write_table(report_text, output_file, "markdown report")
         
         return report_text
 
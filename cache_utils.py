@@ -0,0 +1,213 @@
+"""
+Result caching utilities for MAS comparison runs.
+
+The four canonical case problems are fixed strings and the comparison scripts
+are re-run repeatedly during development; each re-run pays full token and
+latency cost. ResultCache persists per-case metrics to disk keyed on the
+(system, problem, ground_truth, params) tuple so repeated runs return
+instantly without any LLM calls.
+
+An optional semantic mode (requires sentence-transformers + faiss) matches
+reworded variants of a problem against cached entries via embedding
+similarity. If those packages are not installed, the cache silently falls
+back to exact-key matching only.
+"""
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional
+
+# Optional semantic matching support
+try:
+    from sentence_transformers import SentenceTransformer
+    import faiss
+    import numpy as np
+    SEMANTIC_AVAILABLE = True
+except ImportError:
+    SEMANTIC_AVAILABLE = False
+    SentenceTransformer = None
+    faiss = None
+
+# Cosine similarity threshold for treating a reworded problem as a cache hit
+SEMANTIC_SIMILARITY_THRESHOLD = 0.97
+
+EMBEDDING_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+class ResultCache:
+    """Disk-backed cache for experiment metrics dictionaries."""
+
+    def __init__(self, cache_dir: str = ".cache/mas_results", semantic: bool = False):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cached JSON entries
+            semantic: Enable embedding-similarity matching for reworded problems
+                      (requires sentence-transformers and faiss)
+        """
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+        self.semantic = semantic and SEMANTIC_AVAILABLE
+        if semantic and not SEMANTIC_AVAILABLE:
+            print("Warning: semantic cache requested but sentence-transformers/faiss "
+                  "not installed. Falling back to exact-key matching.")
+
+        self._embedder = None
+        self._index = None
+        self._index_keys = []
+        if self.semantic:
+            self._embedder = SentenceTransformer(EMBEDDING_MODEL_NAME)
+            self._load_semantic_index()
+
+    @staticmethod
+    def make_key(system: str, problem: str, ground_truth: Optional[str] = None,
+                 **params) -> str:
+        """
+        Build a stable cache key from the experiment parameters.
+
+        Args:
+            system: System identifier (e.g. "bMAS", "cot")
+            problem: Problem text
+            ground_truth: Optional ground truth answer
+            **params: Extra parameters that affect the result (e.g. max_rounds)
+
+        Returns:
+            SHA256 hex digest identifying this experiment configuration
+        """
+        payload = json.dumps(
+            {
+                "system": system,
+                "problem": problem,
+                "ground_truth": ground_truth,
+                "params": params
+            },
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str, problem: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Cache key from make_key()
+            problem: Optional problem text for semantic (fuzzy) matching
+
+        Returns:
+            Cached metrics dictionary or None on miss
+        """
+        # Exact-key lookup first
+        filepath = self._entry_path(key)
+        if os.path.exists(filepath):
+            try:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (json.JSONDecodeError, OSError):
+                # Corrupted entry - treat as a miss
+                return None
+
+        # Semantic fallback for reworded problems
+        if self.semantic and problem:
+            return self._semantic_get(problem)
+
+        return None
+
+    def set(self, key: str, metrics: Dict[str, Any], problem: Optional[str] = None):
+        """
+        Store a result in the cache.
+
+        Args:
+            key: Cache key from make_key()
+            metrics: Metrics dictionary to persist (must be JSON-serializable)
+            problem: Optional problem text to index for semantic matching
+        """
+        filepath = self._entry_path(key)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(metrics, f, indent=2, ensure_ascii=False)
+
+        if self.semantic and problem:
+            self._semantic_add(key, problem)
+
+    def clear(self):
+        """Remove all cached entries."""
+        for filename in os.listdir(self.cache_dir):
+            if filename.endswith(".json") or filename.endswith(".index"):
+                os.remove(os.path.join(self.cache_dir, filename))
+        if self.semantic:
+            self._index = None
+            self._index_keys = []
+
+    # --- Semantic index helpers (no-ops when dependencies are missing) ---
+
+    def _semantic_meta_path(self) -> str:
+        return os.path.join(self.cache_dir, "semantic_index.json")
+
+    def _load_semantic_index(self):
+        """Rebuild the FAISS index from persisted problem embeddings."""
+        dim = self._embedder.get_sentence_embedding_dimension()
+        self._index = faiss.IndexFlatIP(dim)
+        self._index_keys = []
+
+        meta_path = self._semantic_meta_path()
+        if not os.path.exists(meta_path):
+            return
+
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return
+
+        for key, problem in meta.items():
+            self._semantic_add(key, problem, persist=False)
+
+    def _embed(self, problem: str):
+        """Embed and L2-normalize so inner product equals cosine similarity."""
+        vector = self._embedder.encode([problem])
+        vector = np.asarray(vector, dtype="float32")
+        faiss.normalize_L2(vector)
+        return vector
+
+    def _semantic_add(self, key: str, problem: str, persist: bool = True):
+        """Add a problem embedding to the index."""
+        if key in self._index_keys:
+            return
+        self._index.add(self._embed(problem))
+        self._index_keys.append(key)
+
+        if persist:
+            meta_path = self._semantic_meta_path()
+            meta = {}
+            if os.path.exists(meta_path):
+                try:
+                    with open(meta_path, 'r', encoding='utf-8') as f:
+                        meta = json.load(f)
+                except (json.JSONDecodeError, OSError):
+                    meta = {}
+            meta[key] = problem
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump(meta, f, ensure_ascii=False)
+
+    def _semantic_get(self, problem: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for the most similar indexed problem."""
+        if self._index is None or self._index.ntotal == 0:
+            return None
+
+        similarities, indices = self._index.search(self._embed(problem), 1)
+        if similarities[0][0] < SEMANTIC_SIMILARITY_THRESHOLD:
+            return None
+
+        matched_key = self._index_keys[indices[0][0]]
+        filepath = self._entry_path(matched_key)
+        if os.path.exists(filepath):
+            try:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (json.JSONDecodeError, OSError):
+                return None
+        return None
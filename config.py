@@ -31,6 +31,27 @@ LLM_MODELS = OLLAMA_MODELS if USE_OLLAMA else API_MODELS
 TEMPERATURE = 0.7
 MAX_ROUNDS = 4
 
+# Maximum LLM requests per minute across all agents/threads (0 = unlimited).
+# Useful when pointing at a rate-limited remote backend; a local Ollama
+# instance normally needs no cap.
+LLM_MAX_RPM = int(os.getenv("LLM_MAX_RPM", "0"))
+
+# Collapse concurrent identical LLM requests into one backend call
+# (0 = off; sharing a call means sharing one sample at temperature > 0)
+LLM_DEDUP_INFLIGHT = os.getenv("LLM_DEDUP_INFLIGHT", "").lower() in ("1", "true")
+
+# Maximum LLM requests allowed in flight at once (0 = unlimited); caps the
+# combined parallelism of agent pools and data-parallel benchmark runs
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "0"))
+
+# Hedge a duplicate request to a second backend after this many seconds
+# without a response (0 = off); trades extra tokens for tail latency
+LLM_HEDGE_DELAY = float(os.getenv("LLM_HEDGE_DELAY", "0"))
+
+# Serve cached responses for paraphrased prompts via embedding similarity
+# (requires sentence-transformers + faiss)
+LLM_SEMANTIC_CACHE = os.getenv("LLM_SEMANTIC_CACHE", "").lower() in ("1", "true")
+
 # API Configuration (for fallback or when USE_OLLAMA=false)
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 HUGGINGFACE_API_KEY = os.getenv("HUGGINGFACE_API_KEY", "")
@@ -12,7 +12,9 @@ from typing import Dict, Any, Optional
 import sys
 
 # Add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from llm_integration.api import call_llm, get_available_models
 import config
@@ -474,6 +476,124 @@ def run_cot_experiment(problem: str,
         return error_result
 
 
+def build_batch_prompt(problems) -> str:
+    """
+    Marshal several problems into a single CoT prompt.
+
+    Args:
+        problems: List of problem/question strings
+
+    Returns:
+        Combined prompt instructing a JSON {"answers": [...]} response
+    """
+    sections = [f"### Case {i + 1}:\n{problem}" for i, problem in enumerate(problems)]
+    return (
+        f"Solve the following {len(problems)} problems. "
+        "Think step by step for each one.\n\n"
+        + "\n\n".join(sections)
+        + "\n\nAfter reasoning, return your final answers as JSON in the form "
+          '{"answers": ["answer to case 1", "answer to case 2", ...]} '
+          "with exactly one answer per case, in order."
+    )
+
+
+def run_cot_batch(problems,
+                  ground_truths=None,
+                  model_name: Optional[str] = None,
+                  max_batch_size: int = 4):
+    """
+    Run several CoT problems in a single LLM request.
+
+    Marshals up to max_batch_size problems into one prompt and splits the
+    structured {"answers": [...]} response back into per-problem results.
+    This trades one round-trip (plus shared prompt prefix) for the N separate
+    calls run_cot_experiment would make. Falls back to per-problem
+    run_cot_experiment calls if the batched response cannot be parsed.
+
+    Args:
+        problems: List of problem/question strings
+        ground_truths: Optional list of ground truth answers (same length)
+        model_name: Optional model name (randomly selected if None)
+        max_batch_size: Maximum problems per LLM request (batches are split
+                        beyond this; latency grows with larger batches)
+
+    Returns:
+        List of result dictionaries, one per problem, in input order
+    """
+    from llm_integration.api import parse_json_response
+
+    if ground_truths is None:
+        ground_truths = [None] * len(problems)
+
+    # Split oversized batches into capped chunks
+    if len(problems) > max_batch_size:
+        results = []
+        for start in range(0, len(problems), max_batch_size):
+            results.extend(run_cot_batch(
+                problems[start:start + max_batch_size],
+                ground_truths[start:start + max_batch_size],
+                model_name=model_name,
+                max_batch_size=max_batch_size
+            ))
+        return results
+
+    if model_name is None:
+        model_name = select_model_for_cot()
+
+    batch_prompt = build_batch_prompt(problems)
+
+    print(f"\n{'='*80}")
+    print(f"Chain-of-Thought (CoT) Batch Experiment ({len(problems)} problems)")
+    print(f"Model: {model_name}")
+    print(f"{'='*80}\n")
+
+    start_time = datetime.now()
+    try:
+        response = call_llm(batch_prompt, model_name=model_name)
+        reasoning = response.get("content", "")
+        parsed = parse_json_response(reasoning)
+        answers = parsed.get("answers") if isinstance(parsed, dict) else None
+    except Exception as e:
+        print(f"Batch CoT call failed ({e}). Falling back to per-problem calls.")
+        answers = None
+        response = None
+        reasoning = ""
+
+    if not isinstance(answers, list) or len(answers) != len(problems):
+        # Parsing failed or answer count mismatch - run problems individually
+        print("Batch response could not be parsed. Falling back to per-problem calls.")
+        return [
+            run_cot_experiment(problem, ground_truth=gt, model_name=model_name,
+                               enable_logging=False)
+            for problem, gt in zip(problems, ground_truths)
+        ]
+
+    execution_time = (datetime.now() - start_time).total_seconds()
+    metadata = response.get("metadata", {})
+    total_tokens = metadata.get("tokens_used", 0) or 0
+
+    # Split shared batch cost evenly across the problems
+    results = []
+    for problem, ground_truth, answer in zip(problems, ground_truths, answers):
+        final_answer = str(answer)
+        result = {
+            "problem": problem,
+            "ground_truth": ground_truth,
+            "model_backend": model_name,
+            "reasoning": reasoning,
+            "final_answer": final_answer,
+            "extracted_answer": final_answer,
+            "tokens_used": total_tokens // len(problems),
+            "execution_time": execution_time / len(problems),
+            "batched": True
+        }
+        if ground_truth:
+            result["correct"] = evaluate_answer(final_answer, ground_truth)
+        results.append(result)
+
+    return results
+
+
 def evaluate_answer(predicted: str, ground_truth: str) -> bool:
     """
     Simple answer evaluation.
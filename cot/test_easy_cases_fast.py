@@ -6,7 +6,9 @@ Chain-of-Thought approach with "Let's think step by step." prompting.
 """
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from cot.run_experiment import run_cot_experiment
 
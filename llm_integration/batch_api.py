@@ -0,0 +1,131 @@
+"""
+Provider-native Batch API path for offline evaluation runs.
+
+The comparison and benchmark scripts loop over case sets that are known in
+full before the first LLM call, so when the API fallback (OpenAI-compatible
+endpoint) is in use, every (agent, problem) pair can be submitted as one
+Batch API job instead of individual chat completions - batched jobs are
+billed at half price and are not subject to interactive rate limits, at the
+cost of minutes-to-hours of turnaround.
+
+This module only covers the API fallback: Ollama has no batch endpoint, so
+local runs keep using call_llm. The interactive path is unchanged; callers
+opt in explicitly (see create_static_agent_pool_batch in
+static_mas.agents.static_agents).
+"""
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+import config
+
+# How often poll-and-wait loops check job status (seconds)
+BATCH_POLL_INTERVAL = float(os.getenv("MAS_BATCH_POLL_INTERVAL", "30"))
+
+
+def _client():
+    """Build an OpenAI client for the batch endpoint (same keys as call_llm)."""
+    from openai import OpenAI
+
+    api_key = config.OPENAI_API_KEY
+    if not api_key:
+        raise RuntimeError(
+            "Batch API requires OPENAI_API_KEY; the Ollama backend has no "
+            "batch endpoint. Use call_llm for local runs."
+        )
+    return OpenAI(api_key=api_key)
+
+
+def submit_batch(requests: List[Dict[str, Any]]) -> str:
+    """
+    Submit a list of chat requests as one batch job.
+
+    Args:
+        requests: Dicts with 'custom_id', 'model', 'messages' and optionally
+                  'temperature' - one per line of the uploaded JSONL
+
+    Returns:
+        The provider's batch job id, for poll() / collect()
+    """
+    lines = []
+    for request in requests:
+        lines.append(json.dumps({
+            "custom_id": request["custom_id"],
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": request["model"],
+                "messages": request["messages"],
+                "temperature": request.get("temperature", config.TEMPERATURE)
+            }
+        }, ensure_ascii=False))
+
+    client = _client()
+    input_file = client.files.create(
+        file=("batch_input.jsonl", "\n".join(lines).encode("utf-8")),
+        purpose="batch"
+    )
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+    print(f"Submitted batch {batch.id} with {len(requests)} requests")
+    return batch.id
+
+
+def poll(job_id: str) -> str:
+    """Return the current status of a batch job (e.g. 'in_progress', 'completed')."""
+    return _client().batches.retrieve(job_id).status
+
+
+def collect(job_id: str, wait: bool = True) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch the results of a batch job, mapped by custom_id.
+
+    Args:
+        job_id: Batch id from submit_batch()
+        wait: Poll until the job leaves 'in_progress' (every
+              BATCH_POLL_INTERVAL seconds) instead of failing immediately
+
+    Returns:
+        custom_id -> response dict in call_llm's shape
+        ('content' plus 'metadata' with token counts)
+
+    Raises:
+        RuntimeError: If the job finished in a non-completed state
+    """
+    client = _client()
+    batch = client.batches.retrieve(job_id)
+    while wait and batch.status in ("validating", "in_progress", "finalizing"):
+        time.sleep(BATCH_POLL_INTERVAL)
+        batch = client.batches.retrieve(job_id)
+
+    if batch.status != "completed":
+        raise RuntimeError(f"Batch {job_id} ended with status '{batch.status}'")
+
+    output = client.files.content(batch.output_file_id).text
+
+    results = {}
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        entry = json.loads(line)
+        body = entry["response"]["body"]
+        usage = body.get("usage", {})
+        results[entry["custom_id"]] = {
+            "content": body["choices"][0]["message"]["content"],
+            "metadata": {
+                "model": body.get("model"),
+                "tokens_used": usage.get("total_tokens", 0),
+                "prompt_tokens": usage.get("prompt_tokens", 0),
+                "completion_tokens": usage.get("completion_tokens", 0),
+                "batched": True
+            }
+        }
+    return results
@@ -0,0 +1,73 @@
+"""
+Fast JSON decoding for LLM responses.
+
+Every agent solve() parses a small JSON payload with a stable schema
+({"answer": ..., "confidence": ..., "explanation": ...}). orjson decodes
+these payloads several times faster than stdlib json, and when a model
+emits almost-JSON (trailing commas, unescaped quotes), a key-targeted
+salvage pass recovers the known fields instead of discarding the whole
+payload. Falls back to stdlib json when orjson is not installed.
+"""
+import json
+import re
+from typing import Any, Dict
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# The schema-stable keys agent responses are expected to carry
+_AGENT_KEYS = ("answer", "confidence", "explanation")
+
+_KEY_RES = {
+    key: re.compile(
+        rf'"{key}"\s*:\s*("(?:[^"\\]|\\.)*"|-?\d+\.?\d*|true|false)'
+    )
+    for key in _AGENT_KEYS
+}
+
+
+def loads(text: str) -> Any:
+    """
+    Decode a JSON document, preferring orjson's C decoder.
+
+    Raises:
+        ValueError: On malformed JSON (orjson's and json's decode errors
+                    are both ValueError subclasses)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def salvage_agent_fields(text: str) -> Dict[str, Any]:
+    """
+    Best-effort extraction of the known agent-response keys from
+    malformed JSON.
+
+    Scans for "answer", "confidence" and "explanation" individually, so a
+    payload broken by one bad field still yields the others. Returns only
+    the keys that could be recovered (possibly none).
+    """
+    salvaged = {}
+    for key, pattern in _KEY_RES.items():
+        match = pattern.search(text)
+        if not match:
+            continue
+        raw = match.group(1)
+        if raw.startswith('"'):
+            try:
+                salvaged[key] = json.loads(raw)
+            except ValueError:
+                continue
+        elif raw in ("true", "false"):
+            salvaged[key] = raw == "true"
+        else:
+            try:
+                salvaged[key] = float(raw) if "." in raw else int(raw)
+            except ValueError:
+                continue
+    return salvaged
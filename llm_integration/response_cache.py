@@ -0,0 +1,76 @@
+"""
+Exact-match disk cache for deterministic LLM responses.
+
+Sits in front of call_llm: calls issued at temperature 0 are keyed by
+(model, system prompt, user prompt, temperature) and served from disk on
+repeat, so replaying a fixed case set (compare_with_lbmas, the comparison
+scripts at deterministic settings) costs no API traffic after the first
+run. Calls at temperature > 0 are never cached - they are intentional
+independent samples.
+
+Distinct from cache_utils.ResultCache, which stores whole experiment
+results; this caches individual model responses.
+"""
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, Optional
+
+
+class ResponseCache:
+    """Disk-backed exact-match cache for LLM responses."""
+
+    def __init__(self, cache_dir: str = "cache/llm_responses"):
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model: str, prompt: str, system_prompt: Optional[str],
+                 temperature: float) -> str:
+        """Build a deterministic cache key for one resolved call."""
+        payload = json.dumps({
+            "model": model,
+            "system": system_prompt,
+            "user": prompt,
+            "temp": temperature
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response for key, or None on a miss."""
+        path = self._path(key)
+        if not os.path.exists(path):
+            with self._lock:
+                self.misses += 1
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                response = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        response.setdefault("metadata", {})["response_cache_hit"] = True
+        return response
+
+    def set(self, key: str, response: Dict[str, Any]):
+        """Persist a fresh response under key."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._path(key), 'w', encoding='utf-8') as f:
+                json.dump(response, f, ensure_ascii=False)
+        except (TypeError, OSError) as e:
+            print(f"Warning: could not cache LLM response: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters for this process."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
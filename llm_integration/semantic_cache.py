@@ -0,0 +1,153 @@
+"""
+Embedding-similarity lookup layer over the exact-match response cache.
+
+Problems submitted to the MAS systems are frequently paraphrases of prior
+problems ("What is France's capital" vs "capital of France"); an exact key
+never matches those. SemanticCache indexes the prompts behind ResponseCache
+entries with sentence-transformer embeddings and serves the cached response
+of the nearest prior prompt when cosine similarity clears a threshold.
+
+Entries are partitioned by system prompt, so a paraphrase only matches
+responses produced under the same agent role - a math expert's answer is
+never returned for a physics expert's question.
+
+Requires sentence-transformers and faiss (same optional dependencies as
+cache_utils' semantic mode); enable via LLM_SEMANTIC_CACHE=1.
+"""
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, Optional
+
+# Optional semantic matching support
+try:
+    from sentence_transformers import SentenceTransformer
+    import faiss
+    import numpy as np
+    SEMANTIC_AVAILABLE = True
+except ImportError:
+    SEMANTIC_AVAILABLE = False
+    SentenceTransformer = None
+    faiss = None
+
+# Cosine similarity threshold for treating a paraphrase as a cache hit.
+# Lower than cache_utils' 0.97: individual prompts are longer and more
+# templated than bare case problems, so near-duplicates score lower.
+SEMANTIC_SIMILARITY_THRESHOLD = float(os.getenv("MAS_SEMANTIC_THRESHOLD", "0.92"))
+
+EMBEDDING_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+class SemanticCache:
+    """Per-role embedding index over a ResponseCache's stored entries."""
+
+    def __init__(self, response_cache, threshold: float = SEMANTIC_SIMILARITY_THRESHOLD):
+        """
+        Initialize the index.
+
+        Args:
+            response_cache: The ResponseCache whose entries to serve
+            threshold: Minimum cosine similarity for a paraphrase hit
+
+        Raises:
+            ImportError: If sentence-transformers or faiss is missing
+        """
+        if not SEMANTIC_AVAILABLE:
+            raise ImportError("semantic cache requires sentence-transformers and faiss")
+
+        self.response_cache = response_cache
+        self.threshold = threshold
+        self._embedder = SentenceTransformer(EMBEDDING_MODEL_NAME)
+        self._lock = threading.Lock()
+        # partition id -> (faiss index, list of response-cache keys)
+        self._partitions = {}
+
+    @staticmethod
+    def _partition_id(system_prompt: Optional[str]) -> str:
+        """Stable partition identifier for one agent role's system prompt."""
+        return hashlib.sha1((system_prompt or "").encode("utf-8")).hexdigest()[:12]
+
+    def _meta_path(self, partition_id: str) -> str:
+        return os.path.join(self.response_cache.cache_dir,
+                            f"semantic_index_{partition_id}.json")
+
+    def _embed(self, prompt: str):
+        """Embed and L2-normalize so inner product equals cosine similarity."""
+        vector = self._embedder.encode([prompt])
+        vector = np.asarray(vector, dtype="float32")
+        faiss.normalize_L2(vector)
+        return vector
+
+    def _get_partition(self, partition_id: str):
+        """Return (index, keys) for a partition, rebuilding it from disk once."""
+        if partition_id in self._partitions:
+            return self._partitions[partition_id]
+
+        dim = self._embedder.get_sentence_embedding_dimension()
+        index = faiss.IndexFlatIP(dim)
+        keys = []
+        self._partitions[partition_id] = (index, keys)
+
+        meta_path = self._meta_path(partition_id)
+        if os.path.exists(meta_path):
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+            except (json.JSONDecodeError, OSError):
+                meta = {}
+            for key, prompt in meta.items():
+                index.add(self._embed(prompt))
+                keys.append(key)
+
+        return index, keys
+
+    def lookup(self, prompt: str,
+               system_prompt: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached response of the most similar prior prompt, or None.
+
+        Only searches the partition belonging to system_prompt's role.
+        """
+        partition_id = self._partition_id(system_prompt)
+        with self._lock:
+            index, keys = self._get_partition(partition_id)
+            if index.ntotal == 0:
+                return None
+            similarities, indices = index.search(self._embed(prompt), 1)
+            if similarities[0][0] < self.threshold:
+                return None
+            matched_key = keys[indices[0][0]]
+            similarity = float(similarities[0][0])
+
+        response = self.response_cache.get(matched_key)
+        if response is None:
+            return None
+        response["metadata"]["semantic_cache_hit"] = True
+        response["metadata"]["semantic_similarity"] = round(similarity, 4)
+        return response
+
+    def add(self, key: str, prompt: str, system_prompt: Optional[str] = None):
+        """Index a freshly cached response's prompt for future paraphrase hits."""
+        partition_id = self._partition_id(system_prompt)
+        with self._lock:
+            index, keys = self._get_partition(partition_id)
+            if key in keys:
+                return
+            index.add(self._embed(prompt))
+            keys.append(key)
+
+        meta_path = self._meta_path(partition_id)
+        meta = {}
+        if os.path.exists(meta_path):
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+            except (json.JSONDecodeError, OSError):
+                meta = {}
+        meta[key] = prompt
+        try:
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump(meta, f, ensure_ascii=False)
+        except OSError as e:
+            print(f"Warning: could not persist semantic index: {e}")
@@ -0,0 +1,72 @@
+"""
+Unified CLI for the MAS evaluation scripts.
+
+One process, four subcommands:
+
+    python mas_bench.py benchmark --benchmark mmlu --sample 5
+    python mas_bench.py quick
+    python mas_bench.py hard-cases
+    python mas_bench.py generate-tables
+
+Each subcommand dispatches to the existing runner's main(), so running
+several subcommands from one interpreter (e.g. an interactive session)
+shares the process-level state the entry points have accumulated: the
+pooled LLM session, the result cache, the sampled-problem cache and the
+already-imported MAS systems.
+"""
+import argparse
+import sys
+import os
+
+# Add current directory to path
+_current_dir = os.path.dirname(os.path.abspath(__file__))
+if _current_dir not in sys.path:
+    sys.path.insert(0, _current_dir)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="mas_bench",
+        description="Unified entry point for MAS benchmark and case evaluations"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    bench = subparsers.add_parser(
+        "benchmark",
+        help="Run benchmark evaluations (forwards flags to run_benchmark_evaluation)",
+        add_help=False
+    )
+    bench.add_argument('rest', nargs=argparse.REMAINDER)
+
+    subparsers.add_parser("quick", help="Quick 5-problem sample of every benchmark")
+    subparsers.add_parser("hard-cases", help="Run hard Cases C and D across all systems")
+
+    tables = subparsers.add_parser(
+        "generate-tables",
+        help="Generate comparison tables from existing results"
+    )
+    tables.add_argument(
+        '--output-dir',
+        type=str,
+        default='benchmark_evaluator/results',
+        help='Results directory to aggregate (default: benchmark_evaluator/results)'
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == "benchmark":
+        from run_benchmark_evaluation import main as benchmark_main
+        benchmark_main(args.rest)
+    elif args.command == "quick":
+        from run_quick_benchmark_test import main as quick_main
+        quick_main()
+    elif args.command == "hard-cases":
+        from run_hard_cases_comparison import main as hard_cases_main
+        hard_cases_main()
+    elif args.command == "generate-tables":
+        from run_benchmark_evaluation import main as benchmark_main
+        benchmark_main(['--generate-tables', '--output-dir', args.output_dir])
+
+
+if __name__ == "__main__":
+    main()
@@ -4,10 +4,39 @@ Captures prompts, responses, agent selections, and full execution traces.
 """
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 
+# Single background writer shared by all logger instances. Trace and report
+# files are serialized on the caller's thread (so later trace mutations can't
+# race the dump) but written to disk off-thread, keeping the experiment loop
+# from blocking on file I/O. One worker keeps writes ordered; the executor's
+# non-daemon thread drains pending writes at interpreter shutdown.
+_write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="trace-writer")
+
+
+def _write_file(filepath, blob):
+    # Runs on the writer thread where the submitted future is discarded,
+    # so report failures here instead of letting them vanish with it
+    try:
+        if isinstance(blob, bytes):
+            with open(filepath, 'wb') as f:
+                f.write(blob)
+        else:
+            with open(filepath, 'w', encoding='utf-8', errors='replace') as f:
+                f.write(blob)
+    except OSError as e:
+        print(f"Warning: could not write {filepath}: {e}")
+
 
 class ExperimentLogger:
     """
@@ -39,6 +68,27 @@ class ExperimentLogger:
             "total_tokens": 0
         }
     
+    def set_experiment_id(self, experiment_id: str):
+        """
+        Re-point a shared logger at a new experiment.
+
+        Resets the trace so one logger instance can be reused across
+        experiments without re-running directory setup in __init__.
+        """
+        self.experiment_id = experiment_id
+        self.trace = {
+            "experiment_id": experiment_id,
+            "start_time": datetime.now().isoformat(),
+            "problem": None,
+            "ground_truth": None,
+            "agent_pool": [],
+            "rounds": [],
+            "prompts": [],
+            "final_answer": None,
+            "end_time": None,
+            "total_tokens": 0
+        }
+
     def log_problem(self, problem: str, ground_truth: Optional[str] = None):
         """Log the problem/question."""
         self.trace["problem"] = problem
@@ -145,16 +195,29 @@ class ExperimentLogger:
         self.trace["total_tokens"] += tokens
     
     def save(self, filename: Optional[str] = None):
-        """Save the trace to a JSON file."""
+        """Save the trace to a JSON file (write happens in the background)."""
         self.trace["end_time"] = datetime.now().isoformat()
-        
+        # Ship the duration precomputed so readers need not re-parse the
+        # ISO timestamps
+        try:
+            start = datetime.fromisoformat(self.trace["start_time"])
+            end = datetime.fromisoformat(self.trace["end_time"])
+            self.trace["execution_time_sec"] = (end - start).total_seconds()
+        except (KeyError, TypeError, ValueError):
+            pass
+
         if filename is None:
             filename = f"trace_{self.experiment_id}.json"
-        
+
         filepath = self.output_dir / filename
-        with open(filepath, 'w', encoding='utf-8', errors='replace') as f:
-            json.dump(self.trace, f, indent=2, ensure_ascii=False)
-        
+        # Serialize on the caller's thread (so later trace mutations can't
+        # race the dump); orjson encodes in C when available
+        if ORJSON_AVAILABLE:
+            blob = orjson.dumps(self.trace, option=orjson.OPT_INDENT_2)
+        else:
+            blob = json.dumps(self.trace, indent=2, ensure_ascii=False)
+        _write_executor.submit(_write_file, filepath, blob)
+
         return filepath
     
     def generate_text_report(self) -> str:
@@ -245,8 +308,7 @@ class ExperimentLogger:
         
         filepath = self.output_dir / filename
         report = self.generate_text_report()
-        with open(filepath, 'w', encoding='utf-8', errors='replace') as f:
-            f.write(report)
-        
+        _write_executor.submit(_write_file, filepath, report)
+
         return filepath
 
@@ -3,20 +3,147 @@ Run all test cases (Easy Cases A & B, Hard Cases C & D) across all 4 MAS setups
 """
 import sys
 import os
+import io
+import json
 import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
 
 # Add paths for imports
 _current_dir = os.path.dirname(os.path.abspath(__file__))
 if _current_dir not in sys.path:
     sys.path.insert(0, _current_dir)
 
+# Banner strings used throughout the output (built once instead of per print)
+_EQ80 = "=" * 80
+_HASH80 = "#" * 80
+_DASH110 = "-" * 110
+
+# Comparison-table row template, compiled once instead of re-building the
+# padded f-string format specs for every row
+_ROW_FMT = "{system:<30} {answer:<20} {correct:<10} {tokens:<10} {time:<12.2f} {rounds:<10}"
+_HEAD_FMT = _ROW_FMT.replace(':<12.2f}', ':<12}')
+
 # Import test functions from each MAS setup
 from bMAS.experiment_runner.run_experiment import run_single_experiment as run_bmas
 from bMAS.utils.logger import ExperimentLogger
 from orig_impl_bMAS.experiment_runner.run_experiment import run_single_experiment as run_orig_bmas
 from orig_impl_bMAS.utils.logger import ExperimentLogger as OrigExperimentLogger
-from static_mas.run_experiment import run_static_experiment
-from cot.run_experiment import run_cot_experiment
+from static_mas.run_experiment import run_static_experiment, run_static_batch
+from cot.run_experiment import run_cot_experiment, run_cot_batch
+from cache_utils import ResultCache
+
+# Batch mode: marshal all four cases into a single LLM request per single-shot
+# system (CoT, Static MAS) instead of four separate round-trips. bMAS variants
+# are iterative and always run per-case. Set MAS_BATCH_CASES=1 to enable.
+BATCH_CASES = os.getenv("MAS_BATCH_CASES", "").lower() in ("1", "true")
+
+# Shared result cache - re-runs of the fixed case problems hit disk instead of the LLM.
+# Set MAS_DISABLE_CACHE=1 to force fresh runs.
+CACHE_ENABLED = os.getenv("MAS_DISABLE_CACHE", "").lower() not in ("1", "true")
+result_cache = ResultCache() if CACHE_ENABLED else None
+
+
+def check_cache(system, problem, ground_truth, **params):
+    """Look up a cached result for this experiment configuration.
+
+    Returns (key, metrics) where metrics is None on a miss. Cache hits are
+    returned with a synthetic execution_time of 0.0 and cache_hit=True.
+    """
+    if result_cache is None:
+        return None, None
+    key = ResultCache.make_key(system, problem, ground_truth, **params)
+    # Prefer a result prefetched by the lookahead thread (see _prewarm_case)
+    cached = _cache_prefetch.pop(key, None)
+    if cached is None:
+        cached = result_cache.get(key, problem=problem)
+    if cached is not None:
+        cached['execution_time'] = 0.0
+        cached['cache_hit'] = True
+        print(f"\n[CACHE HIT] {system} - returning cached result (0 tokens consumed)")
+    return key, cached
+
+
+def store_cache(key, metrics, problem):
+    """Persist a fresh result so the next re-run skips the LLM calls."""
+    if result_cache is not None and key is not None:
+        metrics['cache_hit'] = False
+        result_cache.set(key, metrics, problem=problem)
+
+
+# Results prefetched one case ahead by the lookahead thread, keyed by cache key
+_cache_prefetch = {}
+
+
+def _prewarm_case(case_data, is_hard):
+    """Prefetch the next case's cache lookups while the current case runs.
+
+    The disk reads (and, in semantic mode, the lazy embedding-model load and
+    index search) happen in a background thread during the current case's LLM
+    round-trips, so by the time run_case reaches the next case its check_cache
+    calls are dict pops. Safe to run speculatively: a wasted prefetch costs a
+    few file reads, never an LLM call.
+    """
+    if result_cache is None:
+        return
+    problem = case_data["problem"]
+    ground_truth = case_data["ground_truth"]
+    max_rounds = 6 if is_hard else 4
+    for setup in SETUPS:
+        params = dict(setup.get('cache_params', {}))
+        if setup['needs_max_rounds']:
+            params['max_rounds'] = max_rounds
+        key = ResultCache.make_key(setup['cache_system'], problem, ground_truth,
+                                   **params)
+        cached = result_cache.get(key, problem=problem)
+        if cached is not None:
+            _cache_prefetch[key] = cached
+
+
+# Per-case summaries are streamed to this JSONL file as soon as each case
+# finishes, so the final summary never has to hold all results in memory and
+# interrupted runs can be resumed with --resume.
+RUNS_JSONL = "all_cases_runs.jsonl"
+
+# Large/irrelevant per-result fields dropped from the streamed summaries
+_SUMMARY_EXCLUDED_KEYS = ('trace_json', 'trace_txt')
+
+
+def append_case_summary(case_name, results, runs_file=RUNS_JSONL):
+    """Append one case's slimmed-down results to the runs JSONL file."""
+    slim_results = [
+        {k: v for k, v in r.items() if k not in _SUMMARY_EXCLUDED_KEYS}
+        for r in results
+    ]
+    with open(runs_file, 'a', encoding='utf-8') as f:
+        f.write(json.dumps({"case": case_name, "results": slim_results},
+                           ensure_ascii=False) + "\n")
+
+
+def load_case_summaries(runs_file=RUNS_JSONL):
+    """Read back streamed case summaries as {case_name: results} in file order."""
+    summaries = {}
+    if not os.path.exists(runs_file):
+        return summaries
+    with open(runs_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            summaries[entry.get("case", "?")] = entry.get("results", [])
+    return summaries
+
 
 # Test case definitions
 EASY_CASE_A = {
@@ -43,219 +170,324 @@ HARD_CASE_D = {
     "ground_truth": "A"
 }
 
+# All cases keyed by their short label, in run order (easy first, then hard);
+# hard cases get extra debate rounds
+CASES = {
+    "A": EASY_CASE_A,
+    "B": EASY_CASE_B,
+    "C": HARD_CASE_C,
+    "D": HARD_CASE_D
+}
+HARD_CASES = (HARD_CASE_C, HARD_CASE_D)
 
-def run_orig_bmas_test(problem, ground_truth, case_name, max_rounds=4):
-    """Run case with orig_impl_bMAS (Original Implementation Prompts)."""
-    print("\n" + "="*80)
-    print(f"RUNNING orig_impl_bMAS (Original Prompts) - {case_name}")
-    print("="*80)
-    
-    logger = OrigExperimentLogger(experiment_id=f"{case_name.lower().replace(' ', '_')}_orig_bmas")
-    
-    start_time = time.time()
-    result = run_orig_bmas(
-        problem=problem,
-        max_rounds=max_rounds,
-        ground_truth=ground_truth,
-        enable_logging=True,
-        logger=logger
-    )
-    execution_time = time.time() - start_time
-    
-    metrics = {
-        'system': 'orig_impl_bMAS (Original Prompts)',
-        'case': case_name,
-        'final_answer': result.get('final_answer', 'N/A'),
-        'correct': result.get('correct', False),
-        'total_tokens': result.get('total_tokens', 0),
-        'execution_time': execution_time,
-        'rounds': len(result.get('rounds', [])),
-        'solution_ready': result.get('is_solution_ready', False),
-        'trace_json': result.get('trace_json', 'N/A'),
-        'trace_txt': result.get('trace_txt', 'N/A')
-    }
-    
-    print(f"\nFinal Answer: {metrics['final_answer']}")
-    print(f"Correct: {metrics['correct']}")
-    print(f"Total Tokens: {metrics['total_tokens']}")
-    print(f"Execution Time: {metrics['execution_time']:.2f} seconds")
-    print(f"Rounds: {metrics['rounds']}")
-    
-    return metrics
+# case name -> expected answer, for the final summary (O(1) lookup instead of
+# a chained substring conditional per result row)
+GROUND_TRUTHS = {case["name"]: case["ground_truth"] for case in CASES.values()}
 
 
-def run_bmas_test(problem, ground_truth, case_name, max_rounds=4):
-    """Run case with bMAS (LbMAS - Paper style prompts)."""
-    print("\n" + "="*80)
-    print(f"RUNNING bMAS (Paper Prompts) - {case_name}")
-    print("="*80)
-    
-    logger = ExperimentLogger(experiment_id=f"{case_name.lower().replace(' ', '_')}_bmas")
-    
-    start_time = time.time()
-    result = run_bmas(
-        problem=problem,
-        max_rounds=max_rounds,
-        ground_truth=ground_truth,
-        enable_logging=True,
-        logger=logger
-    )
-    execution_time = time.time() - start_time
-    
-    metrics = {
-        'system': 'bMAS (Paper Prompts)',
-        'case': case_name,
-        'final_answer': result.get('final_answer', 'N/A'),
-        'correct': result.get('correct', False),
-        'total_tokens': result.get('total_tokens', 0),
-        'execution_time': execution_time,
-        'rounds': len(result.get('rounds', [])),
-        'solution_ready': result.get('is_solution_ready', False),
-        'trace_json': result.get('trace_json', 'N/A'),
-        'trace_txt': result.get('trace_txt', 'N/A')
+# One entry per MAS setup. _run_setup and run_case drive everything from this
+# table, so cross-cutting changes (caching, timing, logging) land in one place
+# instead of four near-identical run_*_test copies.
+SETUPS = [
+    {
+        'name': 'orig_impl_bMAS (Original Prompts)',
+        'banner': 'orig_impl_bMAS (Original Prompts)',
+        'cache_system': 'orig_impl_bMAS',
+        'runner': run_orig_bmas,
+        'logger_cls': OrigExperimentLogger,
+        'id_suffix': 'orig_bmas',
+        'needs_max_rounds': True,
+        'token_key': 'total_tokens',
+        'extras': lambda result: {
+            'rounds': len(result.get('rounds', [])),
+            'solution_ready': result.get('is_solution_ready', False),
+            'trace_json': result.get('trace_json', 'N/A'),
+            'trace_txt': result.get('trace_txt', 'N/A')
+        },
+        'print_keys': [('Rounds', 'rounds')]
+    },
+    {
+        'name': 'bMAS (Paper Prompts)',
+        'banner': 'bMAS (Paper Prompts)',
+        'cache_system': 'bMAS',
+        'runner': run_bmas,
+        'logger_cls': ExperimentLogger,
+        'id_suffix': 'bmas',
+        'needs_max_rounds': True,
+        'token_key': 'total_tokens',
+        'extras': lambda result: {
+            'rounds': len(result.get('rounds', [])),
+            'solution_ready': result.get('is_solution_ready', False),
+            'trace_json': result.get('trace_json', 'N/A'),
+            'trace_txt': result.get('trace_txt', 'N/A')
+        },
+        'print_keys': [('Rounds', 'rounds')]
+    },
+    {
+        'name': 'Static MAS',
+        'banner': 'STATIC MAS',
+        'cache_system': 'Static MAS',
+        'runner': run_static_experiment,
+        'logger_cls': None,
+        'needs_max_rounds': False,
+        'extra_kwargs': {'aggregation_method': 'majority_vote'},
+        'cache_params': {'aggregation_method': 'majority_vote'},
+        'token_key': 'total_tokens',
+        'extras': lambda result: {
+            'rounds': 1,
+            'num_agents': len(result.get('agents', []))
+        },
+        'print_keys': [('Number of Agents', 'num_agents')]
+    },
+    {
+        'name': 'Chain-of-Thought (CoT)',
+        'banner': 'CHAIN-OF-THOUGHT BASELINE',
+        'cache_system': 'Chain-of-Thought',
+        'runner': run_cot_experiment,
+        'logger_cls': None,
+        'needs_max_rounds': False,
+        'token_key': 'tokens_used',
+        'extras': lambda result: {
+            'rounds': 1,
+            'model_backend': result.get('model_backend', 'N/A')
+        },
+        'print_keys': [('Model Backend', 'model_backend')]
     }
-    
-    print(f"\nFinal Answer: {metrics['final_answer']}")
-    print(f"Correct: {metrics['correct']}")
-    print(f"Total Tokens: {metrics['total_tokens']}")
-    print(f"Execution Time: {metrics['execution_time']:.2f} seconds")
-    print(f"Rounds: {metrics['rounds']}")
-    
-    return metrics
+]
 
 
-def run_static_mas_test(problem, ground_truth, case_name):
-    """Run case with Static MAS."""
-    print("\n" + "="*80)
-    print(f"RUNNING STATIC MAS - {case_name}")
-    print("="*80)
-    
-    start_time = time.time()
-    result = run_static_experiment(
-        problem=problem,
-        ground_truth=ground_truth,
-        aggregation_method="majority_vote",
-        enable_logging=True
-    )
-    execution_time = time.time() - start_time
-    
-    metrics = {
-        'system': 'Static MAS',
-        'case': case_name,
-        'final_answer': result.get('final_answer', 'N/A'),
-        'correct': result.get('correct', False),
-        'total_tokens': result.get('total_tokens', 0),
-        'execution_time': execution_time,
-        'rounds': 1,
-        'num_agents': len(result.get('agents', []))
-    }
-    
-    print(f"\nFinal Answer: {metrics['final_answer']}")
-    print(f"Correct: {metrics['correct']}")
-    print(f"Total Tokens: {metrics['total_tokens']}")
-    print(f"Execution Time: {metrics['execution_time']:.2f} seconds")
-    
-    return metrics
+def _run_setup(setup, problem, ground_truth, case_name, max_rounds=4, logger=None):
+    """Run one MAS setup on one case: banner, cache check, run, metrics.
 
+    Args:
+        setup: Entry from SETUPS describing the runner and metric mapping
+        problem: Problem text
+        ground_truth: Expected answer
+        case_name: Case label for banners and experiment ids
+        max_rounds: Round budget for the iterative (bMAS) setups
+        logger: Optional shared logger, reused across cases
+    """
+    print("\n" + _EQ80)
+    print(f"RUNNING {setup['banner']} - {case_name}")
+    print(_EQ80)
+
+    cache_params = dict(setup.get('cache_params', {}))
+    if setup['needs_max_rounds']:
+        cache_params['max_rounds'] = max_rounds
+    cache_key, cached = check_cache(setup['cache_system'], problem, ground_truth,
+                                    **cache_params)
+    if cached is not None:
+        return cached
+
+    kwargs = dict(problem=problem, ground_truth=ground_truth, enable_logging=True)
+    kwargs.update(setup.get('extra_kwargs', {}))
+    if setup['needs_max_rounds']:
+        kwargs['max_rounds'] = max_rounds
+    if setup['logger_cls'] is not None:
+        # Reuse an injected logger across cases; only construct one when
+        # running this setup standalone
+        if logger is None:
+            logger = setup['logger_cls']()
+        logger.set_experiment_id(
+            f"{case_name.lower().replace(' ', '_')}_{setup['id_suffix']}")
+        kwargs['logger'] = logger
+
+    start_time = time.perf_counter()
+    result = setup['runner'](**kwargs)
+    execution_time = time.perf_counter() - start_time
 
-def run_cot_test(problem, ground_truth, case_name):
-    """Run case with Chain-of-Thought baseline."""
-    print("\n" + "="*80)
-    print(f"RUNNING CHAIN-OF-THOUGHT BASELINE - {case_name}")
-    print("="*80)
-    
-    start_time = time.time()
-    result = run_cot_experiment(
-        problem=problem,
-        ground_truth=ground_truth,
-        enable_logging=True
-    )
-    execution_time = time.time() - start_time
-    
     metrics = {
-        'system': 'Chain-of-Thought (CoT)',
+        'system': setup['name'],
         'case': case_name,
         'final_answer': result.get('final_answer', 'N/A'),
         'correct': result.get('correct', False),
-        'total_tokens': result.get('tokens_used', 0),
-        'execution_time': execution_time,
-        'rounds': 1,
-        'model_backend': result.get('model_backend', 'N/A')
+        'total_tokens': result.get(setup['token_key'], 0),
+        'execution_time': execution_time
     }
-    
+    metrics.update(setup['extras'](result))
+
     print(f"\nFinal Answer: {metrics['final_answer']}")
     print(f"Correct: {metrics['correct']}")
     print(f"Total Tokens: {metrics['total_tokens']}")
     print(f"Execution Time: {metrics['execution_time']:.2f} seconds")
-    
+    for label, key in setup['print_keys']:
+        print(f"{label}: {metrics[key]}")
+
+    store_cache(cache_key, metrics, problem)
     return metrics
 
 
+def run_batched_single_shot_tests(cases):
+    """Run Static MAS and CoT on all cases with one batched request per system.
+
+    Returns a dict mapping case name -> {system name -> metrics} for the
+    systems that were batched successfully. Cases run per-system in a single
+    row-marshaled prompt; per-case token/time figures are the batch totals
+    split evenly.
+    """
+    problems = [case['problem'] for case in cases]
+    ground_truths = [case['ground_truth'] for case in cases]
+    prefetched = {case['name']: {} for case in cases}
+
+    print("\n" + _EQ80)
+    print(f"BATCH MODE: running {len(cases)} cases per single-shot system in one request")
+    print(_EQ80)
+
+    try:
+        static_results = run_static_batch(problems, ground_truths)
+        for case, result in zip(cases, static_results):
+            prefetched[case['name']]['Static MAS'] = {
+                'system': 'Static MAS',
+                'case': case['name'],
+                'final_answer': result.get('final_answer', 'N/A'),
+                'correct': result.get('correct', False),
+                'total_tokens': result.get('total_tokens', 0),
+                'execution_time': result.get('execution_time', 0),
+                'rounds': 1,
+                'num_agents': len(result.get('agents', [])),
+                'batched': result.get('batched', False)
+            }
+    except Exception as e:
+        print(f"\nERROR running batched Static MAS: {e}")
+        import traceback
+        traceback.print_exc()
+
+    try:
+        cot_results = run_cot_batch(problems, ground_truths)
+        for case, result in zip(cases, cot_results):
+            prefetched[case['name']]['Chain-of-Thought (CoT)'] = {
+                'system': 'Chain-of-Thought (CoT)',
+                'case': case['name'],
+                'final_answer': result.get('final_answer', 'N/A'),
+                'correct': result.get('correct', False),
+                'total_tokens': result.get('tokens_used', 0),
+                'execution_time': result.get('execution_time', 0),
+                'rounds': 1,
+                'model_backend': result.get('model_backend', 'N/A'),
+                'batched': result.get('batched', False)
+            }
+    except Exception as e:
+        print(f"\nERROR running batched CoT: {e}")
+        import traceback
+        traceback.print_exc()
+
+    return prefetched
+
+
 def compare_results(results, case_name, problem, ground_truth):
     """Compare results from all MAS setups for a specific case."""
-    print("\n" + "="*80)
-    print(f"COMPARISON RESULTS - {case_name}")
-    print("="*80)
-    print(f"\nProblem: {problem[:150]}...")
-    print(f"Ground Truth: {ground_truth}\n")
-    
+    # Build the whole comparison report in a StringIO buffer and flush it to
+    # stdout in one write, instead of one write() syscall per print.
+    buf = io.StringIO()
+
+    def w(line=""):
+        buf.write(line + "\n")
+
+    w("\n" + _EQ80)
+    w(f"COMPARISON RESULTS - {case_name}")
+    w(_EQ80)
+    w(f"\nProblem: {problem[:150]}...")
+    w(f"Ground Truth: {ground_truth}\n")
+
     # Print comparison table
-    print(f"{'System':<30} {'Answer':<20} {'Correct':<10} {'Tokens':<10} {'Time (s)':<12} {'Rounds':<10}")
-    print("-" * 110)
-    
+    w(_HEAD_FMT.format(system='System', answer='Answer', correct='Correct',
+                       tokens='Tokens', time='Time (s)', rounds='Rounds'))
+    w(_DASH110)
+
     for result in results:
-        answer_str = str(result['final_answer'])[:18]
-        correct_str = "YES" if result['correct'] else "NO"
-        rounds_str = str(result.get('rounds', 'N/A'))
-        print(f"{result['system']:<30} {answer_str:<20} {correct_str:<10} {result['total_tokens']:<10} {result['execution_time']:<12.2f} {rounds_str:<10}")
-    
+        w(_ROW_FMT.format(
+            system=result['system'],
+            answer=str(result['final_answer'])[:18],
+            correct="YES" if result['correct'] else "NO",
+            tokens=result['total_tokens'],
+            time=result['execution_time'],
+            rounds=str(result.get('rounds', 'N/A'))
+        ))
+
     # Find best performers
-    print("\n" + "="*80)
-    print("PERFORMANCE ANALYSIS")
-    print("="*80)
-    
+    w("\n" + _EQ80)
+    w("PERFORMANCE ANALYSIS")
+    w(_EQ80)
+
+    # Single pass over results: accumulate accuracy lists and token/time
+    # minima (with their winning systems) together instead of re-scanning
+    # the list for each statistic.
+    correct_systems = []
+    incorrect_systems = []
+    min_tokens, most_efficient = float('inf'), []
+    min_time, fastest = float('inf'), []
+
+    for r in results:
+        if r['correct']:
+            correct_systems.append(r['system'])
+        else:
+            incorrect_systems.append(r['system'])
+
+        tokens = r['total_tokens']
+        if tokens > 0:
+            if tokens < min_tokens:
+                min_tokens, most_efficient = tokens, [r['system']]
+            elif tokens == min_tokens:
+                most_efficient.append(r['system'])
+
+        exec_time = r['execution_time']
+        if exec_time < min_time:
+            min_time, fastest = exec_time, [r['system']]
+        elif exec_time == min_time:
+            fastest.append(r['system'])
+
     # Accuracy
-    correct_systems = [r['system'] for r in results if r['correct']]
-    print(f"\nAccuracy:")
-    print(f"  Correct: {', '.join(correct_systems) if correct_systems else 'None'}")
-    print(f"  Incorrect: {', '.join([r['system'] for r in results if not r['correct']]) if any(not r['correct'] for r in results) else 'None'}")
-    
+    w(f"\nAccuracy:")
+    w(f"  Correct: {', '.join(correct_systems) if correct_systems else 'None'}")
+    w(f"  Incorrect: {', '.join(incorrect_systems) if incorrect_systems else 'None'}")
+
     # Token efficiency
-    if any(r['total_tokens'] > 0 for r in results):
-        min_tokens = min(r['total_tokens'] for r in results if r['total_tokens'] > 0)
-        most_efficient = [r['system'] for r in results if r['total_tokens'] == min_tokens]
-        print(f"\nToken Efficiency (fewest tokens):")
-        print(f"  Most Efficient: {', '.join(most_efficient)} ({min_tokens} tokens)")
+    if most_efficient:
+        w(f"\nToken Efficiency (fewest tokens):")
+        w(f"  Most Efficient: {', '.join(most_efficient)} ({min_tokens} tokens)")
         for r in results:
             if r['total_tokens'] != min_tokens and r['total_tokens'] > 0:
                 diff = r['total_tokens'] - min_tokens
                 pct = (diff / min_tokens) * 100
-                print(f"  {r['system']}: {r['total_tokens']} tokens (+{diff}, +{pct:.1f}%)")
-    
+                w(f"  {r['system']}: {r['total_tokens']} tokens (+{diff}, +{pct:.1f}%)")
+
     # Speed
-    min_time = min(r['execution_time'] for r in results)
-    fastest = [r['system'] for r in results if r['execution_time'] == min_time]
-    print(f"\nSpeed (fastest execution):")
-    print(f"  Fastest: {', '.join(fastest)} ({min_time:.2f}s)")
+    w(f"\nSpeed (fastest execution):")
+    w(f"  Fastest: {', '.join(fastest)} ({min_time:.2f}s)")
     for r in results:
         if r['execution_time'] != min_time:
             diff = r['execution_time'] - min_time
             pct = (diff / min_time) * 100
-            print(f"  {r['system']}: {r['execution_time']:.2f}s (+{diff:.2f}s, +{pct:.1f}%)")
-    
-    print("\n" + "="*80)
+            w(f"  {r['system']}: {r['execution_time']:.2f}s (+{diff:.2f}s, +{pct:.1f}%)")
+
+    w("\n" + _EQ80)
+
+    # Single flush to stdout for the whole report
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
+
 
+def run_case(case_data, is_hard=False, prefetched=None,
+             orig_logger=None, bmas_logger=None):
+    """Run a single case across all 4 MAS setups.
 
-def run_case(case_data, is_hard=False):
-    """Run a single case across all 4 MAS setups."""
+    Args:
+        case_data: Case dictionary with name/problem/ground_truth
+        is_hard: Whether to allow extra rounds for the iterative systems
+        prefetched: Optional {system name -> metrics} computed by a batched run;
+                    those systems are reused instead of being re-run per-case
+        orig_logger: Shared orig_impl_bMAS logger (constructed once per run)
+        bmas_logger: Shared bMAS logger (constructed once per run)
+    """
+    prefetched = prefetched or {}
     case_name = case_data["name"]
     problem = case_data["problem"]
     ground_truth = case_data["ground_truth"]
     max_rounds = 6 if is_hard else 4
     
-    print("\n" + "="*80)
+    print("\n" + _EQ80)
     print(f"RUNNING TEST CASE: {case_name}")
-    print("="*80)
+    print(_EQ80)
     print(f"\nProblem: {problem[:200]}...")
     print(f"Ground Truth: {ground_truth}")
     print("\nThis case will be run with:")
@@ -263,143 +495,207 @@ def run_case(case_data, is_hard=False):
     print("  2. bMAS (LbMAS) - Paper Style Prompts")
     print("  3. Static MAS - Parallel single-pass MAS")
     print("  4. Chain-of-Thought (CoT) - Baseline single-agent approach")
-    print("="*80)
+    print(_EQ80)
     
     all_results = []
-    
-    # Run each MAS setup
-    try:
-        result_orig_bmas = run_orig_bmas_test(problem, ground_truth, case_name, max_rounds)
-        all_results.append(result_orig_bmas)
-    except Exception as e:
-        print(f"\nERROR running orig_impl_bMAS: {e}")
-        import traceback
-        traceback.print_exc()
-    
-    try:
-        result_bmas = run_bmas_test(problem, ground_truth, case_name, max_rounds)
-        all_results.append(result_bmas)
-    except Exception as e:
-        print(f"\nERROR running bMAS: {e}")
-        import traceback
-        traceback.print_exc()
-    
-    try:
-        result_static = run_static_mas_test(problem, ground_truth, case_name)
-        all_results.append(result_static)
-    except Exception as e:
-        print(f"\nERROR running Static MAS: {e}")
-        import traceback
-        traceback.print_exc()
-    
-    try:
-        result_cot = run_cot_test(problem, ground_truth, case_name)
-        all_results.append(result_cot)
-    except Exception as e:
-        print(f"\nERROR running CoT: {e}")
-        import traceback
-        traceback.print_exc()
-    
+
+    # Run each MAS setup from the dispatch table; batched (prefetched)
+    # results are reused instead of re-running the system per-case
+    shared_loggers = {'orig_bmas': orig_logger, 'bmas': bmas_logger}
+    for setup in SETUPS:
+        if setup['name'] in prefetched:
+            all_results.append(prefetched[setup['name']])
+            continue
+        try:
+            all_results.append(_run_setup(
+                setup, problem, ground_truth, case_name, max_rounds,
+                logger=shared_loggers.get(setup.get('id_suffix'))
+            ))
+        except Exception as e:
+            print(f"\nERROR running {setup['name']}: {e}")
+            import traceback
+            traceback.print_exc()
+
     # Compare results
     if all_results:
         compare_results(all_results, case_name, problem, ground_truth)
         
-        print("\n" + "="*80)
+        print("\n" + _EQ80)
         print(f"{case_name} - ALL TESTS COMPLETE")
-        print("="*80)
+        print(_EQ80)
         print("\nDetailed trace files are available in:")
         for result in all_results:
             if 'trace_txt' in result and result['trace_txt'] != 'N/A':
                 print(f"  {result['system']}: {result['trace_txt']}")
-        print("="*80)
+        print(_EQ80)
     else:
         print(f"\nERROR: No results were collected for {case_name}. Check errors above.")
     
     return all_results
 
 
-if __name__ == "__main__":
-    print("\n" + "="*80)
-    print("RUNNING ALL TEST CASES ACROSS ALL 4 MAS SETUPS")
-    print("="*80)
+def run_case_streamed(case_data, is_hard, batched_results, completed_cases,
+                      orig_logger=None, bmas_logger=None):
+    """Run one case (unless already completed) and stream its summary to disk."""
+    name = case_data['name']
+    if name in completed_cases:
+        print(f"\n[RESUME] Skipping {name} (summary already in {RUNS_JSONL})")
+        return
+    results = run_case(case_data, is_hard=is_hard,
+                       prefetched=batched_results.get(name),
+                       orig_logger=orig_logger, bmas_logger=bmas_logger)
+    append_case_summary(name, results)
+
+
+def main(argv=None):
+    """Run the selected cases across all 4 MAS setups and compare results."""
+    parser = argparse.ArgumentParser(
+        description="Run test cases across all 4 MAS setups and compare results"
+    )
+    parser.add_argument(
+        "--cases", default="A,B,C,D",
+        help="Comma-separated case labels to run (subset of A,B,C,D)"
+    )
+    parser.add_argument(
+        "--resume", action="store_true",
+        help=f"Skip cases whose summaries are already in {RUNS_JSONL}"
+    )
+    args = parser.parse_args(argv)
+
+    labels = [label.strip().upper() for label in args.cases.split(",") if label.strip()]
+    unknown = [label for label in labels if label not in CASES]
+    if unknown:
+        parser.error(f"Unknown case label(s): {', '.join(unknown)}. Available: {', '.join(CASES)}")
+    selected_cases = [CASES[label] for label in labels]
+
+    print("\n" + _EQ80)
+    print("RUNNING TEST CASES ACROSS ALL 4 MAS SETUPS")
+    print(_EQ80)
     print("\nThis script will run:")
-    print("  EASY CASES:")
-    print("    Case A: Mathematical Problem (Drinkets to Trinkets)")
-    print("    Case B: Common Knowledge Question (Why is the sky blue?)")
-    print("\n  HARD CASES:")
-    print("    Case C: Theoretical Physics (Maxwell's Equations)")
-    print("    Case D: Astrophysics (Supermassive Black Hole Location)")
+    for case in selected_cases:
+        difficulty = "HARD" if case in HARD_CASES else "EASY"
+        print(f"  [{difficulty}] {case['name']}")
     print("\nEach case will be tested with:")
     print("  1. orig_impl_bMAS - Original Implementation Prompts")
     print("  2. bMAS (LbMAS) - Paper Style Prompts")
     print("  3. Static MAS - Parallel single-pass MAS")
     print("  4. Chain-of-Thought (CoT) - Baseline single-agent approach")
     print("\nResults will be compared at the end of each case.")
-    print("="*80)
-    
-    all_case_results = {}
-    
-    # Run Easy Cases
-    print("\n\n" + "#"*80)
-    print("#"*80)
-    print("STARTING EASY CASES")
-    print("#"*80)
-    print("#"*80)
-    
-    case_a_results = run_case(EASY_CASE_A, is_hard=False)
-    all_case_results['Case A'] = case_a_results
-    
-    case_b_results = run_case(EASY_CASE_B, is_hard=False)
-    all_case_results['Case B'] = case_b_results
-    
-    # Run Hard Cases
-    print("\n\n" + "#"*80)
-    print("#"*80)
-    print("STARTING HARD CASES")
-    print("#"*80)
-    print("#"*80)
-    
-    case_c_results = run_case(HARD_CASE_C, is_hard=True)
-    all_case_results['Case C'] = case_c_results
-    
-    case_d_results = run_case(HARD_CASE_D, is_hard=True)
-    all_case_results['Case D'] = case_d_results
-    
-    # Final summary
-    print("\n\n" + "="*80)
-    print("FINAL SUMMARY - ALL CASES")
-    print("="*80)
-    
+    print(_EQ80)
+
+    # Resume mode: reuse case summaries already streamed to RUNS_JSONL and
+    # only run the missing cases. A fresh (non-resume) run starts a new file.
+    completed_cases = load_case_summaries() if args.resume else {}
+    if not args.resume and os.path.exists(RUNS_JSONL):
+        os.remove(RUNS_JSONL)
+
+    # One logger per iterative system, shared across all cases; each test
+    # re-points it at the case via set_experiment_id() instead of paying
+    # logger setup (output dir creation etc.) per case
+    orig_logger = OrigExperimentLogger()
+    bmas_logger = ExperimentLogger()
+
+    # In batch mode the single-shot systems solve all selected cases in one
+    # request each; per-case results are reused below via run_case(prefetched=)
+    batched_results = {}
+    if BATCH_CASES:
+        batched_results = run_batched_single_shot_tests(selected_cases)
+
+    # Run the selected cases (easy first, then hard - CASES is in run order)
+    printed_hard_banner = False
+    if any(case not in HARD_CASES for case in selected_cases):
+        print("\n\n" + _HASH80)
+        print(_HASH80)
+        print("STARTING EASY CASES")
+        print(_HASH80)
+        print(_HASH80)
+
+    # Single-worker executor bounds the speculative lookahead to one case:
+    # while case i runs, case i+1's cache entries are prefetched in the
+    # background (further lookahead would risk wasted work on failures)
+    with ThreadPoolExecutor(max_workers=1) as prefetcher:
+        for i, case in enumerate(selected_cases):
+            is_hard = case in HARD_CASES
+            if is_hard and not printed_hard_banner:
+                printed_hard_banner = True
+                print("\n\n" + _HASH80)
+                print(_HASH80)
+                print("STARTING HARD CASES")
+                print(_HASH80)
+                print(_HASH80)
+            if i + 1 < len(selected_cases):
+                prefetcher.submit(_prewarm_case, selected_cases[i + 1],
+                                  selected_cases[i + 1] in HARD_CASES)
+            run_case_streamed(case, is_hard, batched_results, completed_cases,
+                              orig_logger=orig_logger, bmas_logger=bmas_logger)
+
+    # Final summary - re-read the slim per-case summaries from disk instead
+    # of holding every case's full results in memory for the whole run
+    all_case_results = load_case_summaries()
+
+    # Built in a buffer and flushed with one write
+    buf = io.StringIO()
+
+    def w(line=""):
+        buf.write(line + "\n")
+
+    w("\n\n" + _EQ80)
+    w("FINAL SUMMARY - ALL CASES")
+    w(_EQ80)
+
     for case_name, results in all_case_results.items():
-        print(f"\n{case_name}:")
+        w(f"\n{case_name}:")
         correct_count = sum(1 for r in results if r.get('correct', False))
         total_count = len(results)
-        print(f"  Systems that got correct answer: {correct_count}/{total_count}")
-        expected_truth = EASY_CASE_A['ground_truth'] if 'Case A' in case_name else \
-                        EASY_CASE_B['ground_truth'] if 'Case B' in case_name else \
-                        HARD_CASE_C['ground_truth'] if 'Case C' in case_name else \
-                        HARD_CASE_D['ground_truth']
+        w(f"  Systems that got correct answer: {correct_count}/{total_count}")
+        expected_truth = GROUND_TRUTHS.get(case_name, "?")
         for r in results:
             status = "[CORRECT]" if r.get('correct', False) else "[INCORRECT]"
-            print(f"    {status} {r['system']}: {r.get('final_answer', 'N/A')} (Expected: {expected_truth})")
-    
+            w(f"    {status} {r['system']}: {r.get('final_answer', 'N/A')} (Expected: {expected_truth})")
+
     # Overall statistics
-    print("\n" + "="*80)
-    print("OVERALL STATISTICS")
-    print("="*80)
-    
-    systems = ['orig_impl_bMAS (Original Prompts)', 'bMAS (Paper Prompts)', 'Static MAS', 'Chain-of-Thought (CoT)']
+    w("\n" + _EQ80)
+    w("OVERALL STATISTICS")
+    w(_EQ80)
+
+    systems = [s['name'] for s in SETUPS]
+
+    # Flatten every result row once; per-system aggregates are then vectorized
+    # masks over the structured array instead of re-scanning the nested dicts
+    # per system
+    rows = None
+    if NUMPY_AVAILABLE:
+        rows = np.array(
+            [(r.get('system', ''), bool(r.get('correct', False)),
+              r.get('total_tokens', 0), r.get('execution_time', 0.0))
+             for case_results in all_case_results.values() for r in case_results],
+            dtype=[('system', 'U40'), ('correct', 'bool'),
+                   ('tokens', 'i8'), ('time', 'f4')]
+        )
+
     for system in systems:
-        correct = sum(1 for case_results in all_case_results.values() 
-                     for r in case_results if r.get('system') == system and r.get('correct', False))
-        total = sum(1 for case_results in all_case_results.values() 
-                   for r in case_results if r.get('system') == system)
+        if rows is not None:
+            mask = rows['system'] == system
+            correct = int(rows['correct'][mask].sum())
+            total = int(mask.sum())
+        else:
+            correct = sum(1 for case_results in all_case_results.values()
+                         for r in case_results if r.get('system') == system and r.get('correct', False))
+            total = sum(1 for case_results in all_case_results.values()
+                       for r in case_results if r.get('system') == system)
         accuracy = (correct / total * 100) if total > 0 else 0
-        print(f"{system}: {correct}/{total} correct ({accuracy:.1f}%)")
-    
-    print("\n" + "="*80)
-    print("ALL EXPERIMENTS COMPLETE")
-    print("="*80)
-    print("\nCheck individual case outputs above for detailed comparisons.")
-    print("="*80)
+        w(f"{system}: {correct}/{total} correct ({accuracy:.1f}%)")
 
+    w("\n" + _EQ80)
+    w("ALL EXPERIMENTS COMPLETE")
+    w(_EQ80)
+    w("\nCheck individual case outputs above for detailed comparisons.")
+    w(_EQ80)
+
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
+
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ Usage:
 import argparse
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import List, Optional
 
 # Add current directory to path
@@ -16,12 +17,52 @@ _current_dir = os.path.dirname(os.path.abspath(__file__))
 if _current_dir not in sys.path:
     sys.path.insert(0, _current_dir)
 
-from benchmark_evaluator.benchmark_loader import BenchmarkLoader
-from benchmark_evaluator.benchmark_runner import BenchmarkRunner
+from benchmark_evaluator.constants import BENCHMARKS
 from benchmark_evaluator.results_aggregator import ResultsAggregator
 
+# BenchmarkRunner transitively imports all four MAS systems, which is
+# seconds of startup; it is imported lazily in the paths that actually run
+# benchmarks so --help and --generate-tables stay fast.
 
-def main():
+
+def _print_summary(summary):
+    """Print the per-system results block for one finished benchmark."""
+    if 'systems' in summary:
+        print("\nResults Summary:")
+        print("-"*80)
+        for system_name, metrics in summary['systems'].items():
+            print(f"{metrics['display_name']:<25} "
+                  f"Accuracy: {metrics['accuracy']:.2f}% | "
+                  f"Avg Tokens: {metrics['avg_tokens_per_problem']:.0f} | "
+                  f"Avg Time: {metrics['avg_time_per_problem']:.2f}s")
+
+
+def _run_one(benchmark_name, systems, max_problems, max_rounds, data_parallel, output_dir,
+             use_dataset_cache=True, use_result_cache=True, sample_strategy="random"):
+    """Run a single benchmark in a worker process.
+
+    Top-level (picklable) so ProcessPoolExecutor can dispatch it; each worker
+    builds its own BenchmarkRunner to avoid sharing mutable state across
+    processes.
+    """
+    from benchmark_evaluator.benchmark_runner import BenchmarkRunner
+
+    runner = BenchmarkRunner(output_dir=output_dir)
+    result = runner.run_benchmark(
+        benchmark_name=benchmark_name,
+        systems=systems,
+        max_problems=max_problems,
+        max_rounds=max_rounds,
+        random_sample=True,
+        data_parallel=data_parallel,
+        use_dataset_cache=use_dataset_cache,
+        use_result_cache=use_result_cache,
+        sample_strategy=sample_strategy
+    )
+    return benchmark_name, result['summary']
+
+
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description="Benchmark evaluation for MAS systems",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -55,7 +96,7 @@ Available benchmarks:
     parser.add_argument(
         '--benchmark',
         type=str,
-        choices=['mmlu', 'arc_challenge', 'gpqa_diamond', 'bbh', 'math', 'gsm8k'],
+        choices=list(BENCHMARKS),
         help='Benchmark to run'
     )
     
@@ -93,6 +134,41 @@ Available benchmarks:
         help='Maximum rounds for iterative systems (default: 4)'
     )
     
+    parser.add_argument(
+        '--benchmark-workers',
+        type=int,
+        default=1,
+        help='Number of benchmarks to run in parallel worker processes (default: 1 = sequential)'
+    )
+
+    parser.add_argument(
+        '--data-parallel',
+        type=int,
+        default=4,
+        help='Number of problems to dispatch concurrently per system (default: 4, use 1 for sequential)'
+    )
+
+    parser.add_argument(
+        '--sample-strategy',
+        type=str,
+        choices=['random', 'reservoir'],
+        default='random',
+        help='random = sample indices from the downloaded dataset; '
+             'reservoir = stream the split and sample without materializing it'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignore cached sampled problems and reload benchmark datasets from source'
+    )
+
+    parser.add_argument(
+        '--no-result-cache',
+        action='store_true',
+        help='Re-run every problem even if a cached result exists for it'
+    )
+
     parser.add_argument(
         '--generate-tables',
         action='store_true',
@@ -106,14 +182,14 @@ Available benchmarks:
         help='Output directory for results (default: benchmark_evaluator/results)'
     )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Generate tables mode
     if args.generate_tables:
         print("Generating comparison tables from existing results...")
         aggregator = ResultsAggregator(results_dir=args.output_dir)
         
-        benchmark_names = ['mmlu', 'arc_challenge', 'gpqa_diamond', 'bbh', 'math', 'gsm8k']
+        benchmark_names = list(BENCHMARKS)
         benchmark_results = aggregator.aggregate_all_benchmarks(benchmark_names)
         
         if not benchmark_results:
@@ -150,7 +226,7 @@ Available benchmarks:
     
     # Determine benchmarks to run
     if args.all:
-        benchmarks_to_run = ['mmlu', 'arc_challenge', 'gpqa_diamond', 'bbh', 'math', 'gsm8k']
+        benchmarks_to_run = list(BENCHMARKS)
     elif args.benchmark:
         benchmarks_to_run = [args.benchmark]
     else:
@@ -173,46 +249,72 @@ Available benchmarks:
             print("Cancelled.")
             return
     
-    # Initialize runner
-    runner = BenchmarkRunner(output_dir=args.output_dir)
-    
-    # Run benchmarks
+    # Run benchmarks - sequentially by default, or across worker processes
+    # when --benchmark-workers > 1 (benchmarks are independent, so they
+    # parallelize cleanly; child output interleaves on stdout)
     all_results = {}
-    
-    for benchmark_name in benchmarks_to_run:
-        print(f"\n{'='*80}")
-        print(f"Starting evaluation: {benchmark_name}")
-        print(f"{'='*80}")
-        
-        try:
-            result = runner.run_benchmark(
-                benchmark_name=benchmark_name,
-                systems=args.systems,
-                max_problems=max_problems,
-                max_rounds=args.max_rounds,
-                random_sample=True  # Randomly sample problems for better coverage
-            )
-            all_results[benchmark_name] = result['summary']
-            
+    workers = min(args.benchmark_workers, len(benchmarks_to_run))
+
+    if workers <= 1:
+        from benchmark_evaluator.benchmark_runner import BenchmarkRunner
+
+        runner = BenchmarkRunner(output_dir=args.output_dir)
+
+        for benchmark_name in benchmarks_to_run:
             print(f"\n{'='*80}")
-            print(f"Completed: {benchmark_name}")
+            print(f"Starting evaluation: {benchmark_name}")
             print(f"{'='*80}")
-            
-            # Print summary
-            if 'systems' in result['summary']:
-                print("\nResults Summary:")
-                print("-"*80)
-                for system_name, metrics in result['summary']['systems'].items():
-                    print(f"{metrics['display_name']:<25} "
-                          f"Accuracy: {metrics['accuracy']:.2f}% | "
-                          f"Avg Tokens: {metrics['avg_tokens_per_problem']:.0f} | "
-                          f"Avg Time: {metrics['avg_time_per_problem']:.2f}s")
-        
-        except Exception as e:
-            print(f"\nERROR running {benchmark_name}: {e}")
-            import traceback
-            traceback.print_exc()
-            continue
+
+            try:
+                result = runner.run_benchmark(
+                    benchmark_name=benchmark_name,
+                    systems=args.systems,
+                    max_problems=max_problems,
+                    max_rounds=args.max_rounds,
+                    random_sample=True,  # Randomly sample problems for better coverage
+                    data_parallel=args.data_parallel,
+                    use_dataset_cache=not args.no_cache,
+                    use_result_cache=not args.no_result_cache,
+                    sample_strategy=args.sample_strategy
+                )
+                all_results[benchmark_name] = result['summary']
+
+                print(f"\n{'='*80}")
+                print(f"Completed: {benchmark_name}")
+                print(f"{'='*80}")
+
+                _print_summary(result['summary'])
+
+            except Exception as e:
+                print(f"\nERROR running {benchmark_name}: {e}")
+                import traceback
+                traceback.print_exc()
+                continue
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(_run_one, benchmark_name, args.systems,
+                                max_problems, args.max_rounds,
+                                args.data_parallel, args.output_dir,
+                                not args.no_cache,
+                                not args.no_result_cache,
+                                args.sample_strategy): benchmark_name
+                for benchmark_name in benchmarks_to_run
+            }
+            for future in as_completed(futures):
+                benchmark_name = futures[future]
+                try:
+                    finished_name, summary = future.result()
+                    all_results[finished_name] = summary
+
+                    print(f"\n{'='*80}")
+                    print(f"Completed: {finished_name}")
+                    print(f"{'='*80}")
+                    _print_summary(summary)
+                except Exception as e:
+                    print(f"\nERROR running {benchmark_name}: {e}")
+                    import traceback
+                    traceback.print_exc()
     
     # Generate tables if we have results
     if all_results:
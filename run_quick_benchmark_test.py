@@ -11,8 +11,7 @@ _current_dir = os.path.dirname(os.path.abspath(__file__))
 if _current_dir not in sys.path:
     sys.path.insert(0, _current_dir)
 
-from benchmark_evaluator.benchmark_runner import BenchmarkRunner
-from benchmark_evaluator.results_aggregator import ResultsAggregator
+from benchmark_evaluator.constants import BENCHMARKS
 
 
 def main():
@@ -32,8 +31,13 @@ def main():
         # Non-interactive mode, auto-confirm
         print("Non-interactive mode detected. Proceeding automatically...")
     
+    # Imported here so the banner and confirmation prompt appear instantly
+    # instead of after the MAS systems finish importing
+    from benchmark_evaluator.benchmark_runner import BenchmarkRunner
+    from benchmark_evaluator.results_aggregator import ResultsAggregator
+
     # Run with small samples
-    benchmarks = ['mmlu', 'arc_challenge', 'gpqa_diamond', 'bbh', 'math', 'gsm8k']
+    benchmarks = list(BENCHMARKS)
     sample_size = 5
     
     runner = BenchmarkRunner(output_dir="benchmark_evaluator/results")
@@ -10,8 +10,15 @@ class StaticAgent(ABC):
     Base class for all agents in the Static MAS system.
     No blackboard - agents work independently.
     """
-    
-    def __init__(self, name: str, role: str, llm_backend: str):
+
+    # Fixed attribute layout: agents are created per problem, so long
+    # benchmark runs allocate thousands of instances; slots drop the
+    # per-instance __dict__. Subclasses adding attributes must declare
+    # their own __slots__.
+    __slots__ = ('name', 'role', 'llm_backend', 'system_prompt', 'store_raw')
+
+    def __init__(self, name: str, role: str, llm_backend: str,
+                 store_raw: bool = False):
         """
         Initialize an agent.
         
@@ -19,11 +26,14 @@ class StaticAgent(ABC):
             name: Unique name for the agent
             role: Role description (e.g., "mathematics_expert", "planner")
             llm_backend: LLM backend identifier ("llama" or "qwen")
+            store_raw: Keep raw_response/parsed_response in result dicts
+                       (debugging; they dominate trace size)
         """
         self.name = name
         self.role = role
         self.llm_backend = llm_backend
         self.system_prompt = ""
+        self.store_raw = store_raw
     
     @abstractmethod
     def solve(self, problem: str) -> Dict[str, Any]:
@@ -0,0 +1,178 @@
+"""
+Request coalescer for Static MAS agent LLM calls.
+
+run_static_experiment dispatches every agent's solve() concurrently from a
+ThreadPoolExecutor, so several LLM requests for the same problem arrive
+within milliseconds of each other. When coalescing is enabled, those
+concurrent calls are gathered for a short window and marshaled into one
+combined backend request per model (the same task-marshaling scheme
+run_static_batch uses across problems), cutting the number of HTTP
+round-trips per static-MAS invocation from len(agents) to the number of
+distinct backends in the pool.
+
+Opt-in via MAS_COALESCE_LLM=1 (like MAS_BATCH_CASES): marshaled prompts can
+change model outputs, so the default path stays one request per agent.
+MAS_COALESCE_DELAY (seconds) and MAS_COALESCE_BATCH tune the window.
+"""
+import os
+import re
+import threading
+import sys
+
+_parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if _parent_dir not in sys.path:
+    sys.path.insert(0, _parent_dir)
+from llm_integration.api import call_llm, estimate_tokens
+
+COALESCE_ENABLED = os.getenv("MAS_COALESCE_LLM", "").lower() in ("1", "true")
+COALESCE_DELAY = float(os.getenv("MAS_COALESCE_DELAY", "0.05"))
+COALESCE_BATCH = int(os.getenv("MAS_COALESCE_BATCH", "8"))
+
+_RESPONSE_SPLIT_RE = re.compile(r"(?m)^###\s*RESPONSE\s+(\d+)\s*$")
+
+
+class _PendingRequest:
+    """One caller's request, parked until the batch result is distributed."""
+
+    def __init__(self, prompt, model_name, system_prompt):
+        self.prompt = prompt
+        self.model_name = model_name
+        self.system_prompt = system_prompt
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class RequestCoalescer:
+    """
+    Gathers concurrent call_llm invocations into batched backend requests.
+
+    The first caller to find the queue empty becomes the leader: it waits up
+    to coalesce_delay seconds (or until max_batch requests are queued), then
+    drains the queue, issues one combined request per model, splits the
+    delimited response back out and wakes the waiting callers. Requests whose
+    combined response cannot be split cleanly fall back to individual calls,
+    so a model that ignores the marshaling format degrades to today's
+    behavior rather than failing.
+    """
+
+    def __init__(self, coalesce_delay: float = COALESCE_DELAY,
+                 max_batch: int = COALESCE_BATCH):
+        self.coalesce_delay = coalesce_delay
+        self.max_batch = max_batch
+        self._lock = threading.Lock()
+        self._pending = []
+        self._batch_full = threading.Event()
+
+    def submit(self, prompt, model_name=None, system_prompt=None):
+        """Submit one request; blocks until its response is available."""
+        request = _PendingRequest(prompt, model_name, system_prompt)
+        with self._lock:
+            self._pending.append(request)
+            is_leader = len(self._pending) == 1
+            if len(self._pending) >= self.max_batch:
+                self._batch_full.set()
+
+        if is_leader:
+            self._batch_full.wait(timeout=self.coalesce_delay)
+            with self._lock:
+                batch = self._pending
+                self._pending = []
+                self._batch_full.clear()
+            self._execute_batch(batch)
+
+        request.event.wait()
+        if request.error is not None:
+            raise request.error
+        return request.result
+
+    def _execute_batch(self, batch):
+        """Run a drained batch, grouped by model, and wake the callers."""
+        groups = {}
+        for request in batch:
+            groups.setdefault(request.model_name, []).append(request)
+
+        for model_name, group in groups.items():
+            if len(group) == 1:
+                self._run_individually(group)
+            else:
+                try:
+                    self._run_combined(model_name, group)
+                except Exception:
+                    self._run_individually(group)
+
+        for request in batch:
+            request.event.set()
+
+    def _run_individually(self, group):
+        """Per-request fallback: one backend call each, errors kept per caller."""
+        for request in group:
+            try:
+                request.result = call_llm(request.prompt, request.model_name,
+                                          system_prompt=request.system_prompt)
+            except Exception as e:
+                request.error = e
+
+    def _run_combined(self, model_name, group):
+        """Marshal a group into one request and split the response back out."""
+        sections = []
+        for i, request in enumerate(group, start=1):
+            task = [f"### TASK {i}"]
+            if request.system_prompt:
+                task.append(f"Role for this task: {request.system_prompt}")
+            task.append(request.prompt)
+            sections.append("\n".join(task))
+
+        combined_prompt = (
+            f"You will be given {len(group)} independent tasks. Answer each "
+            "one exactly as its instructions require, as if it were the only "
+            "task. Start each answer on its own line with the header "
+            "'### RESPONSE <task number>' and nothing else on that line.\n\n"
+            + "\n\n".join(sections)
+        )
+
+        response = call_llm(combined_prompt, model_name)
+        content = response["content"]
+
+        parts = {}
+        matches = list(_RESPONSE_SPLIT_RE.finditer(content))
+        for match, next_match in zip(matches, matches[1:] + [None]):
+            end = next_match.start() if next_match else len(content)
+            parts[int(match.group(1))] = content[match.end():end].strip()
+
+        if len(parts) < len(group):
+            raise ValueError("combined response missing per-task sections")
+
+        # Split token usage across callers proportionally to response length
+        total_tokens = response["metadata"].get("tokens_used", 0)
+        weights = [max(1, estimate_tokens(parts.get(i + 1, "")))
+                   for i in range(len(group))]
+        weight_sum = sum(weights)
+
+        for i, request in enumerate(group):
+            share = int(total_tokens * weights[i] / weight_sum)
+            request.result = {
+                "content": parts[i + 1],
+                "metadata": {
+                    "model": response["metadata"].get("model", model_name),
+                    "tokens_used": share,
+                    "coalesced": True,
+                    "batch_size": len(group)
+                }
+            }
+
+
+# Process-wide coalescer shared by all Static MAS agents
+_coalescer = RequestCoalescer()
+
+
+def coalesced_call_llm(prompt, model_name=None, system_prompt=None):
+    """
+    Drop-in replacement for call_llm used by Static MAS agents.
+
+    Routes through the shared coalescer when MAS_COALESCE_LLM is set,
+    otherwise calls the backend directly.
+    """
+    if not COALESCE_ENABLED:
+        return call_llm(prompt, model_name, system_prompt=system_prompt)
+    return _coalescer.submit(prompt, model_name, system_prompt=system_prompt)
@@ -3,209 +3,421 @@ Static agent implementations for Static MAS.
 All agents solve problems independently without blackboard.
 """
 from typing import Dict, Any
+import copy
+import functools
+import json
+import random
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from .base_agent import StaticAgent
 import sys
 import os
 
+# Retaining every agent's raw response and parsed dict multiplies trace
+# size for data the aggregators never read; keep them only when debugging
+STORE_RAW_RESPONSES = os.getenv("STATIC_MAS_DEBUG", "").lower() in ("1", "true")
+
 # Add parent directory to path to import shared modules
 parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
-from llm_integration.api import call_llm, parse_json_response, random_model_choice
-from static_mas.prompts import STATIC_PROMPTS
+from llm_integration.api import parse_json_response, random_model_choice, get_available_models
+from static_mas.prompts import build_prompt
+from .request_coalescer import coalesced_call_llm as call_llm
 
 
-class MathematicsExpertAgent(StaticAgent):
-    """Mathematics expert agent."""
-    
-    def __init__(self, name: str, llm_backend: str = None):
-        if llm_backend is None:
-            llm_backend = random_model_choice()
-        super().__init__(name, "mathematics_expert", llm_backend)
-        self.system_prompt = "You are an expert mathematician specializing in problem-solving, proofs, and mathematical reasoning."
-    
-    def solve(self, problem: str) -> Dict[str, Any]:
-        """Solve the problem using mathematical expertise."""
-        prompt = STATIC_PROMPTS["mathematics_expert"].format(problem=problem)
-        response = call_llm(prompt, self.llm_backend, system_prompt=self.system_prompt)
-        parsed = parse_json_response(response["content"])
-        
-        return {
-            "agent": self.name,
-            "role": self.role,
-            "answer": parsed.get("answer", response["content"]),
-            "confidence": parsed.get("confidence", 0.5),
-            "explanation": parsed.get("explanation", ""),
-            "raw_response": response["content"],
-            "tokens": response["metadata"].get("tokens_used", 0),
-            "parsed_response": parsed
-        }
+class AgentSpec:
+    """
+    Immutable description of one static agent role.
 
+    The expert classes differed only in their role string, system prompt and
+    which parsed keys may carry the answer; a spec record captures exactly
+    that, so every agent shares one solve() implementation.
+    """
 
-class PhysicsExpertAgent(StaticAgent):
-    """Physics expert agent."""
-    
-    def __init__(self, name: str, llm_backend: str = None):
-        if llm_backend is None:
-            llm_backend = random_model_choice()
-        super().__init__(name, "physics_expert", llm_backend)
-        self.system_prompt = "You are an expert physicist specializing in physical principles, mechanics, and scientific reasoning."
-    
-    def solve(self, problem: str) -> Dict[str, Any]:
-        """Solve the problem using physics expertise."""
-        prompt = STATIC_PROMPTS["physics_expert"].format(problem=problem)
-        response = call_llm(prompt, self.llm_backend, system_prompt=self.system_prompt)
-        parsed = parse_json_response(response["content"])
-        
-        return {
-            "agent": self.name,
-            "role": self.role,
-            "answer": parsed.get("answer", response["content"]),
-            "confidence": parsed.get("confidence", 0.5),
-            "explanation": parsed.get("explanation", ""),
-            "raw_response": response["content"],
-            "tokens": response["metadata"].get("tokens_used", 0),
-            "parsed_response": parsed
-        }
+    __slots__ = ('role', 'system_prompt', 'answer_keys', 'coerce_str')
 
+    def __init__(self, role: str, system_prompt: str,
+                 answer_keys: tuple = ("answer",), coerce_str: bool = False):
+        self.role = role
+        self.system_prompt = system_prompt
+        self.answer_keys = answer_keys
+        self.coerce_str = coerce_str
 
-class LogicReasoningExpertAgent(StaticAgent):
-    """Logic and reasoning expert agent."""
-    
-    def __init__(self, name: str, llm_backend: str = None):
-        if llm_backend is None:
-            llm_backend = random_model_choice()
-        super().__init__(name, "logic_reasoning_expert", llm_backend)
-        self.system_prompt = "You are an expert in logical reasoning, deductive and inductive reasoning, and problem-solving strategies."
-    
-    def solve(self, problem: str) -> Dict[str, Any]:
-        """Solve the problem using logical reasoning."""
-        prompt = STATIC_PROMPTS["logic_reasoning_expert"].format(problem=problem)
-        response = call_llm(prompt, self.llm_backend, system_prompt=self.system_prompt)
-        parsed = parse_json_response(response["content"])
-        
-        return {
-            "agent": self.name,
-            "role": self.role,
-            "answer": parsed.get("answer", response["content"]),
-            "confidence": parsed.get("confidence", 0.5),
-            "explanation": parsed.get("explanation", ""),
-            "raw_response": response["content"],
-            "tokens": response["metadata"].get("tokens_used", 0),
-            "parsed_response": parsed
-        }
 
+# One spec per predefined role. planner and decider also accept
+# "final_answer" from the model; planner additionally coerces structured
+# answers (its plans sometimes come back as lists) to strings.
+AGENT_SPECS = {
+    "mathematics_expert": AgentSpec(
+        "mathematics_expert",
+        "You are an expert mathematician specializing in problem-solving, proofs, and mathematical reasoning."
+    ),
+    "physics_expert": AgentSpec(
+        "physics_expert",
+        "You are an expert physicist specializing in physical principles, mechanics, and scientific reasoning."
+    ),
+    "logic_reasoning_expert": AgentSpec(
+        "logic_reasoning_expert",
+        "You are an expert in logical reasoning, deductive and inductive reasoning, and problem-solving strategies."
+    ),
+    "planner": AgentSpec(
+        "planner",
+        "You are a strategic planner who breaks down complex problems into manageable steps and solves them.",
+        answer_keys=("answer", "final_answer"),
+        coerce_str=True
+    ),
+    "decider": AgentSpec(
+        "decider",
+        "You are a decision-maker who evaluates problems and provides final answers.",
+        answer_keys=("answer", "final_answer")
+    ),
+    "general_expert": AgentSpec(
+        "general_expert",
+        "You are a general problem-solving expert with broad knowledge across multiple domains."
+    ),
+}
 
-class PlannerAgent(StaticAgent):
-    """Planner agent - creates plans and solves problems."""
-    
-    def __init__(self, name: str, llm_backend: str = None):
+
+class StaticAgentImpl(StaticAgent):
+    """Generic static agent; behavior comes entirely from its AgentSpec."""
+
+    __slots__ = ('spec',)
+
+    def __init__(self, name: str, spec: AgentSpec, llm_backend: str = None,
+                 store_raw: bool = STORE_RAW_RESPONSES):
         if llm_backend is None:
             llm_backend = random_model_choice()
-        super().__init__(name, "planner", llm_backend)
-        self.system_prompt = "You are a strategic planner who breaks down complex problems into manageable steps and solves them."
-    
+        super().__init__(name, spec.role, llm_backend, store_raw=store_raw)
+        self.spec = spec
+        self.system_prompt = spec.system_prompt
+
     def solve(self, problem: str) -> Dict[str, Any]:
-        """Solve the problem by creating a plan and executing it."""
-        prompt = STATIC_PROMPTS["planner"].format(problem=problem)
+        """Solve the problem in this agent's role."""
+        prompt = build_prompt(self.role, problem)
         response = call_llm(prompt, self.llm_backend, system_prompt=self.system_prompt)
         parsed = parse_json_response(response["content"])
-        
-        # Ensure answer is a string
-        answer = parsed.get("answer") or parsed.get("final_answer") or response["content"]
-        if not isinstance(answer, str):
+
+        answer = None
+        if isinstance(parsed, dict):
+            for key in self.spec.answer_keys:
+                answer = parsed.get(key)
+                if answer is not None:
+                    break
+        if answer is None:
+            answer = response["content"]
+        if self.spec.coerce_str and not isinstance(answer, str):
             answer = str(answer)
-        
-        return {
+
+        result = {
             "agent": self.name,
             "role": self.role,
             "answer": answer,
+            # Short display form, cut once here so summary loops don't
+            # re-stringify multi-kilobyte answers just to slice them
+            "answer_preview": (answer if isinstance(answer, str) else str(answer))[:60],
             "confidence": parsed.get("confidence", 0.5) if isinstance(parsed, dict) else 0.5,
             "explanation": parsed.get("explanation", "") if isinstance(parsed, dict) else "",
-            "raw_response": response["content"],
-            "tokens": response["metadata"].get("tokens_used", 0),
-            "parsed_response": parsed
+            "tokens": response["metadata"].get("tokens_used", 0)
         }
+        if self.store_raw:
+            result["raw_response"] = response["content"]
+            result["parsed_response"] = parsed
+        return result
 
 
-class DeciderAgent(StaticAgent):
-    """Decider agent - makes final decisions."""
-    
-    def __init__(self, name: str, llm_backend: str = None):
-        if llm_backend is None:
-            llm_backend = random_model_choice()
-        super().__init__(name, "decider", llm_backend)
-        self.system_prompt = "You are a decision-maker who evaluates problems and provides final answers."
+@functools.lru_cache(maxsize=1)
+def _pool_template() -> tuple:
+    """Build the fixed agent pool once per process.
+
+    The roster, prompts, and backend-diversity fix never change between
+    calls, so construction (including the backend draw) runs once and
+    create_static_agent_pool serves copies of this template.
+    """
+    # Create fixed set of agents
+    agent_configs = [
+        ("mathematics_expert_1", "mathematics_expert"),
+        ("mathematics_expert_2", "mathematics_expert"),
+        ("physics_expert", "physics_expert"),
+        ("logic_reasoning_expert", "logic_reasoning_expert"),
+        ("planner", "planner"),
+        ("decider", "decider"),
+        ("general_expert", "general_expert"),
+    ]
     
-    def solve(self, problem: str) -> Dict[str, Any]:
-        """Solve the problem and provide a final answer."""
-        prompt = STATIC_PROMPTS["decider"].format(problem=problem)
-        response = call_llm(prompt, self.llm_backend, system_prompt=self.system_prompt)
-        parsed = parse_json_response(response["content"])
-        
-        return {
-            "agent": self.name,
-            "role": self.role,
-            "answer": parsed.get("answer", parsed.get("final_answer", response["content"])),
-            "confidence": parsed.get("confidence", 0.5),
-            "explanation": parsed.get("explanation", ""),
-            "raw_response": response["content"],
-            "tokens": response["metadata"].get("tokens_used", 0),
-            "parsed_response": parsed
-        }
+    agents = [StaticAgentImpl(name, AGENT_SPECS[role])
+              for name, role in agent_configs]
 
+    # Two agents with identical role, prompt and backend would just sample
+    # the same distribution twice - 2x tokens for little diversity. When
+    # random_model_choice collides within a duplicated role, move the
+    # duplicate onto a backend that role is not using yet (if one exists).
+    backends_per_role = {}
+    for agent in agents:
+        used = backends_per_role.setdefault((agent.role, agent.system_prompt), set())
+        if agent.llm_backend in used:
+            alternatives = [m for m in get_available_models() if m not in used]
+            if alternatives:
+                agent.llm_backend = random.choice(alternatives)
+        used.add(agent.llm_backend)
 
-class GeneralExpertAgent(StaticAgent):
-    """General expert agent for diverse problems."""
-    
-    def __init__(self, name: str, llm_backend: str = None):
-        if llm_backend is None:
-            llm_backend = random_model_choice()
-        super().__init__(name, "general_expert", llm_backend)
-        self.system_prompt = "You are a general problem-solving expert with broad knowledge across multiple domains."
-    
-    def solve(self, problem: str) -> Dict[str, Any]:
-        """Solve the problem using general expertise."""
-        prompt = STATIC_PROMPTS["general_expert"].format(problem=problem)
-        response = call_llm(prompt, self.llm_backend, system_prompt=self.system_prompt)
-        parsed = parse_json_response(response["content"])
-        
-        return {
-            "agent": self.name,
-            "role": self.role,
-            "answer": parsed.get("answer", response["content"]),
-            "confidence": parsed.get("confidence", 0.5),
-            "explanation": parsed.get("explanation", ""),
-            "raw_response": response["content"],
-            "tokens": response["metadata"].get("tokens_used", 0),
-            "parsed_response": parsed
-        }
+    return tuple(agents)
 
 
 def create_static_agent_pool() -> list:
     """
     Create a pool of static agents with fixed roles.
     No dynamic generation - all agents are predefined.
-    
+
+    The pool is memoized: agents are built once per process and callers
+    get shallow copies, so per-run mutations (e.g. reassigning a
+    backend) never leak into other experiments. Specs and prompts are
+    immutable and stay shared.
+
     Returns:
         List of agent objects
     """
-    agents = []
-    
-    # Create fixed set of agents
-    agent_configs = [
-        ("mathematics_expert_1", MathematicsExpertAgent),
-        ("mathematics_expert_2", MathematicsExpertAgent),
-        ("physics_expert", PhysicsExpertAgent),
-        ("logic_reasoning_expert", LogicReasoningExpertAgent),
-        ("planner", PlannerAgent),
-        ("decider", DeciderAgent),
-        ("general_expert", GeneralExpertAgent),
-    ]
-    
-    for name, agent_class in agent_configs:
-        agent = agent_class(name)
-        agents.append(agent)
-    
-    return agents
+    return [copy.copy(agent) for agent in _pool_template()]
+
+
+def solve_pool(agents: list, problem: str, executor: ThreadPoolExecutor = None):
+    """
+    Run every agent's solve() concurrently and yield results as they finish.
+
+    The solve() calls are LLM-I/O bound, so overlapping them bounds the
+    pool's wall-clock at roughly the slowest agent instead of the sum of
+    all of them. Yields (agent, result) pairs in completion order; an agent
+    that raises yields an error result in the same shape its solve() would
+    have returned, so one failing agent never kills the batch.
+
+    Threads rather than an event loop on purpose: the pool tops out at a
+    handful of agents, the whole transport stack (requests session, rate
+    limiter, coalescer) is synchronous, and threads waiting on sockets
+    release the GIL, so asyncio would buy nothing here short of rewriting
+    the backend while adding a sync/async seam at every call site.
+
+    Callers running many pools (batch runs) can pass a shared executor to
+    reuse its threads across problems instead of spawning and tearing down
+    a pool's worth of threads per problem; a shared executor is left
+    running, with only this pool's unfinished futures cancelled on early
+    exit.
+    """
+    owns_executor = executor is None
+    if owns_executor:
+        executor = ThreadPoolExecutor(max_workers=len(agents))
+    future_to_agent = {executor.submit(agent.solve, problem): agent
+                       for agent in agents}
+    try:
+        for future in as_completed(future_to_agent):
+            agent = future_to_agent[future]
+            try:
+                yield agent, future.result()
+            except Exception as e:
+                print(f"Error with agent {agent.name}: {e}")
+                yield agent, {
+                    "agent": agent.name,
+                    "role": agent.role,
+                    "answer": f"Error: {str(e)}",
+                    "confidence": 0.0,
+                    "tokens": 0,
+                    "error": str(e)
+                }
+    finally:
+        # A consumer that stops early (e.g. on early consensus) abandons
+        # the stragglers instead of blocking on them; not-yet-started
+        # solves are cancelled outright.
+        if owns_executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+        else:
+            for future in future_to_agent:
+                future.cancel()
+
+
+def _parse_json_array(response_text: str):
+    """Parse a response expected to be a JSON array.
+
+    parse_json_response slices to object boundaries and so mangles
+    top-level arrays; this looks for the bracketed array first and only
+    then falls back to the object parser (for wrapped arrays).
+    """
+    text = response_text.strip()
+    start = text.find('[')
+    end = text.rfind(']')
+    if start != -1 and end > start:
+        try:
+            return json.loads(text[start:end + 1])
+        except json.JSONDecodeError:
+            pass
+    return parse_json_response(response_text)
+
+
+def solve_pool_marshaled(agents: list, problem: str):
+    """
+    Collapse the whole pool into one multi-role LLM call.
+
+    Builds a single prompt asking one model to answer as every expert in
+    turn and return a JSON array of {role, answer, confidence, explanation}
+    entries, so the pool costs one network round-trip and one prompt
+    prefill instead of len(agents) of each. Yields (agent, result) pairs
+    in pool order, mirroring solve_pool. Tokens are split evenly across
+    the agents since the backend reports one total.
+
+    One model answering for all roles loses the ensemble's backend
+    diversity, so this is a cost/latency trade, not a free win; any
+    marshaling failure (unparseable or short reply) falls back to the
+    parallel per-agent path.
+    """
+    sections = []
+    for i, agent in enumerate(agents, start=1):
+        sections.append(f"{i}. {agent.role}: {agent.system_prompt}")
+
+    prompt = (
+        f"Answer the problem below {len(agents)} times, once as each of "
+        "these experts in order:\n"
+        + "\n".join(sections)
+        + f"\n\nProblem: {problem}\n\n"
+        "Return ONLY a JSON array with one object per expert, in the same "
+        "order, each shaped as {\"role\": ..., \"answer\": ..., "
+        "\"confidence\": 0.0-1.0, \"explanation\": ...}."
+    )
+
+    try:
+        response = call_llm(prompt, random_model_choice())
+        parsed = _parse_json_array(response["content"])
+        if isinstance(parsed, dict):
+            # Some models wrap the array in an object
+            for value in parsed.values():
+                if isinstance(value, list):
+                    parsed = value
+                    break
+        if not isinstance(parsed, list) or len(parsed) < len(agents):
+            raise ValueError("marshaled response missing per-expert entries")
+    except Exception as e:
+        print(f"Warning: marshaled pool call failed ({e}). "
+              "Falling back to per-agent calls.")
+        yield from solve_pool(agents, problem)
+        return
+
+    tokens_each = response["metadata"].get("tokens_used", 0) // len(agents)
+    for agent, entry in zip(agents, parsed):
+        if not isinstance(entry, dict):
+            entry = {}
+        answer = entry.get("answer")
+        if answer is None:
+            answer = ""
+        elif not isinstance(answer, str):
+            answer = str(answer)
+        yield agent, {
+            "agent": agent.name,
+            "role": agent.role,
+            "answer": answer,
+            "answer_preview": answer[:60],
+            "confidence": entry.get("confidence", 0.5),
+            "explanation": entry.get("explanation", ""),
+            "tokens": tokens_each,
+            "marshaled": True
+        }
+
+
+def batch_ask(problem: str, roles: list = None, agents: list = None) -> list:
+    """
+    Ask the pool (or a subset of its roles) one problem in a single call.
+
+    Convenience entry point over solve_pool_marshaled: builds the pool if
+    none is given, optionally narrows it to the requested roles, and
+    returns the per-agent result dicts as a list. The whole ensemble
+    costs one network round-trip, and the shared problem text is prefilled
+    once instead of per agent.
+
+    Args:
+        problem: The problem/question to solve
+        roles: Roles to include, in pool order (default: all)
+        agents: Agent pool (default: create_static_agent_pool())
+
+    Returns:
+        List of per-agent result dicts, in pool order
+    """
+    if agents is None:
+        agents = create_static_agent_pool()
+    if roles is not None:
+        wanted = set(roles)
+        agents = [agent for agent in agents if agent.role in wanted]
+    return [result for _, result in solve_pool_marshaled(agents, problem)]
+
+
+def create_static_agent_pool_batch(problems: list, agents: list = None) -> dict:
+    """
+    Solve a fixed problem list offline via the provider's Batch API.
+
+    Builds one batch request per (agent, problem) pair, submits them as a
+    single job and maps the responses back into the per-agent result dicts
+    solve() would have produced. Batched jobs cost half as much as
+    interactive calls but take minutes to hours to complete, so this path
+    is for benchmark runs over known case sets, not interactive use. It
+    requires the OpenAI API fallback (OPENAI_API_KEY); local Ollama runs
+    have no batch endpoint and should use solve_pool instead.
+
+    Args:
+        problems: Problem strings to solve
+        agents: Agent pool (default: create_static_agent_pool())
+
+    Returns:
+        Dict mapping each problem to its list of per-agent result dicts
+    """
+    import hashlib
+    from llm_integration.batch_api import submit_batch, collect
+
+    if agents is None:
+        agents = create_static_agent_pool()
+
+    # Stable short ids so custom_ids survive submit/collect across processes
+    problem_ids = {
+        problem: hashlib.sha1(problem.encode("utf-8")).hexdigest()[:12]
+        for problem in problems
+    }
+
+    import config
+    requests = []
+    for problem in problems:
+        for agent in agents:
+            prompt = build_prompt(agent.role, problem)
+            messages = [{"role": "system", "content": agent.system_prompt},
+                        {"role": "user", "content": prompt}]
+            requests.append({
+                "custom_id": f"{agent.name}:{problem_ids[problem]}",
+                "model": config.LLM_MODELS[agent.llm_backend],
+                "messages": messages
+            })
+
+    job_id = submit_batch(requests)
+    responses = collect(job_id)
+
+    results = {problem: [] for problem in problems}
+    for problem in problems:
+        for agent in agents:
+            custom_id = f"{agent.name}:{problem_ids[problem]}"
+            response = responses.get(custom_id)
+            if response is None:
+                results[problem].append({
+                    "agent": agent.name,
+                    "role": agent.role,
+                    "answer": "Error: missing batch response",
+                    "confidence": 0.0,
+                    "tokens": 0,
+                    "error": "missing batch response"
+                })
+                continue
+            parsed = parse_json_response(response["content"])
+            result = {
+                "agent": agent.name,
+                "role": agent.role,
+                "answer": parsed.get("answer", response["content"]),
+                "confidence": parsed.get("confidence", 0.5),
+                "explanation": parsed.get("explanation", ""),
+                "tokens": response["metadata"].get("tokens_used", 0)
+            }
+            if getattr(agent, "store_raw", False):
+                result["raw_response"] = response["content"]
+                result["parsed_response"] = parsed
+            results[problem].append(result)
 
+    return results
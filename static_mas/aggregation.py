@@ -1,11 +1,107 @@
 """
 Aggregation mechanisms for Static MAS results.
 Implements voting, decider-based, and confidence-based aggregation.
+
+The module is deliberately dependency-light and fully annotated so it can
+be compiled ahead-of-time (mypyc or Cython) in deployments where the
+aggregation loop is hot; pure-Python remains the shipped form.
 """
 from typing import Dict, Any, List
+import functools
 import re
 from collections import Counter
 
+# Optional vectorized aggregation over large agent pools
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+# Optional Arrow string kernels for batch answer normalization
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    pa = None
+    pc = None
+
+# Optional JIT compilation for the integer-coded tally kernel
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Decorator stand-in so kernels stay importable without numba."""
+        def wrap(fn):
+            return fn
+        return wrap
+
+# Below this many answers the Arrow kernel setup costs more than it saves
+_BATCH_NORMALIZE_MIN = 32
+
+# Hot-loop patterns, compiled once at import. normalize_answer runs on every
+# candidate of every aggregation call, so the per-call re-compile and scan
+# cost adds up across a benchmark run.
+_NUM_RE = re.compile(r'\d+\.?\d*')
+_SIGNED_NUM_RE = re.compile(r'-?\d+\.?\d*')
+_PREFIX_RE = re.compile(r'^(the answer is|answer:|solution:|result:)\s*')
+
+
+if NUMPY_AVAILABLE:
+    @njit(cache=True)
+    def _weighted_tally(inverse, confidences, n_unique):
+        """Sum confidences per answer code (numba lowers this to native)."""
+        totals = np.zeros(n_unique, dtype=np.float64)
+        for i in range(inverse.shape[0]):
+            totals[inverse[i]] += confidences[i]
+        return totals
+
+
+def _weighted_totals(inverse, confidences, n_unique):
+    """
+    Per-code confidence sums for integer-coded answers.
+
+    Dispatches to the JIT-compiled loop when numba is installed (cached
+    after first-call warmup), otherwise to np.bincount - never to the
+    undecorated Python loop.
+    """
+    if NUMBA_AVAILABLE:
+        return _weighted_tally(inverse, confidences, n_unique)
+    return np.bincount(inverse, weights=confidences, minlength=n_unique)
+
+
+class AgentResultBatch:
+    """
+    Struct-of-arrays view over a list of agent result dicts.
+
+    The aggregators all start by walking List[Dict] results field by field;
+    for large ensemble pools that means pointer-chasing one dict per agent
+    per field. This view extracts each field once into parallel sequences -
+    numpy arrays for the numeric/boolean ones when numpy is installed - so
+    selection and masking run as whole-array operations.
+    """
+
+    __slots__ = ('results', 'answers', 'roles', 'confidences', 'errors')
+
+    def __init__(self, agent_results: List[Dict[str, Any]]):
+        self.results = agent_results
+        self.answers = [r.get("answer", "") for r in agent_results]
+        self.roles = [r.get("role", "") for r in agent_results]
+        confidences = [float(r.get("confidence", 0.0) or 0.0) for r in agent_results]
+        errors = [bool(r.get("error")) for r in agent_results]
+        if NUMPY_AVAILABLE:
+            self.confidences = np.asarray(confidences, dtype=np.float32)
+            self.errors = np.asarray(errors, dtype=bool)
+        else:
+            self.confidences = confidences
+            self.errors = errors
+
 
 def majority_vote(agent_results: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
@@ -17,22 +113,59 @@ def majority_vote(agent_results: List[Dict[str, Any]]) -> Dict[str, Any]:
     Returns:
         Aggregated result with final answer and metadata
     """
-    answers = []
-    for result in agent_results:
-        answer = result.get("answer", "")
-        # Skip error results
-        if result.get("error"):
-            continue
-        if answer:
+    answer_counts = Counter()
+    first_original = {}
+    total_votes = 0
+    if (NUMPY_AVAILABLE or PYARROW_AVAILABLE) \
+            and len(agent_results) >= _BATCH_NORMALIZE_MIN:
+        # Large pools: normalize every candidate in one batch (Arrow
+        # kernels when available), then count in a single loop
+        candidates = [r.get("answer", "") for r in agent_results
+                      if not r.get("error") and r.get("answer", "")]
+        normalized_all = batch_normalize(candidates)
+        if NUMPY_AVAILABLE and candidates:
+            # Vectorized tally: one unique/bincount pass replaces the
+            # per-candidate Counter updates
+            uniques, inverse, counts = np.unique(
+                np.asarray(normalized_all, dtype=object),
+                return_inverse=True, return_counts=True)
+            winner_code = int(counts.argmax())
+            winning_answer = uniques[winner_code]
+            first_idx = int(np.flatnonzero(inverse == winner_code)[0])
+            return {
+                "final_answer": candidates[first_idx] or winning_answer,
+                "method": "majority_vote",
+                "confidence": int(counts[winner_code]) / len(candidates),
+                "vote_counts": {u: int(c) for u, c in zip(uniques, counts)},
+                "winning_answer": winning_answer,
+                "total_votes": len(candidates)
+            }
+        for normalized, answer in zip(normalized_all, candidates):
+            answer_counts[normalized] += 1
+            first_original.setdefault(normalized, answer)
+            total_votes += 1
+    else:
+        # Single pass: count votes and remember the first original answer
+        # seen for each normalized form, instead of building an intermediate
+        # list and re-scanning it for the winner.
+        for result in agent_results:
+            # Skip error results
+            if result.get("error"):
+                continue
+            answer = result.get("answer", "")
+            if not answer:
+                continue
             try:
                 # Normalize answer for comparison
                 normalized = normalize_answer(answer)
-                answers.append((normalized, result))
-            except Exception as e:
+            except Exception:
                 # Skip answers that can't be normalized
                 continue
-    
-    if not answers:
+            answer_counts[normalized] += 1
+            first_original.setdefault(normalized, answer)
+            total_votes += 1
+
+    if not answer_counts:
         return {
             "final_answer": "No answers provided",
             "method": "majority_vote",
@@ -40,27 +173,16 @@ def majority_vote(agent_results: List[Dict[str, Any]]) -> Dict[str, Any]:
             "vote_counts": {},
             "winning_answer": None
         }
-    
-    # Count votes
-    answer_counts = Counter([ans[0] for ans in answers])
-    most_common = answer_counts.most_common(1)[0]
-    winning_answer = most_common[0]
-    vote_count = most_common[1]
-    
-    # Find the original answer from one of the agents
-    original_answer = None
-    for normalized, result in answers:
-        if normalized == winning_answer:
-            original_answer = result.get("answer", "")
-            break
-    
+
+    winning_answer, vote_count = answer_counts.most_common(1)[0]
+
     return {
-        "final_answer": original_answer or winning_answer,
+        "final_answer": first_original[winning_answer] or winning_answer,
         "method": "majority_vote",
-        "confidence": vote_count / len(answers),
+        "confidence": vote_count / total_votes,
         "vote_counts": dict(answer_counts),
         "winning_answer": winning_answer,
-        "total_votes": len(answers)
+        "total_votes": total_votes
     }
 
 
@@ -107,18 +229,32 @@ def most_confident(agent_results: List[Dict[str, Any]]) -> Dict[str, Any]:
     Returns:
         Aggregated result with final answer
     """
-    # Filter out error results
-    valid_results = [r for r in agent_results if not r.get("error")]
-    
-    if not valid_results:
-        return {
-            "final_answer": "No answers provided",
-            "method": "most_confident",
-            "confidence": 0.0
-        }
-    
-    # Find agent with highest confidence
-    best_result = max(valid_results, key=lambda r: r.get("confidence", 0.0))
+    if NUMPY_AVAILABLE and agent_results:
+        # Vectorized selection: error entries are masked below any real
+        # confidence, then one argmax picks the winner
+        batch = AgentResultBatch(agent_results)
+        masked = np.where(batch.errors, -1.0, batch.confidences)
+        best_idx = int(np.argmax(masked))
+        if masked[best_idx] < 0.0:
+            return {
+                "final_answer": "No answers provided",
+                "method": "most_confident",
+                "confidence": 0.0
+            }
+        best_result = batch.results[best_idx]
+    else:
+        # Filter out error results
+        valid_results = [r for r in agent_results if not r.get("error")]
+
+        if not valid_results:
+            return {
+                "final_answer": "No answers provided",
+                "method": "most_confident",
+                "confidence": 0.0
+            }
+
+        # Find agent with highest confidence
+        best_result = max(valid_results, key=lambda r: r.get("confidence", 0.0))
     
     return {
         "final_answer": best_result.get("answer", ""),
@@ -161,7 +297,7 @@ def weighted_average(agent_results: List[Dict[str, Any]]) -> Dict[str, Any]:
         confidence = result.get("confidence", 0.5)
         
         # Try to extract number from answer
-        numbers = re.findall(r'-?\d+\.?\d*', str(answer))
+        numbers = _SIGNED_NUM_RE.findall(str(answer))
         if numbers:
             try:
                 num_value = float(numbers[-1])  # Use last number found
@@ -173,14 +309,29 @@ def weighted_average(agent_results: List[Dict[str, Any]]) -> Dict[str, Any]:
     
     # If we have numerical answers, compute weighted average
     if numerical_answers:
-        total_weight = sum(conf for _, conf, _ in numerical_answers)
+        if NUMPY_AVAILABLE:
+            # Vectorized: one weighted mean and one argmin over the value
+            # array instead of per-element Python sums and a keyed min scan
+            vals = np.fromiter((x[0] for x in numerical_answers),
+                               dtype=np.float64, count=len(numerical_answers))
+            confs = np.fromiter((x[1] for x in numerical_answers),
+                                dtype=np.float64, count=len(numerical_answers))
+            total_weight = float(confs.sum())
+        else:
+            vals = confs = None
+            total_weight = sum(conf for _, conf, _ in numerical_answers)
         if total_weight > 0:
-            weighted_sum = sum(val * conf for val, conf, _ in numerical_answers)
-            avg_answer = weighted_sum / total_weight
-            
-            # Find the result with closest numerical value
-            closest_result = min(numerical_answers, 
-                                key=lambda x: abs(x[0] - avg_answer))[2]
+            if NUMPY_AVAILABLE:
+                avg_answer = float(np.average(vals, weights=confs))
+                closest_result = numerical_answers[
+                    int(np.argmin(np.abs(vals - avg_answer)))][2]
+            else:
+                weighted_sum = sum(val * conf for val, conf, _ in numerical_answers)
+                avg_answer = weighted_sum / total_weight
+
+                # Find the result with closest numerical value
+                closest_result = min(numerical_answers,
+                                     key=lambda x: abs(x[0] - avg_answer))[2]
             
             return {
                 "final_answer": str(avg_answer),
@@ -191,10 +342,35 @@ def weighted_average(agent_results: List[Dict[str, Any]]) -> Dict[str, Any]:
                 "explanation": f"Weighted average of {len(numerical_answers)} numerical answers"
             }
     
-    # Fallback to confidence-weighted text voting
+    # Fallback to confidence-weighted text voting; normalization runs as
+    # one batch so large pools hit the Arrow kernels
+    normalized_batch = batch_normalize([answer for answer, _, _ in text_answers])
+    if NUMPY_AVAILABLE and len(text_answers) >= _BATCH_NORMALIZE_MIN:
+        # Large pools: encode the answers once and tally per code with the
+        # kernel instead of growing per-answer weight lists
+        uniques, inverse = np.unique(
+            np.asarray(normalized_batch, dtype=object), return_inverse=True)
+        confidences = np.fromiter((conf for _, conf, _ in text_answers),
+                                  dtype=np.float64, count=len(text_answers))
+        totals = _weighted_totals(inverse, confidences, len(uniques))
+        best_code = int(totals.argmax())
+        first_idx = int(np.flatnonzero(inverse == best_code)[0])
+        total_score = float(totals.sum())
+        if total_score > 0:
+            return {
+                "final_answer": text_answers[first_idx][0] or uniques[best_code],
+                "method": "weighted_average",
+                "confidence": float(totals[best_code]) / total_score,
+                "weighted_scores": {u: float(t) for u, t in zip(uniques, totals)}
+            }
+        return {
+            "final_answer": "No valid answers",
+            "method": "weighted_average",
+            "confidence": 0.0
+        }
+
     answer_weights = {}
-    for answer, confidence, result in text_answers:
-        normalized = normalize_answer(answer)
+    for normalized, (answer, confidence, result) in zip(normalized_batch, text_answers):
         if normalized not in answer_weights:
             answer_weights[normalized] = []
         answer_weights[normalized].append((confidence, result))
@@ -228,7 +404,7 @@ def weighted_average(agent_results: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
-def normalize_answer(answer) -> str:
+def normalize_answer(answer: Any) -> str:
     """
     Normalize an answer for comparison (lowercase, remove extra whitespace, extract key info).
     
@@ -248,17 +424,23 @@ def normalize_answer(answer) -> str:
     if not answer:
         return ""
     
+    return _normalize_str(answer)
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_str(answer: str) -> str:
+    """Cached normalization core; agents repeat answers across aggregations."""
     # Convert to lowercase
     normalized = answer.lower().strip()
     
     # Extract numbers if present (for numerical answers)
-    numbers = re.findall(r'\d+\.?\d*', normalized)
+    numbers = _NUM_RE.findall(normalized)
     if numbers:
         # Use the last number found (often the final answer)
         return numbers[-1]
     
     # Remove common prefixes/suffixes
-    normalized = re.sub(r'^(the answer is|answer:|solution:|result:)\s*', '', normalized)
+    normalized = _PREFIX_RE.sub('', normalized)
     normalized = normalized.strip()
     
     # Limit length for comparison
@@ -268,6 +450,40 @@ def normalize_answer(answer) -> str:
     return normalized
 
 
+def batch_normalize(answers: List[Any]) -> List[str]:
+    """
+    Normalize a batch of answers at once.
+
+    With pyarrow installed and a large enough batch, the lowercase and
+    trim steps run as C string kernels over one Arrow array instead of
+    per-element Python calls; number extraction and prefix stripping then
+    finish per element so the result matches normalize_answer exactly.
+    Small batches and pyarrow-less installs delegate to normalize_answer.
+
+    Args:
+        answers: Raw answers (any types normalize_answer accepts)
+
+    Returns:
+        Normalized answer strings, in input order
+    """
+    if not PYARROW_AVAILABLE or len(answers) < _BATCH_NORMALIZE_MIN:
+        return [normalize_answer(a) for a in answers]
+
+    strings = ["" if a is None else (a if isinstance(a, str) else str(a))
+               for a in answers]
+    trimmed = pc.utf8_trim_whitespace(pc.utf8_lower(pa.array(strings, type=pa.string())))
+
+    normalized = []
+    for value in trimmed.to_pylist():
+        numbers = _NUM_RE.findall(value)
+        if numbers:
+            normalized.append(numbers[-1])
+            continue
+        value = _PREFIX_RE.sub('', value).strip()
+        normalized.append(value[:100] if len(value) > 100 else value)
+    return normalized
+
+
 def aggregate_results(agent_results: List[Dict[str, Any]], 
                      method: str = "majority_vote") -> Dict[str, Any]:
     """
@@ -6,52 +6,94 @@ import os
 import sys
 from pathlib import Path
 
+# orjson decodes the trace files (megabytes when raw_response text is
+# retained) straight from bytes, skipping the UTF-8 decode to str
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 # Add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+
+def _load_trace(path):
+    """Parse one trace file, via orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
 
 
 def load_lbmas_result(case_name):
     """Load LbMAS result from trace JSON file."""
     trace_file = f"outputs/trace_case_{case_name}.json"
     if os.path.exists(trace_file):
-        with open(trace_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return _load_trace(trace_file)
     return None
 
 
+# Problem snippets that identify each comparison case in a trace
+CASE_MARKERS = {
+    'a_mathematical': 'Trinket',
+    'b_common_knowledge': 'sky blue'
+}
+
+
 def load_static_mas_result(case_name):
     """Load Static MAS result from trace JSON file."""
-    # Find the most recent trace file
     output_dir = Path("static_mas/outputs")
     if not output_dir.exists():
         return None
-    
-    # Look for trace files matching the case
+
+    marker = CASE_MARKERS.get(case_name)
+    if marker is None:
+        return None
+
+    # The trace index maps filename -> problem snippet, so finding the case
+    # means scanning one small file instead of parsing every trace
+    index_path = output_dir / "index.json"
+    if index_path.exists():
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            # Timestamped filenames sort chronologically; prefer newest
+            for filename in sorted(index, reverse=True):
+                if marker in index[filename].get('problem', ''):
+                    trace_path = output_dir / filename
+                    if trace_path.exists():
+                        return _load_trace(trace_path)
+        except Exception:
+            pass
+
+    # Fallback for traces written before the index existed: scan the most
+    # recent trace files and sniff their problem text
     trace_files = list(output_dir.glob("static_mas_trace_*.json"))
     if not trace_files:
         return None
-    
-    # Get the most recent one (or we could search by timestamp)
-    # For now, let's check the last few files
+
     trace_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-    
-    # Try to find one that matches our case (we'll need to check content)
+
     for trace_file in trace_files[:5]:  # Check last 5 files
         try:
-            with open(trace_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # Check if this matches our case by looking at problem
-                problem = data.get('problem', '')
-                if case_name == 'a_mathematical' and 'Trinket' in problem:
-                    return data
-                elif case_name == 'b_common_knowledge' and 'sky blue' in problem:
-                    return data
+            data = _load_trace(trace_file)
+            if marker in data.get('problem', ''):
+                return data
         except Exception as e:
             continue
-    
+
     return None
 
 
+def _iso_compat(timestamp):
+    """Normalize a trailing 'Z' to an explicit UTC offset for fromisoformat."""
+    return timestamp[:-1] + '+00:00' if timestamp.endswith('Z') else timestamp
+
+
 def extract_metrics(result, system_name):
     """Extract key metrics from result."""
     if result is None:
@@ -64,19 +106,23 @@ def extract_metrics(result, system_name):
     }
     
     if system_name == 'LbMAS':
-        # Calculate execution time from start_time and end_time
-        from datetime import datetime
-        start_time = result.get('start_time', '')
-        end_time = result.get('end_time', '')
-        if start_time and end_time:
-            try:
-                start = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-                end = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
-                metrics['execution_time'] = (end - start).total_seconds()
-            except:
-                metrics['execution_time'] = 0
+        # Newer traces ship the duration precomputed; only older ones need
+        # the timestamps re-parsed
+        if 'execution_time_sec' in result:
+            metrics['execution_time'] = result['execution_time_sec']
         else:
-            metrics['execution_time'] = 0
+            from datetime import datetime
+            start_time = result.get('start_time', '')
+            end_time = result.get('end_time', '')
+            if start_time and end_time:
+                try:
+                    start = datetime.fromisoformat(_iso_compat(start_time))
+                    end = datetime.fromisoformat(_iso_compat(end_time))
+                    metrics['execution_time'] = (end - start).total_seconds()
+                except (TypeError, ValueError):
+                    metrics['execution_time'] = 0
+            else:
+                metrics['execution_time'] = 0
         
         # Check correctness - use evaluate_answer function if available
         ground_truth = result.get('ground_truth', '')
@@ -0,0 +1,125 @@
+"""
+Semantic cache for whole Static MAS experiment results.
+
+Benchmark batches frequently replay the same or near-identical problems
+(deduped dataset splits, paraphrased cases, repeated comparison runs);
+rerunning the full agent pool for those pays seven LLM calls for an
+answer already on disk. This cache embeds each solved problem with a
+sentence transformer and, when a new problem's cosine similarity to a
+prior one clears the threshold, returns the stored final result without
+touching the pool.
+
+This sits one level above llm_integration's SemanticCache: that one
+matches individual agent prompts, this one short-circuits the entire
+experiment. Requires the same optional dependencies
+(sentence-transformers and faiss); enable via MAS_EXPERIMENT_CACHE=1.
+"""
+import copy
+import json
+import os
+import threading
+from typing import Any, Dict, Optional
+
+# Optional semantic matching support
+try:
+    from sentence_transformers import SentenceTransformer
+    import faiss
+    import numpy as np
+    SEMANTIC_AVAILABLE = True
+except ImportError:
+    SEMANTIC_AVAILABLE = False
+    SentenceTransformer = None
+    faiss = None
+
+# Cosine similarity threshold for reusing a prior experiment's result.
+# Stricter than the prompt-level cache: a false hit here replaces the
+# whole experiment, not one agent's contribution to an ensemble.
+EXPERIMENT_SIMILARITY_THRESHOLD = float(
+    os.getenv("MAS_EXPERIMENT_CACHE_THRESHOLD", "0.93"))
+
+EMBEDDING_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+class ExperimentSemanticCache:
+    """Embedding index mapping solved problems to their final results."""
+
+    def __init__(self, cache_dir: str = "static_mas/outputs",
+                 threshold: float = EXPERIMENT_SIMILARITY_THRESHOLD):
+        """
+        Initialize the cache, rebuilding the index from disk if present.
+
+        Args:
+            cache_dir: Directory holding the persisted entry file
+            threshold: Minimum cosine similarity for reusing a result
+
+        Raises:
+            ImportError: If sentence-transformers or faiss is missing
+        """
+        if not SEMANTIC_AVAILABLE:
+            raise ImportError(
+                "experiment cache requires sentence-transformers and faiss")
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self.entries_path = os.path.join(cache_dir, "experiment_sem_cache.json")
+        self.threshold = threshold
+        self._embedder = SentenceTransformer(EMBEDDING_MODEL_NAME)
+        self._lock = threading.Lock()
+        self._index = faiss.IndexFlatIP(
+            self._embedder.get_sentence_embedding_dimension())
+        # Parallel to the index rows: [{"problem": ..., "result": ...}, ...]
+        self._entries = []
+        self._load()
+
+    def _embed(self, problem: str):
+        """Embed and L2-normalize so inner product equals cosine similarity."""
+        vector = self._embedder.encode([problem])
+        vector = np.asarray(vector, dtype="float32")
+        faiss.normalize_L2(vector)
+        return vector
+
+    def _load(self):
+        """Rebuild the index from the persisted entry list."""
+        if not os.path.exists(self.entries_path):
+            return
+        try:
+            with open(self.entries_path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return
+        for entry in entries:
+            self._index.add(self._embed(entry["problem"]))
+            self._entries.append(entry)
+
+    def lookup(self, problem: str) -> Optional[Dict[str, Any]]:
+        """
+        Return a copy of the most similar prior result, or None.
+
+        The copy is deep, so callers can annotate or mutate it without
+        corrupting the cached original.
+        """
+        with self._lock:
+            if self._index.ntotal == 0:
+                return None
+            similarities, indices = self._index.search(self._embed(problem), 1)
+            if similarities[0][0] < self.threshold:
+                return None
+            result = copy.deepcopy(self._entries[indices[0][0]]["result"])
+            similarity = float(similarities[0][0])
+
+        result["execution_time"] = 0
+        result["semantic_cache_hit"] = True
+        result["semantic_similarity"] = round(similarity, 4)
+        return result
+
+    def add(self, problem: str, final_result: Dict[str, Any]):
+        """Store one experiment's result and persist the entry list."""
+        entry = {"problem": problem, "result": copy.deepcopy(final_result)}
+        with self._lock:
+            self._index.add(self._embed(problem))
+            self._entries.append(entry)
+            snapshot = list(self._entries)
+        try:
+            with open(self.entries_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+        except OSError as e:
+            print(f"Warning: could not persist experiment cache: {e}")
@@ -1,13 +1,17 @@
 """
 Static prompts for Static MAS agents.
 No blackboard references - agents work independently.
+
+Templates put everything static (role framing, JSON schema, output
+instructions) first and interpolate the problem last, so the shared
+prefix stays byte-identical across calls and providers with automatic
+prefix caching only pay for the variable tail.
 """
+import functools
 
 STATIC_PROMPTS = {
     "mathematics_expert": """You are a mathematics expert. Solve the following problem independently.
 
-Problem: {problem}
-
 Provide your solution in JSON format:
 {{
     "answer": "your final answer",
@@ -16,11 +20,11 @@ Provide your solution in JSON format:
     "method": "mathematical approach used"
 }}
 
-Please provide your solution in the specified JSON format.""",
+Please provide your solution in the specified JSON format.
 
-    "physics_expert": """You are a physics expert. Solve the following problem independently.
+Problem: {problem}""",
 
-Problem: {problem}
+    "physics_expert": """You are a physics expert. Solve the following problem independently.
 
 Provide your solution in JSON format:
 {{
@@ -30,11 +34,11 @@ Provide your solution in JSON format:
     "method": "physics principles used"
 }}
 
-Please provide your solution in the specified JSON format.""",
+Please provide your solution in the specified JSON format.
 
-    "logic_reasoning_expert": """You are a logic and reasoning expert. Solve the following problem independently.
+Problem: {problem}""",
 
-Problem: {problem}
+    "logic_reasoning_expert": """You are a logic and reasoning expert. Solve the following problem independently.
 
 Provide your solution in JSON format:
 {{
@@ -44,11 +48,11 @@ Provide your solution in JSON format:
     "method": "logical reasoning approach used"
 }}
 
-Please provide your solution in the specified JSON format.""",
+Please provide your solution in the specified JSON format.
 
-    "planner": """You are a strategic planner. Solve the following problem independently by creating a plan and executing it.
+Problem: {problem}""",
 
-Problem: {problem}
+    "planner": """You are a strategic planner. Solve the following problem independently by creating a plan and executing it.
 
 Provide your solution in JSON format:
 {{
@@ -59,11 +63,11 @@ Provide your solution in JSON format:
     "method": "planning approach used"
 }}
 
-Please provide your solution in the specified JSON format.""",
+Please provide your solution in the specified JSON format.
 
-    "decider": """You are a decision-maker. Solve the following problem independently and provide a final answer.
+Problem: {problem}""",
 
-Problem: {problem}
+    "decider": """You are a decision-maker. Solve the following problem independently and provide a final answer.
 
 Provide your solution in JSON format:
 {{
@@ -73,11 +77,11 @@ Provide your solution in JSON format:
     "method": "decision-making approach used"
 }}
 
-Please provide your solution in the specified JSON format.""",
+Please provide your solution in the specified JSON format.
 
-    "general_expert": """You are a general problem-solving expert. Solve the following problem independently.
+Problem: {problem}""",
 
-Problem: {problem}
+    "general_expert": """You are a general problem-solving expert. Solve the following problem independently.
 
 Provide your solution in JSON format:
 {{
@@ -87,6 +91,20 @@ Provide your solution in JSON format:
     "method": "approach used"
 }}
 
-Please provide your solution in the specified JSON format."""
+Please provide your solution in the specified JSON format.
+
+Problem: {problem}"""
 }
 
+
+
+@functools.lru_cache(maxsize=256)
+def build_prompt(role: str, problem: str) -> str:
+    """
+    Build (and memoize) the full prompt for one role and problem.
+
+    The comparison drivers replay the same fixed problems across all seven
+    agents, so each (role, problem) pair is formatted once per process
+    instead of on every solve() call.
+    """
+    return STATIC_PROMPTS[role].format(problem=problem)
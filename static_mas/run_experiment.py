@@ -4,15 +4,70 @@ All agents process problems in parallel, then results are aggregated.
 """
 from typing import Dict, Any, List, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import functools
+import hashlib
+import itertools
 import json
 import os
+import queue
+import re
+import threading
+import time
 from datetime import datetime
-from .agents.static_agents import create_static_agent_pool
-from .aggregation import aggregate_results
+from collections import Counter
+from .agents.static_agents import create_static_agent_pool, solve_pool, solve_pool_marshaled
+from .aggregation import aggregate_results, normalize_answer
 import sys
 
+# orjson's C serializer writes the hot JSON artifacts (traces, per-task
+# results, summaries) severalfold faster than stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 # Add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+# Stop dispatching agents once this many agree on one normalized answer
+# (majority_vote runs only; 0 = always run the full pool). Opt-in: the
+# skipped agents' answers never reach the trace, and their in-flight
+# calls are abandoned rather than cancelled.
+EARLY_CONSENSUS_K = int(os.getenv("MAS_EARLY_CONSENSUS", "0"))
+
+# Numeric tokens in answers; compiled once since evaluation runs per task
+# in large batches
+_NUM_RE = re.compile(r'\d+\.?\d*')
+
+
+def _dump_json(obj, path):
+    """Write obj to path as compact JSON, via orjson when available.
+
+    Indented output roughly doubles both CPU time and bytes for files that
+    are read back by scripts, not people; the human-readable artifact is
+    the text report.
+    """
+    if ORJSON_AVAILABLE:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj))
+    else:
+        with open(path, 'w', encoding='utf-8', errors='replace') as f:
+            json.dump(obj, f, ensure_ascii=False)
+
+
+# Reuse whole experiment results for repeated or near-duplicate problems.
+# Opt-in (MAS_EXPERIMENT_CACHE=1) and needs the optional embedding stack.
+EXPERIMENT_CACHE = None
+if os.getenv("MAS_EXPERIMENT_CACHE", "").lower() in ("1", "true"):
+    try:
+        from .experiment_cache import ExperimentSemanticCache
+        EXPERIMENT_CACHE = ExperimentSemanticCache()
+    except ImportError as e:
+        print(f"Warning: experiment semantic cache disabled ({e})")
 
 # Import metrics tracker
 try:
@@ -23,13 +78,102 @@ except ImportError:
     MetricsTracker = None
 
 
+def _null_method(*args, **kwargs):
+    return None
+
+
+class NullMetricsTracker:
+    """
+    No-op stand-in for MetricsTracker when tracking is unavailable.
+
+    Lets the per-result tracking calls in the hot loop run unconditionally
+    instead of re-testing `if metrics_tracker:` for every agent result.
+    Falsy on purpose, so the heavier guarded sections (consensus analysis,
+    metrics persistence) still skip entirely.
+    """
+
+    def __bool__(self):
+        return False
+
+    def __getattr__(self, _name):
+        return _null_method
+
+
+NULL_TRACKER = NullMetricsTracker()
+
+
+# Fields each aggregation method actually reads from a result dict; the
+# rest (raw_response, parsed_response, explanation text) is only needed for
+# trace logging
+_SLIM_FIELDS = {
+    "majority_vote": ("agent", "answer", "tokens", "error"),
+    "decider_based": ("agent", "role", "answer", "confidence", "explanation", "tokens", "error"),
+    "most_confident": ("agent", "role", "answer", "confidence", "explanation", "tokens", "error"),
+    "weighted_average": ("agent", "answer", "confidence", "tokens", "error"),
+}
+
+
+def solve_and_aggregate(agents: List, problem: str,
+                        method: str = "majority_vote"):
+    """
+    Run the agent pool and aggregate while retaining only what the method reads.
+
+    Full result dicts carry the complete raw_response and parsed_response of
+    every agent; callers that just want an aggregated answer (ensemble runs,
+    grid searches) pay that memory for nothing. Each result is slimmed to the
+    fields its aggregation method consumes as it streams out of solve_pool,
+    so peak memory holds a few short fields per agent instead of full model
+    outputs. Use run_static_experiment when the trace matters.
+
+    Args:
+        agents: Agent pool to run
+        problem: Problem string
+        method: Aggregation method (see aggregate_results)
+
+    Returns:
+        Tuple of (aggregation result, list of slimmed agent results)
+    """
+    fields = _SLIM_FIELDS.get(method)
+    slim_results = []
+    for _agent, result in solve_pool(agents, problem):
+        if fields is None:
+            slim_results.append(result)
+        else:
+            slim_results.append({key: result[key] for key in fields if key in result})
+    return aggregate_results(slim_results, method=method), slim_results
+
+
+# Stream agent results to an append-only JSONL file instead of holding
+# them all in log_data until save(). Opt-in: the trace JSON then carries
+# an agent_results_file pointer instead of the inline result list, which
+# downstream readers of old traces may not expect.
+STREAM_TRACE = os.getenv("MAS_STREAM_TRACE", "").lower() in ("1", "true")
+
+
+# Filenames carry a second-resolution timestamp; experiments saving
+# concurrently (the fast suite overlaps two cases, near-certain to land
+# in the same second on a warm cache) need a per-process sequence number
+# on top so one trace can't silently overwrite another. The lock guards
+# the read-modify-write on the shared index.json.
+_RUN_COUNTER = itertools.count(1)
+_INDEX_LOCK = threading.Lock()
+
+
 class StaticMASLogger:
     """Logger for Static MAS experiments."""
-    
+
     def __init__(self, output_dir: str = "static_mas/outputs"):
         """Initialize logger."""
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
+        # Unique per logger; trace, report, and streamed results share it
+        self.run_id = (f"{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                       f"_{next(_RUN_COUNTER):03d}")
+        # Streaming mode: results go straight to disk as they arrive, so
+        # thousand-task batches hold a few counters instead of every
+        # agent's output until save()
+        self._results_path = None
+        self._results_fp = None
         self.log_data = {
             "experiment_type": "static_mas",
             "timestamp": datetime.now().isoformat(),
@@ -48,7 +192,9 @@ class StaticMASLogger:
         """Log the problem and ground truth."""
         self.log_data["problem"] = problem
         self.log_data["ground_truth"] = ground_truth
-        self.start_time = datetime.now()
+        # Monotonic clock for the duration; the isoformat timestamp in
+        # log_data stays the one human-readable wall-clock field
+        self.start_time = time.perf_counter_ns()
     
     def log_agents(self, agents: List):
         """Log agent information."""
@@ -63,8 +209,30 @@ class StaticMASLogger:
     
     def log_agent_result(self, result: Dict[str, Any]):
         """Log an agent's result."""
-        self.log_data["agent_results"].append(result)
+        if STREAM_TRACE:
+            if self._results_fp is None:
+                self._results_path = os.path.join(
+                    self.output_dir, f"static_mas_results_{self.run_id}.jsonl")
+                self._results_fp = open(self._results_path, 'a',
+                                        encoding='utf-8', errors='replace')
+            self._results_fp.write(json.dumps(result) + "\n")
+        else:
+            self.log_data["agent_results"].append(result)
         self.log_data["total_tokens"] += result.get("tokens", 0)
+
+    def _iter_agent_results(self):
+        """Yield logged results, from memory or the streamed JSONL file."""
+        if not STREAM_TRACE:
+            yield from self.log_data["agent_results"]
+            return
+        if self._results_path is None:
+            return
+        if self._results_fp is not None:
+            self._results_fp.flush()
+        with open(self._results_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
     
     def log_aggregation(self, aggregation_result: Dict[str, Any]):
         """Log aggregation result."""
@@ -75,46 +243,59 @@ class StaticMASLogger:
         """Evaluate if final answer matches ground truth."""
         if not self.log_data.get("ground_truth"):
             return None
-        
-        predicted = str(self.log_data.get("final_answer", "")).lower().strip()
-        ground_truth = str(self.log_data["ground_truth"]).lower().strip()
-        
-        # Simple evaluation
-        if predicted == ground_truth:
-            return True
-        
-        # Check if ground truth is contained in prediction
-        if ground_truth in predicted:
-            return True
-        
-        # Extract numbers and compare
-        import re
-        pred_numbers = re.findall(r'\d+\.?\d*', predicted)
-        gt_numbers = re.findall(r'\d+\.?\d*', ground_truth)
-        
-        if pred_numbers and gt_numbers:
-            return pred_numbers[-1] == gt_numbers[-1]
-        
-        return False
+        # Same normalization + last-number comparison as the module-level
+        # checker; keep one code path
+        return evaluate_answer(self.log_data.get("final_answer", ""),
+                               self.log_data["ground_truth"])
     
     def save(self) -> str:
         """Save log to JSON file."""
         if self.start_time:
-            self.log_data["execution_time"] = (datetime.now() - self.start_time).total_seconds()
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"static_mas_trace_{timestamp}.json"
+            self.log_data["execution_time"] = (time.perf_counter_ns() - self.start_time) / 1e9
+
+        if STREAM_TRACE and self._results_fp is not None:
+            self._results_fp.close()
+            self._results_fp = None
+            self.log_data["agent_results_file"] = os.path.basename(self._results_path)
+
+        filename = f"static_mas_trace_{self.run_id}.json"
         filepath = os.path.join(self.output_dir, filename)
         
-        with open(filepath, 'w', encoding='utf-8', errors='replace') as f:
-            json.dump(self.log_data, f, indent=2)
+        _dump_json(self.log_data, filepath)
+
+        self._update_index(filename)
         
         return filepath
     
+    def _update_index(self, filename: str):
+        """Record the new trace in outputs/index.json.
+
+        The index maps each trace filename to a short problem snippet, so
+        readers (compare_with_lbmas) can find the trace for a case by
+        scanning one small file instead of opening and parsing every trace.
+        """
+        index_path = os.path.join(self.output_dir, "index.json")
+        with _INDEX_LOCK:
+            index = {}
+            if os.path.exists(index_path):
+                try:
+                    with open(index_path, 'r', encoding='utf-8') as f:
+                        index = json.load(f)
+                except (json.JSONDecodeError, OSError):
+                    index = {}
+            index[filename] = {
+                "problem": (self.log_data.get("problem") or "")[:200],
+                "timestamp": self.log_data.get("timestamp", "")
+            }
+            try:
+                with open(index_path, 'w', encoding='utf-8') as f:
+                    json.dump(index, f, indent=2, ensure_ascii=False)
+            except OSError as e:
+                print(f"Warning: could not update trace index: {e}")
+    
     def save_text_report(self) -> str:
         """Save human-readable text report."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"static_mas_report_{timestamp}.txt"
+        filename = f"static_mas_report_{self.run_id}.txt"
         filepath = os.path.join(self.output_dir, filename)
         
         with open(filepath, 'w', encoding='utf-8', errors='replace') as f:
@@ -140,7 +321,7 @@ class StaticMASLogger:
             
             f.write("Agent Results:\n")
             f.write("-" * 80 + "\n")
-            for i, result in enumerate(self.log_data.get('agent_results', []), 1):
+            for i, result in enumerate(self._iter_agent_results(), 1):
                 f.write(f"\nAgent {i}: {result.get('agent', 'N/A')} ({result.get('role', 'N/A')})\n")
                 f.write(f"  Answer: {result.get('answer', 'N/A')}\n")
                 f.write(f"  Confidence: {result.get('confidence', 0.0):.2f}\n")
@@ -166,12 +347,45 @@ class StaticMASLogger:
         return filepath
 
 
+def _contrib_majority(normed, final_answer):
+    """Agents whose normalized answer matches the majority answer."""
+    final_norm = final_answer.strip().lower()
+    return [agent for agent, answer, _, _, _ in normed
+            if answer == final_norm], None
+
+
+def _contrib_decider(normed, final_answer):
+    """The decider-role agents."""
+    return [agent for agent, _, role, _, _ in normed
+            if "decider" in role], None
+
+
+def _contrib_confident(normed, final_answer):
+    """Agents tied at the pool's highest confidence."""
+    max_confidence = max((conf for _, _, _, conf, _ in normed), default=0.0)
+    return [agent for agent, _, _, conf, _ in normed
+            if conf == max_confidence], max_confidence
+
+
+# Per-method contributing-agent selection over the normed tuples built in
+# the metrics block: (agents, confidence override or None). Methods not
+# listed (weighted_average) track no consensus event, as before.
+_CONTRIB_FNS = {
+    "majority_vote": _contrib_majority,
+    "decider_based": _contrib_decider,
+    "most_confident": _contrib_confident,
+}
+
+
 def run_static_experiment(problem: str,
                          ground_truth: Optional[str] = None,
                          aggregation_method: str = "majority_vote",
                          enable_logging: bool = True,
                          logger: Optional[StaticMASLogger] = None,
-                         metrics_tracker: Optional[MetricsTracker] = None) -> Dict[str, Any]:
+                         metrics_tracker: Optional[MetricsTracker] = None,
+                         batched: bool = False,
+                         verbose: bool = True,
+                         executor: Optional[ThreadPoolExecutor] = None) -> Dict[str, Any]:
     """
     Run a single Static MAS experiment.
     
@@ -184,25 +398,50 @@ def run_static_experiment(problem: str,
         enable_logging: Whether to enable detailed logging
         logger: Optional logger instance
         metrics_tracker: Optional metrics tracker instance
+        batched: Marshal the whole pool into one multi-role LLM call
+                 instead of one call per agent (see solve_pool_marshaled)
+        verbose: Print progress and result lines (batch runs turn this
+                 off so only their summary reaches stdout)
+        executor: Shared thread pool for the agent solves; batch runs pass
+                  one so threads are reused across tasks instead of being
+                  spawned per experiment
         
     Returns:
         Dictionary with results including final answer, token usage, etc.
     """
-    start_time = datetime.now()
-    
+    start_time = time.perf_counter_ns()
+
+    # Batch runs silence the per-experiment narration; stdout writes take
+    # a lock per line and the buffered status block below flushes once
+    say = print if verbose else (lambda *args, **kwargs: None)
+
+    # A sufficiently similar problem was already solved: reuse its result
+    # without running any agents. Correctness is re-evaluated against the
+    # caller's ground truth, which may differ from the cached run's.
+    if EXPERIMENT_CACHE is not None:
+        cached = EXPERIMENT_CACHE.lookup(problem)
+        if cached is not None:
+            say(f"[CACHE] Reusing prior experiment result "
+                  f"(similarity: {cached['semantic_similarity']:.2f})")
+            if ground_truth is not None:
+                cached["ground_truth"] = ground_truth
+                cached["correct"] = evaluate_answer(
+                    cached.get("final_answer", ""), ground_truth)
+            return cached
+
     # Initialize logger
     if enable_logging and logger is None:
         logger = StaticMASLogger()
     
-    # Initialize metrics tracker
-    if METRICS_AVAILABLE and metrics_tracker is None:
-        metrics_tracker = MetricsTracker("Static_MAS")
-    
+    # Initialize metrics tracker; the null tracker swallows the frequent
+    # tracking calls below without per-call guards
+    if metrics_tracker is None:
+        metrics_tracker = MetricsTracker("Static_MAS") if METRICS_AVAILABLE else NULL_TRACKER
+
     # Start metrics tracking
-    if metrics_tracker:
-        metrics_tracker.start_tracking(problem, ground_truth)
-        metrics_tracker.track_quality_attribute("modularity", "Fixed-role agents with parallel execution", "architecture")
-        metrics_tracker.track_quality_attribute("scalability", "Parallel execution with ThreadPoolExecutor", "execution")
+    metrics_tracker.start_tracking(problem, ground_truth)
+    metrics_tracker.track_quality_attribute("modularity", "Fixed-role agents with parallel execution", "architecture")
+    metrics_tracker.track_quality_attribute("scalability", "Parallel execution with ThreadPoolExecutor", "execution")
     
     if enable_logging and logger:
         logger.log_problem(problem, ground_truth)
@@ -210,120 +449,133 @@ def run_static_experiment(problem: str,
     # Create agent pool
     agents = create_static_agent_pool()
     
-    if metrics_tracker:
-        metrics_tracker.track_agent_count(len(agents))
-        metrics_tracker.track_reasoning_step(f"Created static agent pool with {len(agents)} agents", None, "setup")
-        metrics_tracker.track_round(1)  # Static MAS is single-pass
+    metrics_tracker.track_agent_count(len(agents))
+    metrics_tracker.track_reasoning_step(f"Created static agent pool with {len(agents)} agents", None, "setup")
+    metrics_tracker.track_round(1)  # Static MAS is single-pass
     
     if enable_logging and logger:
         logger.log_agents(agents)
     
-    print(f"\n{'='*80}")
-    print("Static MAS Experiment")
-    print(f"{'='*80}")
-    print(f"Problem: {problem[:100]}...")
-    print(f"Agents: {len(agents)}")
-    print(f"Aggregation Method: {aggregation_method}")
-    print(f"{'='*80}\n")
+    say(f"\n{'='*80}")
+    say("Static MAS Experiment")
+    say(f"{'='*80}")
+    say(f"Problem: {problem[:100]}...")
+    say(f"Agents: {len(agents)}")
+    say(f"Aggregation Method: {aggregation_method}")
+    say(f"{'='*80}\n")
     
-    # Execute all agents in parallel
+    # Execute all agents in parallel via the shared pool helper; results
+    # arrive in completion order with failures already converted to error
+    # results, so one failing agent never kills the batch.
     agent_results = []
-    
-    def solve_with_agent(agent):
-        """Wrapper to solve problem with an agent."""
-        try:
-            result = agent.solve(problem)
-            return result
-        except Exception as e:
-            print(f"Error with agent {agent.name}: {e}")
-            error_result = {
-                "agent": agent.name,
-                "role": agent.role,
-                "answer": f"Error: {str(e)}",
-                "confidence": 0.0,
-                "tokens": 0,
-                "error": str(e)
-            }
-            # Track error in metrics (if available in this context)
-            # Note: This is called in parallel, so we'll track errors in the main loop
-            return error_result
-    
-    # Use ThreadPoolExecutor for parallel execution
-    print("Executing agents in parallel...")
-    with ThreadPoolExecutor(max_workers=len(agents)) as executor:
-        future_to_agent = {executor.submit(solve_with_agent, agent): agent for agent in agents}
-        
-        for future in as_completed(future_to_agent):
-            agent = future_to_agent[future]
+    status_lines = []
+    running_tokens = 0
+
+    # With early consensus enabled, count normalized answers as they arrive
+    # and stop once the leader cannot be overtaken usefully
+    consensus_counts = None
+    if EARLY_CONSENSUS_K > 0 and aggregation_method == "majority_vote":
+        consensus_counts = Counter()
+
+    if batched:
+        say("Executing agents via one marshaled call...")
+        result_stream = solve_pool_marshaled(agents, problem)
+    else:
+        say("Executing agents in parallel...")
+        result_stream = solve_pool(agents, problem, executor=executor)
+    for agent, result in result_stream:
+        agent_results.append(result)
+        running_tokens += result.get("tokens", 0)
+
+        if result.get("error"):
+            if verbose:
+                status_lines.append(f"  [ERROR] {agent.name}: Error - {result['error']}")
+
+            # Track error in metrics
+            metrics_tracker.track_agent_error(
+                agent.name,
+                "execution_error",
+                result["error"],
+                recovered=False
+            )
+            metrics_tracker.track_agent_failure(
+                agent.name,
+                "execution_exception",
+                "error"
+            )
+            metrics_tracker.track_error_type("parsing", f"Agent {agent.name} execution error: {result['error']}", agent.name)
+
+            if enable_logging and logger:
+                logger.log_agent_result(result)
+            continue
+
+        # Track metrics
+        metrics_tracker.track_tokens(0, result.get("tokens", 0))  # Approximate split
+
+        # Track agent output
+        answer = result.get("answer", "")
+        if answer:
+            metrics_tracker.track_agent_output(agent.name, answer[:500])
+
+        # Track reasoning step
+        metrics_tracker.track_reasoning_step(
+            f"Agent {agent.name} ({agent.role}) produced answer: {answer[:100]}...",
+            agent.name,
+            "agent_action"
+        )
+
+        # Log result
+        if enable_logging and logger:
+            logger.log_agent_result(result)
+
+        if verbose:
+            status_lines.append(
+                f"  [OK] {agent.name} ({agent.role}): {result.get('answer', 'N/A')[:50]}... "
+                f"[Confidence: {result.get('confidence', 0.0):.2f}, Tokens: {result.get('tokens', 0)}]")
+
+        if consensus_counts is not None:
             try:
-                result = future.result()
-                agent_results.append(result)
-                
-                # Track metrics
-                if metrics_tracker:
-                    # Track tokens
-                    tokens = result.get("tokens", 0)
-                    metrics_tracker.track_tokens(0, tokens)  # Approximate split
-                    
-                    # Track agent output
-                    answer = result.get("answer", "")
-                    if answer:
-                        metrics_tracker.track_agent_output(agent.name, answer[:500])
-                    
-                    # Track reasoning step
-                    metrics_tracker.track_reasoning_step(
-                        f"Agent {agent.name} ({agent.role}) produced answer: {answer[:100]}...",
-                        agent.name,
-                        "agent_action"
-                    )
-                    
-                    # Check for outliers (answers that differ significantly)
-                    if result.get("error"):
-                        metrics_tracker.track_agent_error(
-                            agent.name,
-                            "execution_error",
-                            result.get("error", ""),
-                            recovered=False
-                        )
-                
-                # Log result
-                if enable_logging and logger:
-                    logger.log_agent_result(result)
-                
-                print(f"  [OK] {agent.name} ({agent.role}): {result.get('answer', 'N/A')[:50]}... "
-                      f"[Confidence: {result.get('confidence', 0.0):.2f}, Tokens: {result.get('tokens', 0)}]")
-            except Exception as e:
-                print(f"  [ERROR] {agent.name}: Error - {e}")
-                error_result = {
-                    "agent": agent.name,
-                    "role": agent.role,
-                    "answer": f"Error: {str(e)}",
-                    "confidence": 0.0,
-                    "tokens": 0,
-                    "error": str(e)
-                }
-                agent_results.append(error_result)
-                
-                # Track error in metrics
-                if metrics_tracker:
-                    metrics_tracker.track_agent_error(
-                        agent.name,
-                        "execution_error",
-                        str(e),
-                        recovered=False
-                    )
-                    metrics_tracker.track_agent_failure(
-                        agent.name,
-                        "execution_exception",
-                        "error"
-                    )
-                    metrics_tracker.track_error_type("parsing", f"Agent {agent.name} execution error: {str(e)}", agent.name)
-                
-                if enable_logging and logger:
-                    logger.log_agent_result(error_result)
-    
+                normalized = normalize_answer(result.get("answer", ""))
+            except Exception:
+                normalized = ""
+            if normalized:
+                consensus_counts[normalized] += 1
+                if consensus_counts[normalized] >= EARLY_CONSENSUS_K:
+                    status_lines.append(
+                        f"  Early consensus: {consensus_counts[normalized]} agents "
+                        f"agree; skipping remaining agents")
+                    break
+
+    # One buffered write per experiment instead of a locked stdout write
+    # per agent line
+    if verbose and status_lines:
+        sys.stdout.write("\n".join(status_lines) + "\n")
+
+    # Every agent failed (provider down, auth broken): aggregation,
+    # metrics scans and trace dumps would all chew on error strings, so
+    # bail with a canonical error result instead. Deliberately not added
+    # to the experiment cache - a retry should re-run the pool.
+    if agent_results and all(r.get("error") for r in agent_results):
+        say(f"\nAll {len(agent_results)} agents failed; skipping aggregation")
+        error_result = {
+            "problem": problem,
+            "ground_truth": ground_truth,
+            "agents": [{"name": a.name, "role": a.role, "backend": a.llm_backend} for a in agents],
+            "agent_results": agent_results,
+            "aggregation_method": aggregation_method,
+            "aggregation_result": {"final_answer": "", "method": aggregation_method,
+                                   "error": "all agents failed"},
+            "final_answer": "",
+            "total_tokens": running_tokens,
+            "execution_time": (time.perf_counter_ns() - start_time) / 1e9,
+            "error": "all agents failed"
+        }
+        if ground_truth:
+            error_result["correct"] = False
+        return error_result
+
     # Aggregate results
-    print(f"\nAggregating results using {aggregation_method}...")
+    say(f"\nAggregating results using {aggregation_method}...")
     aggregation_result = aggregate_results(agent_results, method=aggregation_method)
     
     # Track consensus and aggregation
@@ -331,54 +583,45 @@ def run_static_experiment(problem: str,
         # Track consensus event
         contributing_agents = []
         final_answer = aggregation_result.get("final_answer", "")
-        
+
+        # One pass precomputes what the contrib functions and the error
+        # count below compare on: each answer/role is lowered exactly once
+        # here, and the final answer exactly once inside the selected
+        # contrib function, instead of per-comparison allocations
+        normed = [
+            (r.get("agent", ""),
+             r.get("answer", "").strip().lower(),
+             r.get("role", "").lower(),
+             r.get("confidence", 0.0),
+             bool(r.get("error")))
+            for r in agent_results
+        ]
+
         # Find agents that contributed to the final answer
-        if aggregation_method == "majority_vote":
-            # Find agents with matching answers
-            for result in agent_results:
-                if result.get("answer", "").strip().lower() == final_answer.strip().lower():
-                    contributing_agents.append(result.get("agent", ""))
-            metrics_tracker.track_consensus_event(
-                contributing_agents,
-                "majority_vote",
-                1,
-                confidence=aggregation_result.get("confidence", None)
-            )
-            metrics_tracker.metrics["robustness"]["majority_vote_effectiveness"] = len(contributing_agents) / len(agent_results) if agent_results else 0
-        elif aggregation_method == "decider_based":
-            # Find decider agent
-            for result in agent_results:
-                if "decider" in result.get("role", "").lower():
-                    contributing_agents.append(result.get("agent", ""))
-            metrics_tracker.track_consensus_event(
-                contributing_agents,
-                "decider_based",
-                1,
-                confidence=aggregation_result.get("confidence", None)
-            )
-        elif aggregation_method == "most_confident":
-            # Find agent with highest confidence
-            max_confidence = max((r.get("confidence", 0.0) for r in agent_results), default=0.0)
-            for result in agent_results:
-                if result.get("confidence", 0.0) == max_confidence:
-                    contributing_agents.append(result.get("agent", ""))
+        contrib_fn = _CONTRIB_FNS.get(aggregation_method)
+        if contrib_fn is not None:
+            contributing_agents, confidence = contrib_fn(normed, final_answer)
+            if confidence is None:
+                confidence = aggregation_result.get("confidence", None)
             metrics_tracker.track_consensus_event(
                 contributing_agents,
-                "most_confident",
+                aggregation_method,
                 1,
-                confidence=max_confidence
+                confidence=confidence
             )
-        
+            if aggregation_method == "majority_vote":
+                metrics_tracker.metrics["robustness"]["majority_vote_effectiveness"] = len(contributing_agents) / len(agent_results) if agent_results else 0
+
         # Track decision step
         metrics_tracker.track_decision_step(
             f"Aggregation method {aggregation_method} selected final answer: {final_answer}",
             "aggregation"
         )
-        
+
         # Check for error recovery through voting
         if aggregation_method == "majority_vote" and len(contributing_agents) > 0:
             # Check if there were errors that were corrected by voting
-            error_count = sum(1 for r in agent_results if r.get("error"))
+            error_count = sum(1 for _, _, _, _, has_error in normed if has_error)
             if error_count > 0 and len(contributing_agents) > error_count:
                 metrics_tracker.track_agent_error(
                     "multiple_agents",
@@ -393,7 +636,7 @@ def run_static_experiment(problem: str,
         logger.log_aggregation(aggregation_result)
     
     # Prepare final result
-    execution_time = (datetime.now() - start_time).total_seconds()
+    execution_time = (time.perf_counter_ns() - start_time) / 1e9
     
     final_result = {
         "problem": problem,
@@ -403,7 +646,7 @@ def run_static_experiment(problem: str,
         "aggregation_method": aggregation_method,
         "aggregation_result": aggregation_result,
         "final_answer": aggregation_result.get("final_answer", ""),
-        "total_tokens": sum(r.get("tokens", 0) for r in agent_results),
+        "total_tokens": running_tokens,
         "execution_time": execution_time
     }
     
@@ -411,15 +654,15 @@ def run_static_experiment(problem: str,
     if ground_truth:
         correct = evaluate_answer(final_result["final_answer"], ground_truth)
         final_result["correct"] = correct
-        print(f"\nFinal Answer: {final_result['final_answer']}")
-        print(f"Ground Truth: {ground_truth}")
-        print(f"Correct: {correct}")
+        say(f"\nFinal Answer: {final_result['final_answer']}")
+        say(f"Ground Truth: {ground_truth}")
+        say(f"Correct: {correct}")
     else:
-        print(f"\nFinal Answer: {final_result['final_answer']}")
+        say(f"\nFinal Answer: {final_result['final_answer']}")
         correct = None
     
-    print(f"Total Tokens: {final_result['total_tokens']}")
-    print(f"Execution Time: {execution_time:.2f} seconds")
+    say(f"Total Tokens: {final_result['total_tokens']}")
+    say(f"Execution Time: {execution_time:.2f} seconds")
     
     # Finalize metrics tracking
     if metrics_tracker:
@@ -430,8 +673,8 @@ def run_static_experiment(problem: str,
         metrics_summary_path = metrics_tracker.save_summary_report()
         final_result["metrics_json"] = str(metrics_path)
         final_result["metrics_summary"] = str(metrics_summary_path)
-        print(f"\nMetrics saved to: {metrics_path}")
-        print(f"Metrics summary saved to: {metrics_summary_path}")
+        say(f"\nMetrics saved to: {metrics_path}")
+        say(f"Metrics summary saved to: {metrics_summary_path}")
     
     # Save logs
     if enable_logging and logger:
@@ -439,12 +682,152 @@ def run_static_experiment(problem: str,
         txt_path = logger.save_text_report()
         final_result["trace_json"] = str(json_path)
         final_result["trace_txt"] = str(txt_path)
-        print(f"\nTrace saved to: {json_path}")
-        print(f"Report saved to: {txt_path}")
-    
+        say(f"\nTrace saved to: {json_path}")
+        say(f"Report saved to: {txt_path}")
+
+    if EXPERIMENT_CACHE is not None:
+        EXPERIMENT_CACHE.add(problem, final_result)
+
     return final_result
 
 
+# Agent results per sha256(problem), so repeated multi-method runs of the
+# same fixed test problems within one process reuse the inference pass
+_AGENT_RESULTS_CACHE: Dict[str, Any] = {}
+
+
+def run_static_experiment_multi(problem: str,
+                                ground_truth: Optional[str] = None,
+                                aggregation_methods: List[str] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Run the agent pool once and aggregate its results with several methods.
+
+    Aggregation is the only thing that differs between methods; running a
+    full experiment per method re-spends the pool's LLM calls on identical
+    answers. This solves the problem once and applies each method to the
+    cached per-agent results, so comparing M methods costs one inference
+    pass instead of M. The pass is also memoized per problem text for the
+    lifetime of the process, so test scripts replaying the same fixed
+    cases skip inference entirely on later calls.
+
+    Per-method results mirror run_static_experiment's shape; note that
+    total_tokens in each reflects the one shared pass, so summing it
+    across methods overcounts the actual spend.
+
+    Args:
+        problem: The problem/question to solve
+        ground_truth: Optional ground truth answer for evaluation
+        aggregation_methods: Methods to apply (default: all four)
+
+    Returns:
+        Dict mapping each method to its result dictionary
+    """
+    if aggregation_methods is None:
+        aggregation_methods = ["majority_vote", "decider_based",
+                               "most_confident", "weighted_average"]
+
+    key = hashlib.sha256(problem.encode("utf-8")).hexdigest()
+    cached = _AGENT_RESULTS_CACHE.get(key)
+    if cached is None:
+        solve_start = time.perf_counter_ns()
+        agents = create_static_agent_pool()
+        agent_results = [result for _agent, result in solve_pool(agents, problem)]
+        cached = (
+            [{"name": a.name, "role": a.role, "backend": a.llm_backend} for a in agents],
+            agent_results,
+            (time.perf_counter_ns() - solve_start) / 1e9
+        )
+        _AGENT_RESULTS_CACHE[key] = cached
+    agents_meta, agent_results, solve_seconds = cached
+    total_tokens = sum(r.get("tokens", 0) for r in agent_results)
+
+    results = {}
+    for method in aggregation_methods:
+        aggregation_start = time.perf_counter_ns()
+        aggregation_result = aggregate_results(agent_results, method=method)
+        result = {
+            "problem": problem,
+            "ground_truth": ground_truth,
+            "agents": agents_meta,
+            "agent_results": agent_results,
+            "aggregation_method": method,
+            "aggregation_result": aggregation_result,
+            "final_answer": aggregation_result.get("final_answer", ""),
+            "total_tokens": total_tokens,
+            "execution_time": solve_seconds + (time.perf_counter_ns() - aggregation_start) / 1e9
+        }
+        if ground_truth:
+            result["correct"] = evaluate_answer(result["final_answer"], ground_truth)
+        results[method] = result
+    return results
+
+
+def run_static_experiment_streaming(problem: str,
+                                    ground_truth: Optional[str] = None,
+                                    aggregation_method: str = "majority_vote",
+                                    enable_logging: bool = True,
+                                    logger: Optional[StaticMASLogger] = None):
+    """
+    Generator variant of run_static_experiment for incremental display.
+
+    Yields each per-agent result dict as its agent completes (completion
+    order, straight off solve_pool), then the experiment-shaped final
+    result as the last item; callers can tell the final dict apart by its
+    "final_answer" key. Total time matches the blocking path - what
+    improves is perceived latency: the first answer appears after the
+    fastest agent instead of after the slowest, and a failing agent is
+    visible immediately.
+
+    Interactive display is the use case, so the metrics tracker and
+    experiment cache are skipped; traces are still written when
+    enable_logging is set.
+    """
+    start_time = time.perf_counter_ns()
+
+    if enable_logging and logger is None:
+        logger = StaticMASLogger()
+
+    agents = create_static_agent_pool()
+
+    if enable_logging and logger:
+        logger.log_problem(problem, ground_truth)
+        logger.log_agents(agents)
+
+    agent_results = []
+    total_tokens = 0
+    for agent, result in solve_pool(agents, problem):
+        agent_results.append(result)
+        total_tokens += result.get("tokens", 0)
+        if enable_logging and logger:
+            logger.log_agent_result(result)
+        yield result
+
+    aggregation_result = aggregate_results(agent_results, method=aggregation_method)
+    if enable_logging and logger:
+        logger.log_aggregation(aggregation_result)
+
+    final_result = {
+        "problem": problem,
+        "ground_truth": ground_truth,
+        "agents": [{"name": a.name, "role": a.role, "backend": a.llm_backend} for a in agents],
+        "agent_results": agent_results,
+        "aggregation_method": aggregation_method,
+        "aggregation_result": aggregation_result,
+        "final_answer": aggregation_result.get("final_answer", ""),
+        "total_tokens": total_tokens,
+        "execution_time": (time.perf_counter_ns() - start_time) / 1e9
+    }
+    if ground_truth:
+        final_result["correct"] = evaluate_answer(final_result["final_answer"],
+                                                  ground_truth)
+
+    if enable_logging and logger:
+        final_result["trace_json"] = str(logger.save())
+        final_result["trace_txt"] = str(logger.save_text_report())
+
+    yield final_result
+
+
 def evaluate_answer(predicted: str, ground_truth: str) -> bool:
     """
     Simple answer evaluation.
@@ -461,46 +844,284 @@ def evaluate_answer(predicted: str, ground_truth: str) -> bool:
         predicted = str(predicted)
     if not isinstance(ground_truth, str):
         ground_truth = str(ground_truth)
-    
-    # Normalize answers
+
+    # Normalize answers (the ground-truth side is memoized: the same
+    # truth is checked once per aggregation method and once per repeated
+    # dataset case)
     pred_norm = predicted.lower().strip()
-    gt_norm = ground_truth.lower().strip()
-    
+    gt_norm, gt_numbers = _canonical_truth(ground_truth)
+
     # Exact match
     if pred_norm == gt_norm:
         return True
-    
+
     # Check if ground truth is contained in prediction
     if gt_norm in pred_norm:
         return True
-    
+
     # Extract numbers and compare
-    import re
-    pred_numbers = re.findall(r'\d+\.?\d*', pred_norm)
-    gt_numbers = re.findall(r'\d+\.?\d*', gt_norm)
-    
+    pred_numbers = _NUM_RE.findall(pred_norm)
+
     if pred_numbers and gt_numbers:
         return pred_numbers[-1] == gt_numbers[-1]
-    
+
     return False
 
 
+@functools.lru_cache(maxsize=512)
+def _canonical_truth(ground_truth: str):
+    """Normalized form and extracted numbers for one ground truth, cached."""
+    gt_norm = ground_truth.lower().strip()
+    return gt_norm, tuple(_NUM_RE.findall(gt_norm))
+
+
+def build_batch_problem(problems: List[str]) -> str:
+    """
+    Marshal several problems into a single agent prompt.
+
+    Args:
+        problems: List of problem/question strings
+
+    Returns:
+        Combined problem text instructing a JSON {"answers": [...]} response
+    """
+    sections = [f"### Case {i + 1}:\n{problem}" for i, problem in enumerate(problems)]
+    return (
+        f"Solve the following {len(problems)} problems independently.\n\n"
+        + "\n\n".join(sections)
+        + "\n\nReturn your solutions as JSON in the form "
+          '{"answers": ["answer to case 1", "answer to case 2", ...], '
+          '"confidence": 0.0-1.0} with exactly one answer per case, in order.'
+    )
+
+
+def run_static_batch(problems: List[str],
+                     ground_truths: Optional[List[str]] = None,
+                     aggregation_method: str = "majority_vote",
+                     max_batch_size: int = 4) -> List[Dict[str, Any]]:
+    """
+    Run several problems through the Static MAS pool with one LLM call per agent.
+
+    Each agent receives all problems marshaled into one prompt and returns a
+    JSON {"answers": [...]} list, so the pool makes len(agents) calls total
+    instead of len(agents) * len(problems). Answers are split back per problem
+    and aggregated per case. Falls back to per-problem run_static_experiment
+    calls if too few agents return a parseable answer list.
+
+    Args:
+        problems: List of problem/question strings
+        ground_truths: Optional list of ground truth answers (same length)
+        aggregation_method: Method to aggregate results per case
+        max_batch_size: Maximum problems per batched prompt
+
+    Returns:
+        List of result dictionaries, one per problem, in input order
+    """
+    from llm_integration.api import call_llm, parse_json_response
+
+    if ground_truths is None:
+        ground_truths = [None] * len(problems)
+
+    # Split oversized batches into capped chunks
+    if len(problems) > max_batch_size:
+        results = []
+        for start in range(0, len(problems), max_batch_size):
+            results.extend(run_static_batch(
+                problems[start:start + max_batch_size],
+                ground_truths[start:start + max_batch_size],
+                aggregation_method=aggregation_method,
+                max_batch_size=max_batch_size
+            ))
+        return results
+
+    start_time = time.perf_counter_ns()
+    agents = create_static_agent_pool()
+    batch_problem = build_batch_problem(problems)
+
+    print(f"\n{'='*80}")
+    print(f"Static MAS Batch Experiment ({len(problems)} problems)")
+    print(f"Agents: {len(agents)}")
+    print(f"Aggregation Method: {aggregation_method}")
+    print(f"{'='*80}\n")
+
+    def solve_batch_with_agent(agent):
+        """Run the marshaled prompt through one agent and split its answers."""
+        response = call_llm(batch_problem, agent.llm_backend,
+                            system_prompt=agent.system_prompt)
+        parsed = parse_json_response(response["content"])
+        answers = parsed.get("answers") if isinstance(parsed, dict) else None
+        if not isinstance(answers, list) or len(answers) != len(problems):
+            raise ValueError("batch response missing per-case answers")
+        return {
+            "agent": agent.name,
+            "role": agent.role,
+            "answers": [str(a) for a in answers],
+            "confidence": parsed.get("confidence", 0.5),
+            "tokens": response["metadata"].get("tokens_used", 0)
+        }
+
+    # One parallel pass over the pool, one LLM call per agent
+    agent_batches = []
+    print("Executing agents in parallel (batched prompts)...")
+    with ThreadPoolExecutor(max_workers=len(agents)) as executor:
+        future_to_agent = {executor.submit(solve_batch_with_agent, agent): agent
+                           for agent in agents}
+        for future in as_completed(future_to_agent):
+            agent = future_to_agent[future]
+            try:
+                batch_result = future.result()
+                agent_batches.append(batch_result)
+                print(f"  [OK] {agent.name} ({agent.role}): {len(batch_result['answers'])} answers "
+                      f"[Tokens: {batch_result['tokens']}]")
+            except Exception as e:
+                print(f"  [ERROR] {agent.name}: {e}")
+
+    # If the pool largely failed to follow the batch schema, run per-problem
+    if len(agent_batches) < 2:
+        print("Too few parseable batch responses. Falling back to per-problem runs.")
+        return [
+            run_static_experiment(problem, ground_truth=gt,
+                                  aggregation_method=aggregation_method,
+                                  enable_logging=False)
+            for problem, gt in zip(problems, ground_truths)
+        ]
+
+    execution_time = (time.perf_counter_ns() - start_time) / 1e9
+    total_tokens = sum(b["tokens"] for b in agent_batches)
+
+    # Split each agent's answer list back into per-case results and aggregate
+    results = []
+    for case_idx, (problem, ground_truth) in enumerate(zip(problems, ground_truths)):
+        agent_results = [
+            {
+                "agent": batch["agent"],
+                "role": batch["role"],
+                "answer": batch["answers"][case_idx],
+                "confidence": batch["confidence"],
+                "tokens": batch["tokens"] // len(problems)
+            }
+            for batch in agent_batches
+        ]
+        aggregation_result = aggregate_results(agent_results, method=aggregation_method)
+
+        result = {
+            "problem": problem,
+            "ground_truth": ground_truth,
+            "agents": [{"name": a.name, "role": a.role, "backend": a.llm_backend}
+                       for a in agents],
+            "agent_results": agent_results,
+            "aggregation_method": aggregation_method,
+            "aggregation_result": aggregation_result,
+            "final_answer": aggregation_result.get("final_answer", ""),
+            "total_tokens": total_tokens // len(problems),
+            "execution_time": execution_time / len(problems),
+            "batched": True
+        }
+        if ground_truth:
+            result["correct"] = evaluate_answer(result["final_answer"], ground_truth)
+        results.append(result)
+
+    return results
+
+
+def _bin_tasks_by_length(indexed_tasks, bins: int):
+    """
+    Partition (index, task) pairs into length-homogeneous bins.
+
+    Tasks are sorted by estimated question token count and split into up
+    to `bins` contiguous, roughly equal-sized groups, shortest first.
+    Problem length is a cheap proxy for response length, which dominates
+    each task's latency.
+    """
+    from llm_integration.api import estimate_tokens
+
+    if bins <= 1 or len(indexed_tasks) <= bins:
+        return [indexed_tasks] if indexed_tasks else []
+
+    ordered = sorted(indexed_tasks,
+                     key=lambda it: estimate_tokens(it[1].get("question", "")))
+    size = -(-len(ordered) // bins)  # ceil division
+    return [ordered[start:start + size] for start in range(0, len(ordered), size)]
+
+
+def run_static_experiments_batch(cases: List[tuple]) -> List[Dict[str, Any]]:
+    """
+    Run several (problem, ground_truth, aggregation_method) cases batched.
+
+    Groups the cases by aggregation method and sends each group through
+    run_static_batch, so every problem sharing a method rides the same
+    marshaled prompts - one LLM call per agent per group instead of one
+    per (agent, problem) pair. Results come back in input order.
+
+    Args:
+        cases: Tuples of (problem, ground_truth, aggregation_method);
+               ground_truth may be None
+
+    Returns:
+        List of result dictionaries, one per case, in input order
+    """
+    by_method = {}
+    for index, (problem, ground_truth, method) in enumerate(cases):
+        by_method.setdefault(method, []).append((index, problem, ground_truth))
+
+    results = [None] * len(cases)
+    for method, group in by_method.items():
+        group_results = run_static_batch(
+            [problem for _, problem, _ in group],
+            [ground_truth for _, _, ground_truth in group],
+            aggregation_method=method
+        )
+        for (index, _, _), result in zip(group, group_results):
+            results[index] = result
+    return results
+
+
 def run_batch_experiments(tasks: List[Dict[str, Any]],
                          aggregation_method: str = "majority_vote",
-                         output_dir: str = "static_mas/results") -> Dict[str, Any]:
+                         output_dir: str = "static_mas/results",
+                         max_parallel_tasks: Optional[int] = None,
+                         bins: int = 3) -> Dict[str, Any]:
     """
     Run Static MAS experiments on a batch of tasks.
-    
+
+    Tasks run sequentially by default. With max_parallel_tasks > 1 (or
+    MAS_BATCH_PARALLEL set), several tasks run concurrently so the LLM
+    backend stays busy between tasks instead of draining one agent pool
+    before the next starts; completed results are collected in completion
+    order. Each task already fans out over its agents, so total in-flight
+    calls approach max_parallel_tasks * pool size - keep the cap modest
+    to avoid overloading the backend.
+
+    In parallel mode, tasks are first binned by estimated question length
+    and the bins dispatched one after another. Mixing short and long
+    problems in one wave leaves the pool stalling on its longest request
+    while finished workers idle; length-homogeneous waves keep completion
+    times within a wave close together.
+
     Args:
         tasks: List of task dictionaries with 'question' and optional 'answer'
         aggregation_method: Aggregation method to use
         output_dir: Directory to save results
-        
+        max_parallel_tasks: Concurrent task cap (default: MAS_BATCH_PARALLEL
+                            env var, falling back to 1 = sequential)
+        bins: Number of length bins for parallel dispatch
+
     Returns:
         Summary dictionary with results
     """
+    if max_parallel_tasks is None:
+        max_parallel_tasks = int(os.getenv("MAS_BATCH_PARALLEL", "1"))
     os.makedirs(output_dir, exist_ok=True)
-    
+
+    # Exact-match result cache: identical (question, method) pairs across
+    # datasets (deduped MMLU/GSM8K splits repeat questions) reuse the
+    # stored result instead of re-running the pool. One JSON file per key,
+    # like the response cache; MAS_DISABLE_CACHE=1 turns it off too.
+    cache_dir = None
+    if os.getenv("MAS_DISABLE_CACHE", "").lower() not in ("1", "true"):
+        cache_dir = os.path.join(output_dir, "cache")
+        os.makedirs(cache_dir, exist_ok=True)
+
     results = {
         "total_tasks": len(tasks),
         "completed": 0,
@@ -509,49 +1130,127 @@ def run_batch_experiments(tasks: List[Dict[str, Any]],
         "experiments": []
     }
     
-    for i, task in enumerate(tasks):
+    # Per-task result files go through one background writer thread, so
+    # serialization and disk writes overlap the next task's LLM waits
+    # instead of blocking the task path
+    io_queue = queue.Queue()
+
+    def _result_writer():
+        for path, obj in iter(io_queue.get, None):
+            try:
+                _dump_json(obj, path)
+            except (OSError, TypeError) as e:
+                print(f"Warning: could not write {path}: {e}")
+
+    writer_thread = threading.Thread(target=_result_writer,
+                                     name="mas-result-writer", daemon=True)
+    writer_thread.start()
+
+    # One thread pool serves every task's agent solves; seven threads per
+    # concurrent task, reused across the whole batch instead of spawned
+    # and torn down per experiment (which also keeps the HTTP session's
+    # pooled connections warm)
+    agent_executor = ThreadPoolExecutor(
+        max_workers=7 * max(max_parallel_tasks, 1),
+        thread_name_prefix="mas-agent")
+
+    def process_task(i, task):
+        """Run one task end to end; returns its experiment result dict."""
         print(f"\n{'='*60}")
         print(f"Task {i+1}/{len(tasks)}")
         print(f"Question: {task.get('question', 'N/A')[:100]}...")
         print(f"{'='*60}")
-        
-        try:
+
+        question = task.get("question", "")
+        cache_file = None
+        experiment_result = None
+        if cache_dir is not None:
+            key = hashlib.sha256(
+                f"{question}|{aggregation_method}".encode("utf-8")
+            ).hexdigest()
+            cache_file = os.path.join(cache_dir, f"{key}.json")
+            if os.path.exists(cache_file):
+                try:
+                    with open(cache_file, 'r', encoding='utf-8') as f:
+                        experiment_result = json.load(f)
+                    print("[CACHE] Reusing result for identical question")
+                except (json.JSONDecodeError, OSError):
+                    experiment_result = None
+
+        if experiment_result is None:
             experiment_result = run_static_experiment(
-                problem=task.get("question", ""),
+                problem=question,
                 ground_truth=task.get("answer"),
-                aggregation_method=aggregation_method
+                aggregation_method=aggregation_method,
+                verbose=False,
+                executor=agent_executor
             )
-            
-            experiment_result["task_id"] = task.get("task_id", i)
-            experiment_result["dataset"] = task.get("dataset", "unknown")
-            
-            results["experiments"].append(experiment_result)
-            results["completed"] += 1
-            results["total_tokens"] += experiment_result.get("total_tokens", 0)
-            
-            if experiment_result.get("correct"):
-                results["correct"] += 1
-            
-            # Save individual result
-            result_file = os.path.join(output_dir, f"result_{i+1}.json")
-            with open(result_file, 'w', encoding='utf-8') as f:
-                json.dump(experiment_result, f, indent=2)
-        
-        except Exception as e:
-            print(f"Error running experiment {i+1}: {e}")
+            if cache_file is not None:
+                try:
+                    _dump_json(experiment_result, cache_file)
+                except (OSError, TypeError) as e:
+                    print(f"Warning: could not cache result: {e}")
+
+        experiment_result["task_id"] = task.get("task_id", i)
+        experiment_result["dataset"] = task.get("dataset", "unknown")
+
+        # Save individual result (handed to the writer thread)
+        result_file = os.path.join(output_dir, f"result_{i+1}.json")
+        io_queue.put((result_file, experiment_result))
+
+        return experiment_result
+
+    def record(i, task, outcome):
+        """Fold one task's outcome (result or exception) into the summary."""
+        if isinstance(outcome, Exception):
+            print(f"Error running experiment {i+1}: {outcome}")
             results["experiments"].append({
                 "task_id": task.get("task_id", i),
-                "error": str(e)
+                "error": str(outcome)
             })
+            return
+        results["experiments"].append(outcome)
+        results["completed"] += 1
+        results["total_tokens"] += outcome.get("total_tokens", 0)
+        if outcome.get("correct"):
+            results["correct"] += 1
+
+    if max_parallel_tasks > 1:
+        with ThreadPoolExecutor(max_workers=max_parallel_tasks) as executor:
+            for bin_tasks in _bin_tasks_by_length(list(enumerate(tasks)), bins):
+                bin_start = datetime.now()
+                future_to_task = {executor.submit(process_task, i, task): (i, task)
+                                  for i, task in bin_tasks}
+                for future in as_completed(future_to_task):
+                    i, task = future_to_task[future]
+                    try:
+                        record(i, task, future.result())
+                    except Exception as e:
+                        record(i, task, e)
+                bin_seconds = (datetime.now() - bin_start).total_seconds()
+                if bin_seconds > 0:
+                    print(f"[BIN] {len(bin_tasks)} tasks in {bin_seconds:.1f}s "
+                          f"({len(bin_tasks) / bin_seconds:.2f} tasks/s)")
+    else:
+        for i, task in enumerate(tasks):
+            try:
+                record(i, task, process_task(i, task))
+            except Exception as e:
+                record(i, task, e)
     
+    agent_executor.shutdown(wait=False)
+
+    # Drain pending result writes before the summary goes out
+    io_queue.put(None)
+    writer_thread.join()
+
     # Calculate accuracy
     if results["completed"] > 0:
         results["accuracy"] = results["correct"] / results["completed"]
     
     # Save summary
     summary_file = os.path.join(output_dir, "summary.json")
-    with open(summary_file, 'w', encoding='utf-8', errors='replace') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    _dump_json(results, summary_file)
     
     print(f"\n{'='*60}")
     print("Batch Experiment Summary")
@@ -0,0 +1,52 @@
+"""
+Lightweight token-usage accounting for experiment summaries.
+
+The test scripts total tokens by re-scanning result dicts inside their
+print loops, and since run_static_experiment_multi feeds every
+aggregation method from one shared inference pass, naively summing
+per-method totals overstates what was actually spent. TokenUsage
+accumulates both figures once so summary loops stay pure formatters and
+the savings from shared inference are visible in the output.
+
+Results themselves remain plain dicts (they are dumped to JSON traces);
+this accumulator lives only in the reporting layer.
+"""
+from typing import Any, Dict
+
+
+class TokenUsage:
+    """Running token totals across one or more experiment results."""
+
+    __slots__ = ('total', 'billed', 'experiments')
+
+    def __init__(self):
+        self.total = 0        # sum of per-result totals (naive)
+        self.billed = 0       # tokens actually spent on inference
+        self.experiments = 0
+
+    def record(self, result: Dict[str, Any], shared: bool = False):
+        """
+        Add one experiment result's token count.
+
+        Args:
+            result: A run_static_experiment-shaped result dict
+            shared: True when this result reuses an inference pass already
+                    recorded (e.g. another aggregation method over the
+                    same agent pool), so its tokens were not spent again
+        """
+        tokens = int(result.get("total_tokens", 0) or 0)
+        self.total += tokens
+        if not shared:
+            self.billed += tokens
+        self.experiments += 1
+
+    @property
+    def saved(self) -> int:
+        """Tokens the naive per-result sum would overstate by."""
+        return self.total - self.billed
+
+    def __str__(self) -> str:
+        if self.saved:
+            return (f"{self.billed} tokens across {self.experiments} "
+                    f"experiments ({self.saved} saved by shared inference)")
+        return f"{self.billed} tokens across {self.experiments} experiments"
@@ -2,37 +2,62 @@
 Fast version: Run easy cases with just one aggregation method (majority_vote).
 This is faster than running all 4 aggregation methods.
 """
+import io
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import threading
+from concurrent.futures import ThreadPoolExecutor
+# Guarded insert so repeated imports don't grow sys.path with duplicates
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
-from static_mas.run_experiment import run_static_experiment
+from static_mas.run_experiment import (run_static_experiment_streaming,
+                                       run_static_experiments_batch)
+from static_mas.telemetry import TokenUsage
+from static_mas.test_fixtures import (CASE_A_PROBLEM, CASE_A_GT,
+                                      CASE_B_PROBLEM, CASE_B_GT)
+
+# Banner separators, built once per import rather than per print
+_BAR = "=" * 80
+_RULE = "-" * 80
 
 
 def test_case_a_fast():
     """Case A: Mathematical Problem - Fast version with one aggregation method."""
-    print("="*80)
+    print(_BAR)
     print("STATIC MAS - TEST CASE A: Mathematical Problem (FAST)")
-    print("="*80)
+    print(_BAR)
     
-    problem = "In the land of Ink, the money system is unique. One Trinket is equal to 4 Blinkets, and 3 Blinkets are equal to 7 Drinkets. In Trinkets, what is the value of 56 Drinkets?"
-    ground_truth = "6 Trinkets"
+    problem = CASE_A_PROBLEM
+    ground_truth = CASE_A_GT
     
     print(f"\nProblem: {problem}")
     print(f"Ground Truth: {ground_truth}")
     print("\nRunning Static MAS with majority_vote aggregation...")
-    print("-"*80)
+    print(_RULE)
     
-    result = run_static_experiment(
+    # Stream answers as agents finish instead of waiting for the slowest
+    print("\nAgent answers (as they arrive):")
+    result = None
+    for item in run_static_experiment_streaming(
         problem=problem,
         ground_truth=ground_truth,
         aggregation_method="majority_vote",
         enable_logging=True
-    )
+    ):
+        if "final_answer" in item:
+            result = item
+        elif item.get('error'):
+            print(f"  - {item.get('agent', 'N/A')}: Error - {item.get('error')}")
+        else:
+            answer_preview = (item.get('answer_preview')
+                              or str(item.get('answer', 'N/A')))[:60]
+            print(f"  - {item.get('agent', 'N/A')} ({item.get('role', 'N/A')}): {answer_preview}... [Conf: {item.get('confidence', 0.0):.2f}]")
     
-    print("\n" + "="*80)
+    print("\n" + _BAR)
     print("CASE A RESULTS - STATIC MAS")
-    print("="*80)
+    print(_BAR)
     print(f"Final Answer: {result.get('final_answer', 'N/A')}")
     print(f"Ground Truth: {ground_truth}")
     print(f"Correct: {result.get('correct', False)}")
@@ -40,40 +65,45 @@ def test_case_a_fast():
     print(f"Execution Time: {result.get('execution_time', 0):.2f} seconds")
     print(f"Number of Agents: {len(result.get('agents', []))}")
     
-    print(f"\nAgent Answers:")
-    for agent_result in result.get('agent_results', []):
-        if not agent_result.get('error'):
-            answer_preview = str(agent_result.get('answer', 'N/A'))[:60]
-            print(f"  - {agent_result.get('agent', 'N/A')} ({agent_result.get('role', 'N/A')}): {answer_preview}... [Conf: {agent_result.get('confidence', 0.0):.2f}]")
-    
-    print("\n" + "="*80)
+    print("\n" + _BAR)
     return result
 
 
 def test_case_b_fast():
     """Case B: Common Knowledge Question - Fast version."""
-    print("\n" + "="*80)
+    print("\n" + _BAR)
     print("STATIC MAS - TEST CASE B: Common Knowledge Question (FAST)")
-    print("="*80)
+    print(_BAR)
     
-    problem = "Why is the sky blue? A) Because the molecules that compose the Earth's atmosphere have a blue-ish color. B) Because the sky reflects the color of the Earth's oceans. C) Because the atmosphere preferentially scatters short wavelengths. D) Because the Earth's atmosphere preferentially absorbs all other colors."
-    ground_truth = "C"
+    problem = CASE_B_PROBLEM
+    ground_truth = CASE_B_GT
     
     print(f"\nProblem: {problem}")
     print(f"Ground Truth: {ground_truth}")
     print("\nRunning Static MAS with majority_vote aggregation...")
-    print("-"*80)
+    print(_RULE)
     
-    result = run_static_experiment(
+    # Stream answers as agents finish instead of waiting for the slowest
+    print("\nAgent answers (as they arrive):")
+    result = None
+    for item in run_static_experiment_streaming(
         problem=problem,
         ground_truth=ground_truth,
         aggregation_method="majority_vote",
         enable_logging=True
-    )
+    ):
+        if "final_answer" in item:
+            result = item
+        elif item.get('error'):
+            print(f"  - {item.get('agent', 'N/A')}: Error - {item.get('error')}")
+        else:
+            answer_preview = (item.get('answer_preview')
+                              or str(item.get('answer', 'N/A')))[:60]
+            print(f"  - {item.get('agent', 'N/A')} ({item.get('role', 'N/A')}): {answer_preview}... [Conf: {item.get('confidence', 0.0):.2f}]")
     
-    print("\n" + "="*80)
+    print("\n" + _BAR)
     print("CASE B RESULTS - STATIC MAS")
-    print("="*80)
+    print(_BAR)
     print(f"Final Answer: {result.get('final_answer', 'N/A')}")
     print(f"Ground Truth: {ground_truth}")
     print(f"Correct: {result.get('correct', False)}")
@@ -81,32 +111,89 @@ def test_case_b_fast():
     print(f"Execution Time: {result.get('execution_time', 0):.2f} seconds")
     print(f"Number of Agents: {len(result.get('agents', []))}")
     
-    print(f"\nAgent Answers:")
-    for agent_result in result.get('agent_results', []):
-        if not agent_result.get('error'):
-            answer_preview = str(agent_result.get('answer', 'N/A'))[:60]
-            print(f"  - {agent_result.get('agent', 'N/A')} ({agent_result.get('role', 'N/A')}): {answer_preview}... [Conf: {agent_result.get('confidence', 0.0):.2f}]")
-    
-    print("\n" + "="*80)
+    print("\n" + _BAR)
     return result
 
 
+class _ThreadRoutedStdout:
+    """
+    Routes print output to a per-thread buffer when one is registered.
+
+    Both fast cases narrate their own progress; running them in parallel
+    would interleave their lines mid-report. Each worker registers a
+    private buffer, writes from threads without one (e.g. the agent
+    pool's workers) fall through to the real stream, and __main__ replays
+    the buffers in order once both cases finish.
+    """
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def register(self, buffer):
+        self._local.buffer = buffer
+
+    def write(self, text):
+        return getattr(self._local, 'buffer', self._fallback).write(text)
+
+    def flush(self):
+        getattr(self._local, 'buffer', self._fallback).flush()
+
+
+def _run_buffered(test_fn):
+    """Run one test case with its prints captured in a private buffer."""
+    buffer = io.StringIO()
+    sys.stdout.register(buffer)
+    return test_fn(), buffer
+
+
 if __name__ == "__main__":
-    print("\n" + "="*80)
+    # The cases are fixed, so serve repeat runs from the disk cache
+    # (zero LLM traffic). Pass --no-cache to force fresh calls.
+    if "--no-cache" not in sys.argv:
+        os.environ.setdefault("MAS_CACHE_SAMPLED", "1")
+
+    print("\n" + _BAR)
     print("STATIC MAS - EASY CASES (FAST VERSION)")
-    print("="*80)
+    print(_BAR)
     print("\nRunning with majority_vote aggregation only (faster).")
     print("For full comparison with all methods, use: python static_mas/test_easy_cases.py")
-    print("="*80 + "\n")
-    
-    result_a = test_case_a_fast()
-    result_b = test_case_b_fast()
-    
-    print("\n" + "="*80)
+    print(_BAR + "\n")
+
+    if "--batch" in sys.argv:
+        # Both cases ride the same marshaled prompts: one LLM call per
+        # agent covers the two problems, at the cost of the incremental
+        # per-agent output of the default path.
+        print("Running both cases as one marshaled batch (--batch)...")
+        result_a, result_b = run_static_experiments_batch([
+            (CASE_A_PROBLEM, CASE_A_GT, "majority_vote"),
+            (CASE_B_PROBLEM, CASE_B_GT, "majority_vote"),
+        ])
+    else:
+        # The cases share no state, so overlapping them cuts the wall time
+        # to roughly the slower of the two instead of their sum.
+        real_stdout = sys.stdout
+        sys.stdout = _ThreadRoutedStdout(real_stdout)
+        try:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                future_a = executor.submit(_run_buffered, test_case_a_fast)
+                future_b = executor.submit(_run_buffered, test_case_b_fast)
+                result_a, output_a = future_a.result()
+                result_b, output_b = future_b.result()
+        finally:
+            sys.stdout = real_stdout
+        sys.stdout.write(output_a.getvalue())
+        sys.stdout.write(output_b.getvalue())
+
+    print("\n" + _BAR)
     print("SUMMARY")
-    print("="*80)
+    print(_BAR)
     print(f"Case A - Correct: {result_a.get('correct', False)}, Tokens: {result_a.get('total_tokens', 0)}, Time: {result_a.get('execution_time', 0):.2f}s")
     print(f"Case B - Correct: {result_b.get('correct', False)}, Tokens: {result_b.get('total_tokens', 0)}, Time: {result_b.get('execution_time', 0):.2f}s")
+    usage = TokenUsage()
+    usage.record(result_a)
+    usage.record(result_b)
+    print(f"Combined: {usage}")
     print("\nTrace files saved in: static_mas/outputs/")
-    print("="*80)
+    print(_BAR)
 
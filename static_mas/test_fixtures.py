@@ -0,0 +1,17 @@
+"""
+Shared problem fixtures for the easy-case test scripts.
+
+test_easy_cases and test_easy_cases_fast exercised the same two cases
+but each carried its own copy of the problem literals, so edits had to
+be mirrored by hand and every module re-embedded the ~500-byte strings.
+One definition here keeps the suites in lockstep; the strings are
+interned once and shared by every importer.
+"""
+
+# Case A: mathematical problem (unit conversion)
+CASE_A_PROBLEM = "In the land of Ink, the money system is unique. One Trinket is equal to 4 Blinkets, and 3 Blinkets are equal to 7 Drinkets. In Trinkets, what is the value of 56 Drinkets?"
+CASE_A_GT = "6 Trinkets"
+
+# Case B: common knowledge question (multiple choice)
+CASE_B_PROBLEM = "Why is the sky blue? A) Because the molecules that compose the Earth's atmosphere have a blue-ish color. B) Because the sky reflects the color of the Earth's oceans. C) Because the atmosphere preferentially scatters short wavelengths. D) Because the Earth's atmosphere preferentially absorbs all other colors."
+CASE_B_GT = "C"
@@ -3,16 +3,26 @@ Simple test with just one aggregation method to verify Static MAS works.
 """
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Guarded insert so repeated imports don't grow sys.path with duplicates
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from static_mas.run_experiment import run_static_experiment
 
+# Banner separators, built once per import rather than per print
+_BAR = "=" * 80
+_RULE = "-" * 80
+
+# One-line failures instead of full tracebacks (keeps batched CI logs small)
+QUIET = os.getenv("STATIC_MAS_QUIET", "").lower() in ("1", "true")
+
 
 def test_simple():
     """Run a simple test with one problem and one aggregation method."""
-    print("="*80)
+    print(_BAR)
     print("SIMPLE STATIC MAS TEST")
-    print("="*80)
+    print(_BAR)
     
     # Simple math problem
     problem = "What is 2 + 2?"
@@ -21,7 +31,7 @@ def test_simple():
     print(f"\nProblem: {problem}")
     print(f"Ground Truth: {ground_truth}")
     print("\nRunning Static MAS with majority_vote aggregation...")
-    print("-"*80)
+    print(_RULE)
     
     try:
         result = run_static_experiment(
@@ -31,25 +41,31 @@ def test_simple():
             enable_logging=True
         )
         
-        print("\n" + "="*80)
+        print("\n" + _BAR)
         print("RESULTS")
-        print("="*80)
+        print(_BAR)
         print(f"Final Answer: {result.get('final_answer', 'N/A')}")
         print(f"Ground Truth: {ground_truth}")
         print(f"Correct: {result.get('correct', False)}")
         print(f"Total Tokens: {result.get('total_tokens', 0)}")
         print(f"Execution Time: {result.get('execution_time', 0):.2f} seconds")
         print(f"Number of Agents: {len(result.get('agents', []))}")
-        print("="*80)
+        print(_BAR)
         
         return result
     except Exception as e:
         print(f"\nError: {e}")
-        import traceback
-        traceback.print_exc()
+        if not QUIET:
+            import traceback
+            traceback.print_exc()
         return None
 
 
 if __name__ == "__main__":
+    # The problem is fixed, so serve repeat runs from the disk cache
+    # (zero LLM traffic). Pass --no-cache to force fresh calls.
+    if "--no-cache" not in sys.argv:
+        os.environ.setdefault("MAS_CACHE_SAMPLED", "1")
+
     test_simple()
 
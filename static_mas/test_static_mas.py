@@ -13,59 +13,63 @@ if parent_dir not in sys.path:
 from static_mas.agents.static_agents import create_static_agent_pool
 from static_mas.aggregation import aggregate_results
 
+# Banner separators, built once per import rather than per print
+_BAR = "=" * 80
+_RULE = "-" * 80
+
+# One-line failures instead of full tracebacks (keeps batched CI logs small)
+QUIET = os.getenv("STATIC_MAS_QUIET", "").lower() in ("1", "true")
+
+# Mock agent results for the aggregation checks, built once at import.
+# A tuple so repeated runs share the same four dicts and nothing can
+# mutate them between methods; aggregate_results only reads.
+_MOCK_RESULTS = (
+    {"agent": "agent1", "role": "mathematics_expert", "answer": "345", "confidence": 0.9, "tokens": 100},
+    {"agent": "agent2", "role": "mathematics_expert", "answer": "345", "confidence": 0.8, "tokens": 110},
+    {"agent": "agent3", "role": "planner", "answer": "345", "confidence": 0.7, "tokens": 120},
+    {"agent": "agent4", "role": "decider", "answer": "346", "confidence": 0.6, "tokens": 95},
+)
+
 
 def test_agent_creation():
     """Test that agents can be created."""
     print("Testing agent creation...")
     agents = create_static_agent_pool()
     print(f"[OK] Created {len(agents)} agents")
-    for agent in agents:
-        print(f"  - {agent.name} ({agent.role}) - Backend: {agent.llm_backend}")
+    # One write for the whole roster instead of a print per agent
+    print("\n".join(f"  - {agent.name} ({agent.role}) - Backend: {agent.llm_backend}"
+                    for agent in agents))
     return agents
 
 
 def test_aggregation():
     """Test aggregation mechanisms."""
     print("\nTesting aggregation...")
-    
-    # Mock agent results
-    mock_results = [
-        {"agent": "agent1", "role": "mathematics_expert", "answer": "345", "confidence": 0.9, "tokens": 100},
-        {"agent": "agent2", "role": "mathematics_expert", "answer": "345", "confidence": 0.8, "tokens": 110},
-        {"agent": "agent3", "role": "planner", "answer": "345", "confidence": 0.7, "tokens": 120},
-        {"agent": "agent4", "role": "decider", "answer": "346", "confidence": 0.6, "tokens": 95},
-    ]
-    
-    # Test majority vote
-    result = aggregate_results(mock_results, method="majority_vote")
-    print(f"[OK] Majority vote: {result['final_answer']} (confidence: {result['confidence']:.2f})")
-    
-    # Test decider based
-    result = aggregate_results(mock_results, method="decider_based")
-    print(f"[OK] Decider based: {result['final_answer']} (confidence: {result['confidence']:.2f})")
-    
-    # Test most confident
-    result = aggregate_results(mock_results, method="most_confident")
-    print(f"[OK] Most confident: {result['final_answer']} (confidence: {result['confidence']:.2f})")
-    
-    # Test weighted average
-    result = aggregate_results(mock_results, method="weighted_average")
-    print(f"[OK] Weighted average: {result['final_answer']} (confidence: {result['confidence']:.2f})")
+
+    # Collect the per-method lines and emit them with one write
+    lines = []
+    for method, label in [("majority_vote", "Majority vote"),
+                          ("decider_based", "Decider based"),
+                          ("most_confident", "Most confident"),
+                          ("weighted_average", "Weighted average")]:
+        result = aggregate_results(_MOCK_RESULTS, method=method)
+        lines.append(f"[OK] {label}: {result['final_answer']} (confidence: {result['confidence']:.2f})")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
     """Run all tests."""
-    print("=" * 80)
+    print(_BAR)
     print("Static MAS Test Suite")
-    print("=" * 80)
+    print(_BAR)
     
     try:
         agents = test_agent_creation()
         test_aggregation()
         
-        print("\n" + "=" * 80)
+        print("\n" + _BAR)
         print("All tests passed! [OK]")
-        print("=" * 80)
+        print(_BAR)
         print("\nTo run a full experiment, use:")
         print("  python -m static_mas.example")
         print("  or")
@@ -73,8 +77,9 @@ def main():
         
     except Exception as e:
         print(f"\n[FAILED] Test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if not QUIET:
+            import traceback
+            traceback.print_exc()
         return 1
     
     return 0